@@ -2,12 +2,13 @@ from fastapi import Request, HTTPException, Depends, status # Import status for
 from fastapi.responses import JSONResponse # Import JSONResponse to return custom headers
 from starlette.middleware.base import BaseHTTPMiddleware,RequestResponseEndpoint
 import jwt
-from jose import jwk # Import jwk for handling JSON Web Keys
 import httpx # Import httpx for making HTTP requests (needed for JWKS)
 import time # For caching JWKS
 import os
 from dotenv import load_dotenv
 import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env') # Example if .env is one level up
 load_dotenv(dotenv_path=dotenv_path)
@@ -33,13 +34,25 @@ JWT_ALGORITHM = os.getenv("JWT_ALGORITHM","RS256") # Should match your Keycloak
 JWKS_CACHE = {}
 JWKS_LAST_FETCHED = 0
 JWKS_CACHE_TTL = 3600 # Cache for 1 hour (adjust as needed)
+# Tokens with an unknown kid trigger a refresh at most this often, so they can't flood Keycloak
+JWKS_MIN_REFRESH_INTERVAL = int(os.getenv("JWKS_MIN_REFRESH_INTERVAL", "30"))
 
-async def get_keycloak_public_keys():
+# Verification keys built from the JWKS, by Key ID (kid)
+SIGNING_KEYS: Dict[str, Any] = {}
+
+# Claims of recently verified tokens, so repeat requests skip signature verification.
+# Entries never outlive the token's own expiry.
+VERIFIED_TOKEN_TTL = int(os.getenv("VERIFIED_TOKEN_TTL", "60"))
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", "10000"))
+VERIFIED_TOKENS: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+async def get_keycloak_public_keys(force_refresh: bool = False):
     """
     Fetches and caches Keycloak's public keys (JWKS) for token signature verification.
+    Rebuilds the verification keys whenever new keys are fetched.
     """
-    global JWKS_CACHE, JWKS_LAST_FETCHED
-    if not JWKS_CACHE or (time.time() - JWKS_LAST_FETCHED) > JWKS_CACHE_TTL:
+    global JWKS_CACHE, JWKS_LAST_FETCHED, SIGNING_KEYS
+    if not JWKS_CACHE or (time.time() - JWKS_LAST_FETCHED) > JWKS_CACHE_TTL or force_refresh:
         print("Fetching new JWKS from Keycloak...")
         async with httpx.AsyncClient() as client:
             try:
@@ -47,6 +60,15 @@ async def get_keycloak_public_keys():
                 response.raise_for_status() # Raise an exception for bad status codes
                 JWKS_CACHE = response.json()
                 JWKS_LAST_FETCHED = time.time()
+                signing_keys = {}
+                for jwk_key in JWKS_CACHE.get("keys", []):
+                    if not jwk_key.get("kid") or jwk_key.get("use", "sig") != "sig":
+                        continue
+                    try:
+                        signing_keys[jwk_key["kid"]] = jwt.PyJWK(jwk_key).key
+                    except jwt.PyJWKError as e:
+                        print(f"Skipping unusable JWK {jwk_key['kid']}: {e}")
+                SIGNING_KEYS = signing_keys
                 print("Successfully fetched new JWKS.")
             except httpx.HTTPStatusError as e:
                 print(f"Error fetching JWKS: HTTP Status {e.response.status_code} - {e.response.text}")
@@ -62,6 +84,37 @@ async def get_keycloak_public_keys():
                 )
     return JWKS_CACHE
 
+async def get_signing_key(kid: str):
+    """
+    Returns the verification key for a Key ID, refreshing the JWKS when the kid is unknown (e.g. after key rotation).
+    """
+    await get_keycloak_public_keys()
+    key = SIGNING_KEYS.get(kid)
+    if key is None and (time.time() - JWKS_LAST_FETCHED) > JWKS_MIN_REFRESH_INTERVAL:
+        await get_keycloak_public_keys(force_refresh=True)
+        key = SIGNING_KEYS.get(kid)
+    return key
+
+def get_verified_claims(token: str) -> Optional[Dict[str, Any]]:
+    cached = VERIFIED_TOKENS.get(token)
+    if cached is None:
+        return None
+    claims, expires_at = cached
+    if time.time() >= expires_at:
+        del VERIFIED_TOKENS[token]
+        return None
+    # Keep recently used tokens at the end so eviction drops the least recently used first
+    VERIFIED_TOKENS.move_to_end(token)
+    return claims
+
+def cache_verified_claims(token: str, claims: Dict[str, Any]) -> None:
+    expires_at = time.time() + VERIFIED_TOKEN_TTL
+    if "exp" in claims:
+        expires_at = min(expires_at, float(claims["exp"]))
+    VERIFIED_TOKENS[token] = (claims, expires_at)
+    while len(VERIFIED_TOKENS) > VERIFIED_TOKEN_CACHE_SIZE:
+        VERIFIED_TOKENS.popitem(last=False)
+
 def format_keycloak_public_key(raw_key: str) -> str:
 
     key = raw_key.replace('-----BEGIN PUBLIC KEY-----', '')
@@ -106,49 +159,45 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 
         token = auth_header.split(" ")[1]
         try:
-            # 1. Fetch Keycloak Public Keys (JWKS)
-            # This replaces your static TOKEN_SECRET_KEY and format_keycloak_public_key
-            jwks = await get_keycloak_public_keys()
-            header = jwt.get_unverified_header(token)
-            kid = header.get("kid") # Key ID
+            # Tokens verified recently are accepted without repeating the signature check
+            payload = get_verified_claims(token)
+            if payload is None:
+                header = jwt.get_unverified_header(token)
+                kid = header.get("kid") # Key ID
 
-            if not kid:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Key ID (kid) missing from token header. Cannot verify signature.",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+                if not kid:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Key ID (kid) missing from token header. Cannot verify signature.",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
 
-            key = None
-            for jwk_key in jwks["keys"]:
-                if jwk_key["kid"] == kid:
-                    # Construct the public key from JWK format
-                    key = jwk.construct(jwk_key)
-                    break
+                # 1. Look up the verification key for the token's kid, built once per JWKS fetch
+                key = await get_signing_key(kid)
 
-            if not key:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Public key for token's Key ID (kid) not found in Keycloak's JWKS. Token might be invalid or issued by an unknown source.",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+                if not key:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Public key for token's Key ID (kid) not found in Keycloak's JWKS. Token might be invalid or issued by an unknown source.",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
 
-            # 2. Decode and Verify the Access Token
-            payload = jwt.decode(
-                token,
-                key.to_pem().decode('utf-8'),
-                algorithms=[JWT_ALGORITHM], # Use the algorithm from your config
-                audience=FASTAPI_CLIENT_ID, # Validate against your FastAPI client ID
-                issuer=KEYCLOAK_ISSUER_URL, # Validate against your Keycloak Realm's issuer URL
-                options={
-                    "verify_aud": True, # CRITICAL: Ensure Audience is verified
-                    "verify_exp": True, # Ensure Expiration is verified (already was True)
-                    "verify_iss": True, # CRITICAL: Ensure Issuer is verified
-                    "verify_sub": True
-                }
-            )
+                # 2. Decode and Verify the Access Token
+                payload = jwt.decode(
+                    token,
+                    key,
+                    algorithms=[JWT_ALGORITHM], # Use the algorithm from your config
+                    audience=FASTAPI_CLIENT_ID, # Validate against your FastAPI client ID
+                    issuer=KEYCLOAK_ISSUER_URL, # Validate against your Keycloak Realm's issuer URL
+                    options={
+                        "verify_aud": True, # CRITICAL: Ensure Audience is verified
+                        "verify_exp": True, # Ensure Expiration is verified (already was True)
+                        "verify_iss": True, # CRITICAL: Ensure Issuer is verified
+                        "verify_sub": True
+                    }
+                )
+                cache_verified_claims(token, payload)
             request.state.auth_user = payload
-            print("Authentication successful")
         except jwt.ExpiredSignatureError:
             # This is the primary signal for the frontend to use a refresh token.
             return JSONResponse(
@@ -1,17 +1,17 @@
-from fastapi import FastAPI, HTTPException, Depends, Query, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import sys
 import logging
 import os
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 
-from sqlalchemy import create_engine, text, func, cast, Date, distinct, case, or_
+from sqlalchemy import create_engine, text, func, cast, Date, distinct, case, or_, select
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 import uuid
 import json
 
@@ -44,6 +44,9 @@ from Backend.backend_services import(
     # get_profile_results_by_run_id,
     # get_profiling_runs_by_connection,
     get_profile_results_for_run_detail,
+    get_profiling_run_version,
+    get_profiling_history_version,
+    get_anomaly_results_version,
     get_profiling_runs_by_table_group,
     get_all_profiling_runs_service,
     get_latest_profiling_run_dashboard_data_service,
@@ -64,8 +67,10 @@ from Backend.backend_services import(
     read_test_suite,
     update_test_suite,
     run_test_suites,
+    get_job_status_service,
     list_table_group_service,
     display_test_results,
+    stream_test_results,
     get_anomaly_results,
     get_overall_data_quality_overview_service,
     get_data_quality_trend_service,
@@ -105,7 +110,7 @@ from Backend.models.models import (
     TestSuiteMetadata,
     TestSuiteResponse,
     TestResultDetail,
-    TestResultsWithConnection,
+    TestResultsPage,
     TestSuiteSummary,
     TableGroupUpdate,
     
@@ -134,14 +139,16 @@ from Backend.models.models import (
     )
 from Backend.Auth.auth import AuthenticationMiddleware, get_current_user
 from Backend.helpers.helper import get_latest_successful_run_id, get_time_filter, calculate_success_rate_change, format_duration_display
+from Backend.helpers.response_cache import cached_json_response
 from pydantic import BaseModel
 from typing import List, Dict, Any 
 from uuid import UUID
 
 
-from Backend.db.database import get_db, SessionLocal, TestDefinitionModel, TestTypeModel, TableGroupModel, TestSuiteModel, ProfileResultModel
+from Backend.db.database import get_db, get_async_db, SessionLocal, TestDefinitionModel, TestTypeModel, TableGroupModel, TestSuiteModel, ProfileResultModel
 from Backend.swagger import custom_openapi
 from sqlalchemy.orm import Session 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
@@ -217,7 +224,7 @@ def delete_table_group_route(connection_id: int, group_id: str, db: Session = De
 
 @app.post("/api/run-profiling", tags=["Profiling"])
 def trigger_profiling_route(request_data: TriggerProfilingRequest):
-    return trigger_profiling_service(conn_id=request_data.connection_id, group_id=request_data.table_group_id)
+    return trigger_profiling_service(conn_id=request_data.connection_id, group_id=str(request_data.table_group_id))
 
 
 #----------   Profiling Endpoints   ----------
@@ -230,12 +237,17 @@ def list_profiling_runs_for_group(conn_id: int, group_id: UUID, db: Session = De
     return get_profiling_runs_by_table_group(conn_id, group_id, db)
 
 @app.get("/api/connections/{conn_id}/table-groups/{group_id}/profiling-runs/{run_id}/profile-results", response_model=List[ProfileResultOut],tags=["Profliing"])
-def get_profile_results_detail_for_run(conn_id: int, group_id: UUID, run_id: UUID, db: Session = Depends(get_db)):
+def get_profile_results_detail_for_run(request: Request, conn_id: int, group_id: UUID, run_id: UUID, db: Session = Depends(get_db)):
     """
     Get a list of all profile results (details) for a specific profiling run,
     ensuring it belongs to the given table group and connection.
     """
-    return get_profile_results_for_run_detail(conn_id, group_id, run_id, db)
+    return cached_json_response(
+        request,
+        get_profiling_run_version(run_id, db),
+        lambda: get_profile_results_for_run_detail(conn_id, group_id, run_id, db),
+        List[ProfileResultOut],
+    )
 
 @app.get("/api/home", response_model=DashboardStats, tags=["Dashboard"])
 def get_all_profiling_runs(db: Session = Depends(get_db)):
@@ -310,12 +322,17 @@ def get_table_names_for_profiling_run(run_id: UUID, db: Session = Depends(get_db
 
 
 @app.get("/api/profiling-runs/{run_id}/tables/{table_name}/details", response_model=TableDetailsData, tags=["New Profiling Results"])
-def get_profiling_table_details(run_id: UUID, table_name: str, db: Session = Depends(get_db)):
+def get_profiling_table_details(request: Request, run_id: UUID, table_name: str, db: Session = Depends(get_db)):
     """
     Fetches detailed profiling results for a specific table within a given profiling run.
     Includes Column Data Types and Data Distribution.
     """
-    return get_table_profiling_details_service(run_id, table_name, db)
+    return cached_json_response(
+        request,
+        get_profiling_history_version(run_id, db),
+        lambda: get_table_profiling_details_service(run_id, table_name, db),
+        TableDetailsData,
+    )
 
 
 # ----------   Testing Endpoints   ----------
@@ -364,12 +381,31 @@ def delete_test_suite_endpoint(test_suite_id: str, db: Session = Depends(get_db)
     return delete_test_suite(test_suite_id, db)
 
 
-@app.get("/api/testsuites/{test_suite_id}/results", response_model=TestResultsWithConnection,tags=["Test Suites"])
-def get_test_suite_results_endpoint(test_suite_id: str, db: Session = Depends(get_db)):
+@app.get(
+    "/api/testsuites/{test_suite_id}/results",
+    response_model=TestResultsPage,
+    response_model_exclude_unset=True,
+    tags=["Test Suites"],
+)
+def get_test_suite_results_endpoint(
+    test_suite_id: str,
+    test_run_id: Optional[uuid.UUID] = Query(None, description="Only return results of this test run"),
+    result_status: Optional[str] = Query(None, description="Comma-separated result statuses, e.g. Failed,Warning"),
+    fields: Optional[str] = Query(None, description="Comma-separated result fields to return (default: all)"),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size (default: all results, unpaged)"),
+    cursor: Optional[int] = Query(None, description="next_cursor of the previous page"),
+    format: Literal["json", "ndjson"] = Query("json", description="ndjson streams one result per line"),
+    db: Session = Depends(get_db),
+):
     """
-    Fetch the results of a specific test suite.
+    Fetch the results of a specific test suite, newest first. Pass limit to fetch a page at a time.
     """
-    return display_test_results(test_suite_id, db)
+    if format == "ndjson":
+        return StreamingResponse(
+            stream_test_results(test_suite_id, test_run_id, result_status, fields, limit, cursor),
+            media_type="application/x-ndjson",
+        )
+    return display_test_results(test_suite_id, db, test_run_id, result_status, fields, limit, cursor)
 
 
 
@@ -381,45 +417,70 @@ def execution_test_suite(request_data: Test_Execution):
 
 # @app.get("/api/testsuite/execution/status/{execution_id}", tags=["Test Suites"])
 
+@app.get("/api/jobs/{job_id}", tags=["Jobs"])
+def get_job_status_route(job_id: str):
+    """
+    Status of a queued profiling or test job.
+    """
+    return get_job_status_service(job_id)
+
 # ------------ Anamoly endpoints ------------
 @app.get("/api/connections/table-groups/{table_group_id}/anomaly-results",response_model=Dict,tags=["Anomaly Results"])
-def get_anomaly_results_for_table_group(table_group_id: UUID,group_by_table: bool = Query(True),group_by_run: bool = Query(False),db: Session = Depends(get_db)):
-    return get_anomaly_results(table_group_id, group_by_table, group_by_run, db)
+def get_anomaly_results_for_table_group(
+    request: Request,
+    table_group_id: UUID,
+    group_by_table: bool = Query(True),
+    group_by_run: bool = Query(False),
+    latest_run_only: bool = Query(False, description="Only return anomalies of the latest completed run"),
+    start_date: Optional[datetime] = Query(None, description="Only return runs started on or after this time"),
+    end_date: Optional[datetime] = Query(None, description="Only return runs started on or before this time"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of anomalies to return"),
+    offset: int = Query(0, ge=0, description="Number of anomalies to skip"),
+    db: Session = Depends(get_db),
+):
+    return cached_json_response(
+        request,
+        get_anomaly_results_version(table_group_id, db),
+        lambda: get_anomaly_results(
+            table_group_id, group_by_table, group_by_run, db, latest_run_only, start_date, end_date, limit, offset
+        ),
+        Dict,
+    )
 
 
 
 #------------------- Test Dashboard Endpoints -------------------
 # @app.get("/api/v1/data-quality/overview",response_model=OverallDataQualityOverviewResponse,tags=["New Test Dashboard"])
-# async def get_overall_data_quality_overview(duration: str = Query("Last 30 days", description="Filter data by duration (e.g., 'Last 30 days', 'Last 7 days', 'Today')"),db: Session = Depends(get_db)):
+# async def get_overall_data_quality_overview(duration: str = Query("Last 30 days", description="Filter data by duration (e.g., 'Last 30 days', 'Last 7 days', 'Today')"),db: AsyncSession = Depends(get_async_db)):
 #     """
 #     Retrieves an overview of data quality metrics including overall score,
 #     test failures, records tested, and test status.
 #     """
-#     return get_overall_data_quality_overview_service(duration, db)
+#     return await db.run_sync(lambda session: get_overall_data_quality_overview_service(duration, session))
 
 
 @app.get("/api/v1/data-quality/overview",response_model=OverallDataQualityOverviewResponse,responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},tags=["New Test Dashboard"])
 async def get_overall_data_quality_overview(
     duration: str = Query("Last 30 days", description="Filter data by duration (e.g., 'Last 30 days', 'Last 7 days', 'Today')"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieves an overview of data quality metrics including overall score,
     test failures, records tested, and test status.
     """
-    return get_overall_data_quality_overview_service(duration, db)
+    return await db.run_sync(lambda session: get_overall_data_quality_overview_service(duration, session))
 
 
 @app.get("/api/v1/test-runs/recent",response_model=RecentTestRunsTableResponse,responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},tags=["New Test Dashboard"])
 async def get_recent_test_runs(
     limit: int = Query(5, description="Number of recent test runs to fetch"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieves a list of recent test runs, suitable for both summarized lists
     and detailed tables.
     """
-    return get_recent_test_runs_service(limit, db)
+    return await db.run_sync(lambda session: get_recent_test_runs_service(limit, session))
 
 
 #---------------------------------
@@ -431,41 +492,41 @@ async def get_recent_test_runs(
 async def get_data_quality_trend(
     duration: str = Query("Last 30 days", description="Defines the X-axis range (e.g., 'Last 30 days', 'Last 7 days', 'Today')"),
     metric: str = Query("dq_score", description="Metric for the trend chart (e.g., 'dq_score', 'test_failures_count')"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieves data quality trend data for charting.
     """
-    return get_data_quality_trend_service(duration, metric, db)
+    return await db.run_sync(lambda session: get_data_quality_trend_service(duration, metric, session))
 
 
 
 @app.get("/api/v1/data-sources",response_model=List[DataSource],tags=["New Test Dashboard"])
-async def get_data_sources(db: Session = Depends(get_db)):
+async def get_data_sources(db: AsyncSession = Depends(get_async_db)):
     """
     Retrieves a list of data sources with aggregated data quality scores.
     """
-    return get_data_sources_service(db)
+    return await db.run_sync(get_data_sources_service)
 
 ########################################################################################################################################################################
 #--------------------------The profile dashboard endpoints
 
 @app.get("/api/v1/overview_metrics", response_model=OverviewMetricsResponse, tags=["New Profile Dashboard"])
 async def get_overview_metrics(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     database_connection_id: Optional[int] = Query(None, description="Filter by database connection ID"),
     schema_table_group_uuid: Optional[uuid.UUID] = Query(None, description="Filter by table group (schema) UUID")
 ):
     """
     Retrieves aggregated key metrics for the data profiling dashboard overview.
     """
-    return get_overview_metrics_service(db, database_connection_id, schema_table_group_uuid)
+    return await db.run_sync(get_overview_metrics_service, database_connection_id, schema_table_group_uuid)
    
 
 
 @app.get("/api/v1/profile_run_trend", response_model=ProfileRunTrendResponse, tags=["New Profile Dashboard"])
 async def get_profile_run_trend(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     database_connection_id: Optional[int] = Query(None, description="Filter by database connection ID"),
     schema_table_group_uuid: Optional[uuid.UUID] = Query(None, description="Filter by table group (schema) UUID"),
     start_date: Optional[datetime] = Query(None, description="Start date for trend (YYYY-MM-DD)"),
@@ -476,14 +537,14 @@ async def get_profile_run_trend(
     """
     Provides historical data for the 'Profile Run Trend' chart.
     """
-    return get_profile_run_trend_service(
-            db, database_connection_id, schema_table_group_uuid, start_date, end_date, interval, metric
+    return await db.run_sync(
+            get_profile_run_trend_service, database_connection_id, schema_table_group_uuid, start_date, end_date, interval, metric
         )
     
 
 @app.get("/api/v1/recent_profile_runs", response_model=RecentProfileRunsResponse, tags=["New Profile Dashboard"])
 async def get_recent_profile_runs(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     database_connection_id: Optional[int] = Query(None, description="Filter by database connection ID"),
     schema_table_group_uuid: Optional[uuid.UUID] = Query(None, description="Filter by table group (schema) UUID"),
     limit: int = Query(10, ge=1, le=100, description="Number of runs to return"),
@@ -494,14 +555,14 @@ async def get_recent_profile_runs(
     """
     Retrieves a paginated list of recent profiling runs.
     """
-    return get_recent_profile_runs_service(
-            db, database_connection_id, schema_table_group_uuid, limit, offset, sort_by, sort_order
+    return await db.run_sync(
+            get_recent_profile_runs_service, database_connection_id, schema_table_group_uuid, limit, offset, sort_by, sort_order
         )
     
     
 @app.get("/api/v1/column_stats_distribution", response_model=ColumnStatsDistributionResponse, tags=["New Profile Dashboard"])
 async def get_column_stats_distribution(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     metric_type: ColumnMetricType = Query(..., description="Type of distribution metric"),
     database_connection_id: Optional[int] = Query(None, description="Filter by database connection ID"),
     schema_table_group_uuid: Optional[uuid.UUID] = Query(None, description="Filter by table group (schema) UUID"),
@@ -510,26 +571,26 @@ async def get_column_stats_distribution(
     """
     Provides data for column statistics distribution charts.
     """
-    return get_column_stats_distribution_service(
-            db, metric_type, database_connection_id, schema_table_group_uuid, bucket_size
+    return await db.run_sync(
+            get_column_stats_distribution_service, metric_type, database_connection_id, schema_table_group_uuid, bucket_size
         )
     
     
 @app.get("/api/v1/dropdown_options", response_model=List[DropdownOption], tags=["New Profile Dashboard"])
 async def get_dropdown_options(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     type: str = Query(..., description="Type of options: 'database' or 'table_group'"),
     database_connection_id: Optional[int] = Query(None, description="Filter schemas by database connection ID")
 ):
     """
     Retrieves options for the Database and Schema dropdowns.
     """
-    return get_dropdown_options_service(db, type, database_connection_id)
+    return await db.run_sync(get_dropdown_options_service, type, database_connection_id)
     
     
 @app.get("/api/v1/column_distinct_counts", response_model=ColumnDistinctCountsResponse, tags=["New Profile Dashboard"])
 async def get_column_distinct_counts(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     database_connection_id: Optional[int] = Query(None, description="Filter by database connection ID"),
     schema_table_group_uuid: Optional[uuid.UUID] = Query(None, description="Filter by table group (schema) UUID"),
     table_name: Optional[str] = Query(None, description="Filter by specific table name"),
@@ -538,52 +599,52 @@ async def get_column_distinct_counts(
     """
     Retrieves distinct value counts for columns based on the 'distinct_value_ct' field.
     """
-    return get_column_distinct_counts_service(
-            db, database_connection_id, schema_table_group_uuid, table_name, column_name
+    return await db.run_sync(
+            get_column_distinct_counts_service, database_connection_id, schema_table_group_uuid, table_name, column_name
         )
     
 @app.get("/test_runs/status_summary", response_model=Dict[str, int], summary="Get Test Run Status Summary for Main Pie Chart", tags=["Test Summary"])
-async def get_test_run_status_summary(db: Session = Depends(get_db)):
+async def get_test_run_status_summary(db: AsyncSession = Depends(get_async_db)):
     """
     Returns the aggregated `result_status` (e.g., "Passed", "Failed", "Warning")
     and their counts from the `test_results` table to populate the main pie chart.
     """
-    return get_test_run_status_summary_service(db)
+    return await db.run_sync(get_test_run_status_summary_service)
     
     
 @app.get("/test_results/test_type_summary", response_model=Dict[str, int], summary="Get Test Type Summary by Result Status for Second Pie Chart", tags=["Test Summary"])
 async def get_test_type_summary_by_status(
     result_status: str = Query(..., description="Result Status to filter test types (e.g., 'Passed', 'Failed', 'Warning')"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Returns the aggregated `test_type` and their counts from the `test_results` table,
     filtered by a specific `result_status`. This will populate the second pie chart.
     """
-    return get_test_type_summary_by_status_service(result_status, db)    
+    return await db.run_sync(lambda session: get_test_type_summary_by_status_service(result_status, session))    
 
 
 @app.get("/test_results/detailed", response_model=List[TestResultDetail], summary="Get Detailed Test Results", tags=["Test Summary"])
 async def get_detailed_test_results(
     result_status: str = Query(..., description="Result Status to filter detailed results (e.g., 'Passed', 'Failed', 'Warning')"),
     test_type: str = Query(..., description="Test Type to filter detailed results (e.g., 'Missing_Pct', 'Avg_Shift')"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Returns detailed `test_results` data, filtered by `result_status` and `test_type`.
     This will populate the table underneath.
     """
-    return get_detailed_test_results_service(result_status, test_type, db)
+    return await db.run_sync(lambda session: get_detailed_test_results_service(result_status, test_type, session))
     
     
 @app.get("/test_runs_summary_by_suite",response_model=TestSuiteSummary,summary="Get Test Run Counts by Test Suite", tags=["Test Summary"])
-async def get_test_runs_summary_by_suite(db: Session = Depends(get_db)):
+async def get_test_runs_summary_by_suite(db: AsyncSession = Depends(get_async_db)):
     """
     Returns aggregated counts of passed, failed, warning, and error tests
     for each distinct test suite, along with their percentages.
     """
     try:
-        return get_test_runs_summary_by_suite_service(db)
+        return await db.run_sync(get_test_runs_summary_by_suite_service)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -591,12 +652,12 @@ async def get_test_runs_summary_by_suite(db: Session = Depends(get_db)):
 
 
 @app.get("/test_runs_summary_by_suite",response_model=TestSuiteSummary,summary="Get Test Run Counts by Test Suite", tags=["Test Summary"])
-async def get_test_runs_summary_by_suite(db: Session = Depends(get_db)):
+async def get_test_runs_summary_by_suite(db: AsyncSession = Depends(get_async_db)):
     """
     Returns aggregated counts of passed, failed, warning, and error tests
     for each distinct test suite, along with their percentages.
     """
-    return get_test_runs_summary_by_suite_service(db)
+    return await db.run_sync(get_test_runs_summary_by_suite_service)
 
 
 
@@ -613,19 +674,21 @@ async def get_test_runs_summary_by_suite(db: Session = Depends(get_db)):
 )
 async def get_all_test_definitions_for_suite(
     test_suite_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieves all test definitions associated with a given test suite ID.
     """
     try:
-        test_suite = db.query(TestSuiteModel).filter(TestSuiteModel.id == test_suite_id).first()
+        test_suite = (await db.execute(
+            select(TestSuiteModel).where(TestSuiteModel.id == test_suite_id)
+        )).scalars().first()
         if not test_suite:
             raise HTTPException(status_code=404, detail="Test suite not found")
         
-        test_definitions = db.query(TestDefinitionModel).filter(
-            TestDefinitionModel.test_suite_id == test_suite_id
-        ).all()
+        test_definitions = (await db.execute(
+            select(TestDefinitionModel).where(TestDefinitionModel.test_suite_id == test_suite_id)
+        )).scalars().all()
         
         
         return TestSuiteDetailResponse(
@@ -644,7 +707,7 @@ async def get_all_test_definitions_for_suite(
     response_model=TestDefinition, # Using the enhanced TestDefinition model
     summary="Get a Single Test Definition (for Editing Form)"
 )
-async def get_test_definition_by_id(
+def get_test_definition_by_id(
     test_definition_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -711,7 +774,7 @@ async def get_test_definition_by_id(
 response_model=TestDefinition,
 summary="Update a Test Definition"
 )
-async def update_test_definition(
+def update_test_definition(
     test_definition_id: UUID,
     updates: TestDefinitionUpdate,
     db: Session = Depends(get_db)
@@ -751,7 +814,7 @@ async def update_test_definition(
     response_model=DetailedTestDefinition,
     summary="Get Detailed Test Definition Info (On Click)"
 )
-async def get_detailed_test_definition_info(
+def get_detailed_test_definition_info(
     test_definition_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -807,7 +870,7 @@ async def get_detailed_test_definition_info(
     response_model=ProfileResultOut,
     summary="Get Profile Results for a Test Definition's Column"
 )
-async def get_profile_results_for_test_definition(
+def get_profile_results_for_test_definition(
     test_definition_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -844,31 +907,31 @@ async def get_profile_results_for_test_definition(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred: {e}")
 
 @app.get("/get-tables-in-table-group", summary='Get list of tables in the table group')
-async def get_tables_in_table_group(table_groups_id: str, db: Session = Depends(get_db)) -> list:
+async def get_tables_in_table_group(table_groups_id: str, db: AsyncSession = Depends(get_async_db)) -> list:
     schema = 'tgapp'
     sql = f"""
     SELECT profiling_table_set
     FROM {schema}.table_groups
-    WHERE id = '{table_groups_id}'   
+    WHERE id = CAST(:table_groups_id AS UUID)
     """
-    result = db.execute(text(sql))
+    result = await db.execute(text(sql), {"table_groups_id": table_groups_id})
     table_names = result.fetchone().profiling_table_set
     table_names_list = [name.strip() for name in table_names.split(',')]
     return table_names_list
     
     
 @app.get("/get-column-names", summary="Get Column Names for a Table")
-async def get_column_names(table_groups_id: str, table_name: str, db: Session = Depends(get_db)) -> list:
+async def get_column_names(table_groups_id: str, table_name: str, db: AsyncSession = Depends(get_async_db)) -> list:
     schema = 'tgapp'
     sql = f"""
     SELECT column_name
     FROM {schema}.data_column_chars
-    WHERE table_groups_id = '{table_groups_id}'
-        AND table_name = '{table_name}'
+    WHERE table_groups_id = CAST(:table_groups_id AS UUID)
+        AND table_name = :table_name
         AND drop_date IS NULL
     ORDER BY column_name
     """
-    result = db.execute(text(sql))
+    result = await db.execute(text(sql), {"table_groups_id": table_groups_id, "table_name": table_name})
 
     # Fetch all results and then extract column_name
     column_names = [row.column_name for row in result.all()]
@@ -883,7 +946,7 @@ async def get_column_names(table_groups_id: str, table_name: str, db: Session =
     status_code=status.HTTP_201_CREATED,
     summary="Create a New Test Definition"
 )
-async def create_test_definition(
+def create_test_definition(
     test_definition_data: TestDefinitionCreate,
     db: Session = Depends(get_db)
 ):
@@ -1038,7 +1101,7 @@ async def create_test_definition(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a Test Definition"
 )
-async def delete_test_definition(
+def delete_test_definition(
     test_definition_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -1071,7 +1134,7 @@ async def delete_test_definition(
     response_model=List[TestType],
     summary="Get Available Test Types"
 )
-async def get_available_test_types(
+def get_available_test_types(
     db: Session = Depends(get_db),
     # Optional filters for test_scope, matching UI checkboxes
     show_referential: bool = Query(True, alias="scope_referential", description="Include Referential test types"),
@@ -1139,7 +1202,7 @@ async def get_available_test_types(
     response_model=TestTypeFormDefinition,
     summary="Get Dynamic Form Fields for a Specific Test Type"
 )
-async def get_test_type_form_fields(
+def get_test_type_form_fields(
     test_type_id: str,
     db: Session = Depends(get_db)
 ):
@@ -1,9 +1,11 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterator, Optional, Union
 import collections
+import itertools
+import threading
 from uuid import uuid4, UUID
 import base64
 from sqlalchemy import create_engine, desc, func, distinct, case, exists, and_
-from sqlalchemy import create_engine, text, func, cast, Date, distinct, case
+from sqlalchemy import create_engine, text, func, cast, Date, distinct, case, Float, String
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timedelta
@@ -45,7 +47,6 @@ from Backend.models.models import (
     AnomalyGroupedByTable,
     AnomalyUngrouped,
     AnomalyResultOut,
-    TestResultWithDetails,
     ScheduledProfilingJobResponse,
     
     
@@ -66,7 +67,9 @@ from Backend.models.models import (
     TestResultDetail,
     TestSuiteCounts,
     TestSuiteSummary,
-    TestResultsWithConnection,DailyTrendDataPoint
+    DailyTrendDataPoint,
+    TestResultsPage,
+    TestResultFields,
     
     
     
@@ -75,11 +78,17 @@ from Backend.models.models import (
 )
 from Backend.helpers.helper import get_latest_successful_run_id, get_time_filter, calculate_success_rate_change, format_duration_display,format_large_number
 from Backend.db.database import TableGroupModel, Connection, ProfileResultModel, ProfilingRunModel, ScheduledProfilingJob, TestSuiteModel, TestResultModel, AnomalyResultModel,ProfileAnomalyTypeModel, TestRunModel, TestTypeModel
+from Backend.db.database import SessionLocal as PooledSessionLocal
+from Backend.db.database import DashboardProfilingRollupModel, DashboardProfilingTableModel, DashboardProfilingColumnModel, DashboardTestRollupModel
 from testgen.common.encrypt import EncryptText, DecryptText
 from testgen.commands.queries.profiling_query import CProfilingSQL
 import testgen.commands.run_profiling_bridge as rpb
 import testgen.commands.run_generate_tests as rgt
 import testgen.commands.run_execute_tests as ret
+import testgen.commands.run_job_worker as rjw
+from testgen.commands.run_rollup_scores import run_refresh_dashboard_test_rollup, run_refresh_scoring_tables
+from testgen import settings
+from testgen.common.database.database_service import empty_cache
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from apscheduler.triggers.cron import CronTrigger
@@ -258,6 +267,8 @@ def update_connection_service(conn_id: int, conn_data: DBConnectionUpdate, db: S
  
         db.commit()
         db.refresh(conn)
+        # Runs pick up the new settings on their next connection
+        empty_cache(conn_id)
         
         return DBConnectionOut.from_orm(conn)
     except Exception as e:
@@ -275,6 +286,7 @@ def delete_connection_service(conn_id: int, db: Session = next(get_db())):
             raise HTTPException(status_code=404, detail="Connection not found")
         db.delete(conn)
         db.commit()
+        empty_cache(conn_id)
         return {"message": "Connection deleted successfully"}
     except Exception as e:
         db.rollback()
@@ -546,6 +558,8 @@ def update_table_group_service(conn_id: int, group_id: str, table_group_data: Ta
 
         db.commit()
         db.refresh(db_group)
+        # Scorecards read the table group's name and attributes from the scoring tables
+        run_refresh_scoring_tables(group_id)
 
         # Prepare the response object (TableGroupOut) with correct data types
         # This section should remain consistent with what TableGroupOut expects.
@@ -600,6 +614,8 @@ def delete_table_group_service(conn_id: int, group_id: str, db: Session = next(g
             raise HTTPException(status_code=404, detail="Table group not found")
         db.delete(group)
         db.commit()
+        # With the table group gone, the refresh leaves no scoring rows for it
+        run_refresh_scoring_tables(group_id)
         return {"message": "Table group deleted successfully"}
     except Exception as e:
         db.rollback()
@@ -611,6 +627,9 @@ def delete_table_group_service(conn_id: int, group_id: str, db: Session = next(g
 # Triggers a background profiling job using the TableGroup UUID (str)
 def trigger_profiling_service(conn_id: int, group_id: str):
     try:
+        if settings.JOB_QUEUE_ENABLED:
+            job_id = rjw.enqueue_profiling_job(group_id)
+            return {"status": "queued", "job_id": job_id, "message": "Profiling job queued"}
         rpb.run_profiling_in_background(group_id)
         return {"status": "started", "message": "Profiling job launched in background"}
     except Exception as e:
@@ -648,6 +667,52 @@ def get_profiling_runs_by_table_group(conn_id: int, group_id: int, db: Session):
         LOG.error(f"Error fetching profiling runs for connection {conn_id}, group {group_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error while fetching profiling runs.")
 
+def get_profiling_run_version(run_id: UUID, db: Session) -> Optional[str]:
+    """
+    Version of a profiling run's results for response caching, or None while the run can still change.
+    The score changes when anomaly dispositions are updated and the run is re-scored.
+    """
+    run = db.query(
+        ProfilingRunModel.status, ProfilingRunModel.profiling_endtime, ProfilingRunModel.dq_score_profiling
+    ).filter(ProfilingRunModel.id == run_id).first()
+    if not run or run.status != 'Complete':
+        return None
+    return f"{run.profiling_endtime}|{run.dq_score_profiling}"
+
+
+def get_profiling_history_version(run_id: UUID, db: Session) -> Optional[str]:
+    """
+    Version of a profiling run's results together with the score history of its table group's runs.
+    """
+    run_version = get_profiling_run_version(run_id, db)
+    if run_version is None:
+        return None
+    run_table_group = db.query(ProfilingRunModel.table_groups_id).filter(ProfilingRunModel.id == run_id).scalar_subquery()
+    history = db.query(
+        func.count(ProfilingRunModel.id),
+        func.max(ProfilingRunModel.profiling_starttime),
+        func.sum(ProfilingRunModel.dq_score_profiling),
+    ).filter(ProfilingRunModel.table_groups_id == run_table_group).one()
+    return f"{run_version}|{history[0]}|{history[1]}|{history[2]}"
+
+
+def get_anomaly_results_version(table_group_id: UUID, db: Session) -> str:
+    """
+    Version of a table group's anomaly results: its complete runs and when dispositions were last changed.
+    """
+    runs = db.query(
+        func.count(ProfilingRunModel.id),
+        func.max(ProfilingRunModel.profiling_endtime),
+    ).filter(
+        ProfilingRunModel.table_groups_id == table_group_id,
+        ProfilingRunModel.status == 'Complete',
+    ).one()
+    last_disposition_update = db.query(TableGroupModel.last_disposition_update).filter(
+        TableGroupModel.id == table_group_id
+    ).scalar()
+    return f"{runs[0]}|{runs[1]}|{last_disposition_update}"
+
+
 def get_profile_results_for_run_detail(conn_id: int, group_id: int, run_id: UUID, db: Session):
     """
     Retrieves all profile results for a specific profiling run, ensuring it belongs
@@ -936,23 +1001,32 @@ def reactivate_schedule_service(scheduled_job_id: str, db: Session) -> Dict[str,
 
 # --- Service for Dashboard Overview and Recent Runs ---
 def get_dashboard_overview_data_service(db: Session) -> DashboardData:
+    # Reads only the dashboard rollups refreshed at the end of each profiling run
     try:
-        total_tables_query = db.query(distinct(ProfileResultModel.table_name)).count()
-        total_columns_query = db.query(distinct(ProfileResultModel.column_name)).count()
+        total_tables_query = db.query(func.count(distinct(DashboardProfilingTableModel.table_name))).scalar() or 0
+        total_columns_query = db.query(func.count(distinct(DashboardProfilingColumnModel.column_name))).scalar() or 0
 
         max_record_ct_per_table = (
-            db.query(func.max(ProfileResultModel.record_ct).label('max_rows'))
-            .group_by(ProfileResultModel.table_name)
+            db.query(func.max(DashboardProfilingTableModel.max_record_ct).label('max_rows'))
+            .group_by(DashboardProfilingTableModel.table_name)
             .subquery()
         )
-        total_row_count_agg = db.query(func.sum(max_record_ct_per_table.c.max_rows)).scalar() or 0
-        total_missing_values_agg = db.query(func.sum(ProfileResultModel.null_value_ct)).scalar() or 0
-        avg_dq_score_profiling = db.query(func.avg(ProfilingRunModel.dq_score_profiling)).filter(
-            ProfilingRunModel.dq_score_profiling.isnot(None)
-        ).scalar() or 0.0
-
-        total_distinct_values_agg = db.query(func.sum(ProfileResultModel.distinct_value_ct)).scalar() or 0
-        total_records_sum = db.query(func.sum(ProfileResultModel.record_ct)).scalar() or 0
+        total_row_count_agg = int(db.query(func.sum(max_record_ct_per_table.c.max_rows)).scalar() or 0)
+
+        rollup = db.query(
+            func.sum(DashboardProfilingRollupModel.scored_run_ct).label("scored_run_ct"),
+            func.sum(DashboardProfilingRollupModel.dq_score_profiling_sum).label("dq_score_profiling_sum"),
+            func.sum(DashboardProfilingRollupModel.record_ct_sum).label("record_ct_sum"),
+            func.sum(DashboardProfilingRollupModel.null_value_ct_sum).label("null_value_ct_sum"),
+            func.sum(DashboardProfilingRollupModel.distinct_value_ct_sum).label("distinct_value_ct_sum"),
+        ).one()
+
+        total_missing_values_agg = int(rollup.null_value_ct_sum or 0)
+        avg_dq_score_profiling = (
+            rollup.dq_score_profiling_sum / rollup.scored_run_ct if rollup.scored_run_ct else 0.0
+        )
+        total_distinct_values_agg = int(rollup.distinct_value_ct_sum or 0)
+        total_records_sum = int(rollup.record_ct_sum or 0)
 
         distinct_values_percentage = (
             (total_distinct_values_agg / total_records_sum) * 100 if total_records_sum > 0 else 0
@@ -1068,7 +1142,10 @@ def get_table_profiling_details_service(run_id: UUID, table_name: str, db: Sessi
                 ProfilingRunModel.dq_score_profiling
             )
             .join(ProfileResultModel, ProfilingRunModel.id == ProfileResultModel.profile_run_id)
-            .filter(ProfileResultModel.table_name == table_name)
+            .filter(
+                ProfilingRunModel.table_groups_id == profiling_run.table_groups_id,
+                ProfileResultModel.table_name == table_name,
+            )
             .group_by(
                 ProfilingRunModel.id,
                 ProfilingRunModel.profiling_starttime,
@@ -1228,12 +1305,18 @@ def update_test_suite(test_suite_id: UUID, update_data: TestSuiteMetadata, db: S
     test_suite = db.query(TestSuiteModel).filter(TestSuiteModel.id == test_suite_id).first()
     if not test_suite:
         raise HTTPException(status_code=404, detail="Test suite not found")
+    previous_group_id = test_suite.table_groups_id
 
     for field, value in update_data.dict(exclude_unset=True).items():
         setattr(test_suite, field, value)
 
     db.commit()
     db.refresh(test_suite)
+    # A suite moved to another table group leaves both groups' scoring rows out of date
+    for group_id in {previous_group_id, test_suite.table_groups_id} - {None}:
+        run_refresh_scoring_tables(group_id)
+    # Dashboard rollup rows are kept by table group and connection
+    run_refresh_dashboard_test_rollup(test_suite_id)
     return {"status": "success", "message": "Test suite metadata updated"}
 
 
@@ -1242,107 +1325,256 @@ def delete_test_suite(test_suite_id: str, db: Session = Depends(get_db)):
     test_suite = db.query(TestSuiteModel).filter(TestSuiteModel.id == test_suite_id).first()
     if not test_suite:
         raise HTTPException(status_code=404, detail="Test suite not found")
+    group_id = test_suite.table_groups_id
 
     db.delete(test_suite)
     db.commit()
+    # With the suite gone, the refresh leaves no scoring rows for it
+    if group_id:
+        run_refresh_scoring_tables(group_id)
+    # Rebuilding the suite's dashboard rollup without the suite removes its rows
+    run_refresh_dashboard_test_rollup(test_suite_id)
     return {"status": "deleted", "message": f"Test suite {test_suite_id} deleted"}
 
 
 def run_test_suites(project_code: str, test_suite: str, minutes_offset: int=0):
     try:
+        if settings.JOB_QUEUE_ENABLED:
+            job_id = rjw.enqueue_test_job(project_code, test_suite)
+            return {"status": "queued", "job_id": job_id, "message": "Test execution queued"}
         ret.run_execution_steps(project_code, test_suite, minutes_offset=0, spinner=None)
         return {"status": "started", "message": "Execution test in background"}
     except Exception as e:
         LOG.error(f"Error executing tests for group {project_code}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
    
-def display_test_results(test_suite_id: str, db: Session) -> TestResultsWithConnection:
+def get_job_status_service(job_id: str):
+    try:
+        UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job ID")
+    try:
+        job = rjw.get_job(job_id)
+    except Exception as e:
+        LOG.error(f"Error fetching job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+TEST_RESULTS_STREAM_BATCH_SIZE = 500
+
+# Fields a test results request can project, by the name they are returned under
+TEST_RESULT_FIELDS = {
+    column.key: column
+    for column in (
+        TestResultModel.id,
+        TestResultModel.result_id,
+        TestResultModel.test_type,
+        TestResultModel.test_suite_id,
+        TestResultModel.test_definition_id,
+        TestResultModel.auto_gen,
+        TestResultModel.test_time,
+        TestResultModel.starttime,
+        TestResultModel.endtime,
+        TestResultModel.schema_name,
+        TestResultModel.table_name,
+        TestResultModel.column_names,
+        TestResultModel.skip_errors,
+        TestResultModel.input_parameters,
+        TestResultModel.result_code,
+        TestResultModel.severity,
+        TestResultModel.result_status,
+        TestResultModel.result_message,
+        TestResultModel.result_measure,
+        TestResultModel.threshold_value,
+        TestResultModel.result_error_data,
+        TestResultModel.test_action,
+        TestResultModel.disposition,
+        TestResultModel.subset_condition,
+        TestResultModel.result_query,
+        TestResultModel.test_description,
+        TestResultModel.test_run_id,
+        TestResultModel.table_groups_id,
+        TestResultModel.dq_prevalence,
+        TestResultModel.dq_record_ct,
+        TestResultModel.observability_status,
+    )
+}
+TEST_TYPE_FIELDS = {
+    "test_name_short": TestTypeModel.test_name_short,
+    "test_name_long": TestTypeModel.test_name_long,
+    "test_type_description": TestTypeModel.test_description,
+}
+
+
+def _get_test_results_query(
+    db: Session,
+    test_suite_id: str,
+    test_run_id: Optional[UUID],
+    result_status: Optional[str],
+    fields: Optional[str],
+    cursor: Optional[int],
+):
+    if fields:
+        field_names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown_fields = [name for name in field_names if name not in TEST_RESULT_FIELDS and name not in TEST_TYPE_FIELDS]
+        if unknown_fields:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown_fields)}")
+        # The cursor comes from result_id, so it is always selected
+        if "result_id" not in field_names:
+            field_names.insert(0, "result_id")
+    else:
+        field_names = [*TEST_RESULT_FIELDS, *TEST_TYPE_FIELDS]
+
+    query = db.query(
+        *[(TEST_RESULT_FIELDS.get(name) or TEST_TYPE_FIELDS[name]).label(name) for name in field_names]
+    ).filter(TestResultModel.test_suite_id == test_suite_id)
+
+    if any(name in TEST_TYPE_FIELDS for name in field_names):
+        query = query.join(TestTypeModel, TestResultModel.test_type == TestTypeModel.test_type)
+    if test_run_id:
+        query = query.filter(TestResultModel.test_run_id == test_run_id)
+    if result_status:
+        query = query.filter(TestResultModel.result_status.in_([status.strip() for status in result_status.split(",")]))
+    if cursor is not None:
+        query = query.filter(TestResultModel.result_id < cursor)
+
+    return query.order_by(TestResultModel.result_id.desc())
+
+
+def _get_suite_connection(db: Session, test_suite_id: str):
+    suite_connection = (
+        db.query(Connection.connection_name, Connection.sql_flavor.label("db_type"))
+        .select_from(TestSuiteModel)
+        .join(TableGroupModel, TestSuiteModel.table_groups_id == TableGroupModel.id)
+        .join(Connection, TableGroupModel.connection_id == Connection.connection_id)
+        .filter(TestSuiteModel.id == test_suite_id)
+        .first()
+    )
+    if not suite_connection:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    return suite_connection
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def display_test_results(
+    test_suite_id: str,
+    db: Session,
+    test_run_id: Optional[UUID] = None,
+    result_status: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
+) -> TestResultsPage:
     """
-    Service function to fetch detailed test results for a given test suite ID,
-    including enriched information from the test_types table, connection name, and db type.
+    Service function to fetch test results for a given test suite ID, newest first,
+    with the connection name and db type of the suite. All results are returned unless
+    a page size is given. Only the requested fields are selected; the test_types table
+    is joined only for its fields.
     """
     try:
-        results = (
-            db.query(
-                TestResultModel,
-                TestTypeModel,
-                Connection.connection_name, # Select connection name
-                Connection.sql_flavor.label("db_type") # Select sql_flavor as db_type
-            )
-            .join(TestTypeModel, TestResultModel.test_type == TestTypeModel.test_type)
-            .join(TestSuiteModel, TestResultModel.test_suite_id == TestSuiteModel.id) # Join TestSuiteModel
-            .join(TableGroupModel, TestSuiteModel.table_groups_id == TableGroupModel.id) # Join TableGroupModel
-            .join(Connection, TableGroupModel.connection_id == Connection.connection_id) # Join ConnectionModel
-            .filter(TestResultModel.test_suite_id == test_suite_id)
-            .all()
-        )
+        suite_connection = _get_suite_connection(db, test_suite_id)
 
-        detailed_results = []
-        for test_result, test_type_details, connection_name, db_type in results:
-            detailed_results.append(
-                TestResultWithDetails(
-                    id=test_result.id,
-                    result_id=test_result.result_id,
-                    test_type=test_result.test_type,
-                    test_suite_id=test_result.test_suite_id,
-                    test_definition_id=test_result.test_definition_id,
-                    auto_gen=test_result.auto_gen,
-                    test_time=test_result.test_time,
-                    starttime=test_result.starttime,
-                    endtime=test_result.endtime,
-                    schema_name=test_result.schema_name,
-                    table_name=test_result.table_name,
-                    column_names=test_result.column_names,
-                    skip_errors=test_result.skip_errors,
-                    input_parameters=test_result.input_parameters,
-                    result_code=test_result.result_code,
-                    severity=test_result.severity,
-                    result_status=test_result.result_status,
-                    result_message=test_result.result_message,
-                    result_measure=test_result.result_measure,
-                    threshold_value=test_result.threshold_value,
-                    result_error_data=test_result.result_error_data,
-                    test_action=test_result.test_action,
-                    disposition=test_result.disposition,
-                    subset_condition=test_result.subset_condition,
-                    result_query=test_result.result_query,
-                    test_description=test_result.test_description,
-                    test_run_id=test_result.test_run_id,
-                    table_groups_id=test_result.table_groups_id,
-                    dq_prevalence=test_result.dq_prevalence,
-                    dq_record_ct=test_result.dq_record_ct,
-                    observability_status=test_result.observability_status,
-                    # Fields from TestTypeModel
-                    test_name_short=test_type_details.test_name_short,
-                    test_name_long=test_type_details.test_name_long,
-                    test_type_description=test_type_details.test_description,
-                )
-                
-                
-            )
-        return TestResultsWithConnection(
-            connection_name=connection_name,
-            db_type=db_type,
-            results=detailed_results
+        query = _get_test_results_query(db, test_suite_id, test_run_id, result_status, fields, cursor)
+        rows = query.limit(limit + 1).all() if limit else query.all()
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].result_id
+
+        return TestResultsPage(
+            connection_name=suite_connection.connection_name,
+            db_type=suite_connection.db_type,
+            results=[TestResultFields(**row._mapping) for row in rows],
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
+
+def stream_test_results(
+    test_suite_id: str,
+    test_run_id: Optional[UUID] = None,
+    result_status: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Streams a test suite's results, newest first, as one JSON object per line.
+    Rows are fetched through a server-side cursor, so memory use doesn't grow with the result count.
+    """
+    db = PooledSessionLocal()
+    try:
+        _get_suite_connection(db, test_suite_id)
+        query = _get_test_results_query(db, test_suite_id, test_run_id, result_status, fields, cursor)
+    except Exception:
+        db.close()
+        raise
+    if limit:
+        query = query.limit(limit)
+
+    # The stream outlives the request's session, so it holds its own
+    def generate_lines() -> Iterator[str]:
+        try:
+            for row in query.execution_options(stream_results=True).yield_per(TEST_RESULTS_STREAM_BATCH_SIZE):
+                yield json.dumps(dict(row._mapping), default=_json_default) + "\n"
+        finally:
+            db.close()
+
+    return generate_lines()
+
     
 #------------------- Anomaly results -------------------
 
+ANOMALY_RESULT_FIELDS = [
+    AnomalyResultModel.id,
+    AnomalyResultModel.table_groups_id,
+    AnomalyResultModel.profile_run_id,
+    AnomalyResultModel.table_name,
+    AnomalyResultModel.column_name,
+    cast(AnomalyResultModel.anomaly_id, String).label("anomaly_id"),
+    ProfileAnomalyTypeModel.anomaly_name,
+    ProfileAnomalyTypeModel.anomaly_description,
+    ProfileAnomalyTypeModel.issue_likelihood,
+    ProfileAnomalyTypeModel.suggested_action,
+    ProfileAnomalyTypeModel.dq_dimension,
+    AnomalyResultModel.detail,
+    AnomalyResultModel.dq_prevalence,
+    ProfilingRunModel.profiling_starttime,
+]
+
+
 def get_anomaly_results(
     table_group_id: UUID,
     group_by_table: bool,
     group_by_run: bool,
-    db: Session
+    db: Session,
+    latest_run_only: bool = False,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> Union[AnomalyGroupedByRun, AnomalyGroupedByTable, AnomalyUngrouped]:
     """
     Retrieves anomaly results for a specific table group, allowing grouping by
     table or by profile run time. Anomaly details are enriched using anomaly types.
     The profiling run time is included directly in the AnomalyResultOut Pydantic model.
+
+    Results can be limited to the latest completed run or to runs started within a date window,
+    and paged with limit/offset. Rows come back from the database already enriched and in group
+    order, so a page is grouped in a single pass.
     """
     try:
         # 1. Fetch the Table Group details
@@ -1352,77 +1584,86 @@ def get_anomaly_results(
         if not table_group:
             raise HTTPException(status_code=404, detail="Table Group not found")
 
-        # 2. Fetch Anomaly Results joined with Profiling Runs
-        # We query both AnomalyResultModel and ProfilingRunModel to get the profiling_starttime.
-        # Filtering for 'Completed' status as requested.
-        anomaly_results_query = db.query(AnomalyResultModel, ProfilingRunModel).join(
-            ProfilingRunModel,
-            AnomalyResultModel.profile_run_id == ProfilingRunModel.id
-        ).filter(
-            AnomalyResultModel.table_groups_id == table_group_id,
-            ProfilingRunModel.status == 'Complete' # Filter for successfully completed runs
-        )
-        anomaly_results_with_runs = anomaly_results_query.all()
+        # 2. Anomaly results of completed runs, joined to their anomaly types
+        # AnomalyResultModel.anomaly_id is Integer, ProfileAnomalyTypeModel.id is String
+        run_filters = [
+            ProfilingRunModel.table_groups_id == table_group_id,
+            ProfilingRunModel.status == 'Complete',
+        ]
+        if start_date:
+            run_filters.append(ProfilingRunModel.profiling_starttime >= start_date)
+        if end_date:
+            run_filters.append(ProfilingRunModel.profiling_starttime <= end_date)
+        if latest_run_only:
+            latest_run_id = db.query(ProfilingRunModel.id).filter(*run_filters)\
+                .order_by(ProfilingRunModel.profiling_starttime.desc()).limit(1).scalar_subquery()
+            run_filters.append(ProfilingRunModel.id == latest_run_id)
 
-        if not anomaly_results_with_runs:
-            raise HTTPException(status_code=404, detail="No completed anomaly results found for this table group.")
+        query = db.query(*ANOMALY_RESULT_FIELDS, func.count().over().label("total_count"))\
+            .join(ProfilingRunModel, AnomalyResultModel.profile_run_id == ProfilingRunModel.id)\
+            .outerjoin(ProfileAnomalyTypeModel, ProfileAnomalyTypeModel.id == cast(AnomalyResultModel.anomaly_id, String))\
+            .filter(AnomalyResultModel.table_groups_id == table_group_id, *run_filters)
 
-        # 3. Fetch all anomaly types into a dictionary for quick lookup
-        # Ensure type matching for anomaly_id (AnomalyResultModel.anomaly_id is Integer, ProfileAnomalyTypeModel.id is String)
-        anomaly_types_map: Dict[str, ProfileAnomalyTypeModel] = {
-            str(at.id): at for at in db.query(ProfileAnomalyTypeModel).all()
-        }
+        if group_by_run:
+            order_by = [ProfilingRunModel.profiling_starttime.desc(), AnomalyResultModel.table_name]
+        elif group_by_table:
+            order_by = [AnomalyResultModel.table_name, ProfilingRunModel.profiling_starttime.desc()]
+        else:
+            order_by = [ProfilingRunModel.profiling_starttime.desc(), AnomalyResultModel.table_name]
+        query = query.order_by(*order_by, AnomalyResultModel.column_name, AnomalyResultModel.id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = query.all()
+        if rows:
+            total_count = rows[0].total_count
+        elif offset > 0:
+            # Past the last page, so no row carries the total
+            total_count = query.limit(None).offset(None).order_by(None)\
+                .with_entities(AnomalyResultModel.id).count()
+        else:
+            total_count = 0
 
-        table_group_out = TableGroupOut.from_orm(table_group)
+        if not total_count:
+            raise HTTPException(status_code=404, detail="No completed anomaly results found for this table group.")
 
-        # 4. Process raw anomaly results into AnomalyResultOut objects
-        processed_anomaly_results: List[AnomalyResultOut] = []
-        for anomaly_result_model, profiling_run_model in anomaly_results_with_runs:
-            # Create AnomalyResultOut, manually populating profiling_starttime
-            anomaly_out_data = anomaly_result_model.__dict__.copy() # Get dict from SQLAlchemy model
-            anomaly_out_data['profiling_starttime'] = profiling_run_model.profiling_starttime
-            anomaly_out = AnomalyResultOut(**anomaly_out_data) # Create Pydantic model from dict
-
-            # Enrich with anomaly type details
-            # Ensure type matching for anomaly_id (AnomalyResultModel.anomaly_id is Integer, ProfileAnomalyTypeModel.id is String)
-            anomaly_type_detail = anomaly_types_map.get(str(anomaly_result_model.anomaly_id))
-
-            if anomaly_type_detail:
-                anomaly_out.anomaly_name = anomaly_type_detail.anomaly_name
-                anomaly_out.anomaly_description = anomaly_type_detail.anomaly_description
-                anomaly_out.issue_likelihood = anomaly_type_detail.issue_likelihood
-                anomaly_out.suggested_action = anomaly_type_detail.suggested_action
-                anomaly_out.dq_dimension = anomaly_type_detail.dq_dimension
-            
-            processed_anomaly_results.append(anomaly_out)
+        table_group_out = TableGroupOut.from_orm(table_group)
+        anomaly_results = [
+            AnomalyResultOut(**{key: value for key, value in row._mapping.items() if key != "total_count"})
+            for row in rows
+        ]
 
-        # 5. Apply Grouping Logic
+        # 3. Apply Grouping Logic; the rows are ordered by their group keys
         if group_by_run:
-            grouped = collections.defaultdict(lambda: collections.defaultdict(list))
-            for result_out in processed_anomaly_results:
-                # Use profiling_starttime directly from the AnomalyResultOut object
-                run_time_key = result_out.profiling_starttime.isoformat()
-                grouped[run_time_key][result_out.table_name].append(
-                    result_out
-                )
             return AnomalyGroupedByRun(
                 table_group=table_group_out,
-                anomaly_results_by_run={run_id: dict(tables) for run_id, tables in grouped.items()}
+                anomaly_results_by_run={
+                    run_time.isoformat(): {
+                        table_name: list(table_results)
+                        for table_name, table_results in itertools.groupby(run_results, key=lambda result: result.table_name)
+                    }
+                    for run_time, run_results in itertools.groupby(anomaly_results, key=lambda result: result.profiling_starttime)
+                },
+                total_count=total_count,
             )
-        
+
         if group_by_table:
-            grouped = collections.defaultdict(list)
-            for result_out in processed_anomaly_results:
-                grouped[result_out.table_name].append(result_out)
             return AnomalyGroupedByTable(
                 table_group=table_group_out,
-                anomaly_results_by_table=dict(grouped)
+                anomaly_results_by_table={
+                    table_name: list(table_results)
+                    for table_name, table_results in itertools.groupby(anomaly_results, key=lambda result: result.table_name)
+                },
+                total_count=total_count,
             )
-        
+
         # Default ungrouped path
         return AnomalyUngrouped(
             table_group=table_group_out,
-            all_anomaly_results=processed_anomaly_results
+            all_anomaly_results=anomaly_results,
+            total_count=total_count,
         )
 
     except SQLAlchemyError as e:
@@ -1437,22 +1678,11 @@ def get_anomaly_results(
 # ---------------  Test Dashboard Overview service -----------------------
 
 def get_overall_data_quality_overview_service(duration: str, db: Session) -> OverallDataQualityOverviewResponse:
+    # Reads only the dashboard rollups refreshed at the end of each test run. They are kept by day,
+    # so a period starts at the beginning of the day its time filter falls on.
     try:
         time_filter = get_time_filter(duration)
 
-        # 1. Data Quality Score
-        avg_dq_score = db.query(func.avg(TestRunModel.dq_score_test_run)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar()
-
-        # 2. Test Failures
-        current_failures = db.query(func.sum(TestRunModel.failed_ct)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar()
-        if current_failures is None:
-            current_failures = 0
-
-        # Calculate percentage change for test failures
         if duration.lower() == "last 30 days":
             previous_period_start = time_filter - timedelta(days=30)
         elif duration.lower() == "last 7 days":
@@ -1462,12 +1692,28 @@ def get_overall_data_quality_overview_service(duration: str, db: Session) -> Ove
         else:
             previous_period_start = time_filter - timedelta(days=30)
 
-        previous_failures = db.query(func.sum(TestRunModel.failed_ct)).filter(
-            TestRunModel.test_starttime >= previous_period_start,
-            TestRunModel.test_starttime < time_filter
-        ).scalar()
-        if previous_failures is None:
-            previous_failures = 0
+        in_current_period = DashboardTestRollupModel.rollup_date >= time_filter.date()
+        rollup = db.query(
+            func.sum(DashboardTestRollupModel.scored_run_ct).filter(in_current_period).label("scored_run_ct"),
+            func.sum(DashboardTestRollupModel.dq_score_test_run_sum).filter(in_current_period).label("dq_score_sum"),
+            func.sum(DashboardTestRollupModel.failed_ct).filter(in_current_period).label("failed_ct"),
+            func.sum(DashboardTestRollupModel.failed_ct).filter(~in_current_period).label("previous_failed_ct"),
+            func.sum(DashboardTestRollupModel.test_ct).filter(in_current_period).label("test_ct"),
+            func.sum(DashboardTestRollupModel.dq_record_ct_sum).filter(in_current_period).label("dq_record_ct"),
+            func.sum(DashboardTestRollupModel.passed_ct).filter(in_current_period).label("passed_ct"),
+            func.sum(DashboardTestRollupModel.warning_ct).filter(in_current_period).label("warning_ct"),
+        ).filter(
+            DashboardTestRollupModel.rollup_date >= previous_period_start.date()
+        ).one()
+
+        # 1. Data Quality Score
+        avg_dq_score = rollup.dq_score_sum / rollup.scored_run_ct if rollup.scored_run_ct else None
+
+        # 2. Test Failures
+        current_failures = int(rollup.failed_ct or 0)
+
+        # Calculate percentage change for test failures
+        previous_failures = int(rollup.previous_failed_ct or 0)
 
         percentage_change_display: Union[float, str, None] = None
         if previous_failures == 0:
@@ -1480,32 +1726,16 @@ def get_overall_data_quality_overview_service(duration: str, db: Session) -> Ove
             percentage_change_display = round(percentage_change_value, 1)
 
         # 3. Records Tested - Return raw count
-        total_columns_tested = db.query(func.sum(TestRunModel.test_ct)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar()
-        total_columns_tested = int(total_columns_tested) if total_columns_tested is not None else 0
-        
+        total_columns_tested = int(rollup.test_ct or 0)
+
         #This is wrt rows
-        total_records_tested = db.query(func.sum(TestResultModel.dq_record_ct)).filter(
-            TestResultModel.test_time >= time_filter
-        ).scalar()
-        raw_total_records_tested = int(total_records_tested) if total_records_tested is not None else 0
+        raw_total_records_tested = int(rollup.dq_record_ct or 0)
         total_records_tested = format_large_number(raw_total_records_tested)
 
         # 4. Test Status
-        total_passed = db.query(func.sum(TestRunModel.passed_ct)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar() or 0
-        total_failed = db.query(func.sum(TestRunModel.failed_ct)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar() or 0
-        total_warning = db.query(func.sum(TestRunModel.warning_ct)).filter(
-            TestRunModel.test_starttime >= time_filter
-        ).scalar() or 0
-        
-        
-        
-       
+        total_passed = int(rollup.passed_ct or 0)
+        total_failed = current_failures
+        total_warning = int(rollup.warning_ct or 0)
 
         total_actions = total_passed + total_failed + total_warning
 
@@ -1686,121 +1916,106 @@ def calculate_success_rate_change(current_rate: float, previous_rate: float) ->
         return None  # Cannot calculate percentage change from zero
     return round(((current_rate - previous_rate) / previous_rate) * 100, 2)
 
+def _get_profiling_run_filters(
+    database_connection_id: Optional[int],
+    schema_table_group_uuid: Optional[uuid.UUID],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> list:
+    filters = []
+    if database_connection_id:
+        filters.append(ProfilingRunModel.connection_id == database_connection_id)
+    if schema_table_group_uuid:
+        filters.append(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
+    if start_date:
+        filters.append(ProfilingRunModel.profiling_starttime >= start_date)
+    if end_date:
+        filters.append(ProfilingRunModel.profiling_starttime <= end_date)
+    return filters
+
+
 def get_overview_metrics_service(
     db: Session,
     database_connection_id: Optional[int],
     schema_table_group_uuid: Optional[uuid.UUID]
 ) -> OverviewMetricsResponse:
     try:
-        # Base query for profiling runs
-        base_query = db.query(ProfilingRunModel)
-
-        # Apply filters
-        if database_connection_id:
-            base_query = base_query.filter(ProfilingRunModel.connection_id == database_connection_id)
-        if schema_table_group_uuid:
-            base_query = base_query.filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
-
-        all_runs = base_query.all()
-
-        total_profiles = 0
-        columns_profiled = 0
-        raw_rows_profiled = 0
-        #rows_profiled = 0
-        failed_profiles_count = 0
-
-        # Get unique table groups based on the filtered runs
-        unique_table_group_ids = {run.table_groups_id for run in all_runs}
-        total_profiles = len(unique_table_group_ids)
-
-        # Calculate columns profiled and failed profiles based on the LATEST run for each unique table group
-        for tg_id in unique_table_group_ids:
-            # Find the latest run for this specific table group (within the overall filtered scope if applicable)
-            latest_run_for_tg_query = db.query(ProfilingRunModel)\
-                .filter(ProfilingRunModel.table_groups_id == tg_id)
-
-            if database_connection_id:
-                latest_run_for_tg_query = latest_run_for_tg_query.filter(ProfilingRunModel.connection_id == database_connection_id)
-
-            latest_run_for_tg = latest_run_for_tg_query.order_by(ProfilingRunModel.profiling_endtime.desc()).first()
-
-            if latest_run_for_tg:
-                # Columns profiled: from the latest successful run for this table group
-                latest_successful_run_for_tg_query = db.query(ProfilingRunModel)\
-                    .filter(ProfilingRunModel.table_groups_id == tg_id)\
-                    .filter(ProfilingRunModel.status == 'Complete')
-
-                if database_connection_id:
-                    latest_successful_run_for_tg_query = latest_successful_run_for_tg_query.filter(
-                        ProfilingRunModel.connection_id == database_connection_id
-                    )
-
-                latest_successful_run_for_tg = latest_successful_run_for_tg_query.order_by(
-                    ProfilingRunModel.profiling_endtime.desc()
-                ).first()
-
-                if latest_successful_run_for_tg:
-                    record_count_sum = db.query(func.avg(ProfileResultModel.record_ct))\
-                                            .filter(ProfileResultModel.profile_run_id == latest_successful_run_for_tg.id)\
-                                            .scalar()
-                    raw_rows_profiled += int(record_count_sum) if record_count_sum is not None else 0
-
-                    # columns_profiled handling remains the same as it's separate
-                    columns_profiled += (latest_successful_run_for_tg.column_ct or 0)
-                    
-                    
-                # Failed profiles: based on the status of the absolute latest run
-                if latest_run_for_tg.status != 'Complete':
-                    failed_profiles_count += 1
-        formatted_rows_profiled = format_large_number(raw_rows_profiled)
-        #Rows count conversion
+        # Ranks each run within its table group, among its table group's successful runs, and overall,
+        # so all metrics come from a single query over the filtered runs
+        ranked_runs = db.query(
+            ProfilingRunModel.id,
+            ProfilingRunModel.table_groups_id,
+            ProfilingRunModel.status,
+            ProfilingRunModel.column_ct,
+            ProfilingRunModel.profiling_endtime,
+            func.row_number().over(
+                partition_by=ProfilingRunModel.table_groups_id,
+                order_by=ProfilingRunModel.profiling_endtime.desc(),
+            ).label("tg_rank"),
+            func.row_number().over(
+                partition_by=(ProfilingRunModel.table_groups_id, ProfilingRunModel.status == 'Complete'),
+                order_by=ProfilingRunModel.profiling_endtime.desc(),
+            ).label("tg_status_rank"),
+            func.row_number().over(
+                order_by=ProfilingRunModel.profiling_endtime.desc(),
+            ).label("overall_rank"),
+        ).filter(
+            *_get_profiling_run_filters(database_connection_id, schema_table_group_uuid)
+        ).cte("ranked_runs")
+
+        is_complete = ranked_runs.c.status == 'Complete'
+        is_latest_successful = and_(is_complete, ranked_runs.c.tg_status_rank == 1)
+        latest_avg_record_ct = (
+            db.query(func.floor(func.avg(ProfileResultModel.record_ct)))
+            .filter(ProfileResultModel.profile_run_id == ranked_runs.c.id)
+            .scalar_subquery()
+        )
+        # The previous period holds the runs that ended before the second latest run
+        previous_period_end = (
+            db.query(func.max(ranked_runs.c.profiling_endtime))
+            .filter(ranked_runs.c.overall_rank == 2)
+            .scalar_subquery()
+        )
+        in_previous_period = ranked_runs.c.profiling_endtime < previous_period_end
+
+        metrics = db.query(
+            func.count(distinct(ranked_runs.c.table_groups_id)).label("total_profiles"),
+            func.count().label("total_runs"),
+            func.count().filter(is_complete).label("successful_runs"),
+            func.sum(case((is_latest_successful, ranked_runs.c.column_ct), else_=0)).label("columns_profiled"),
+            func.sum(case((is_latest_successful, latest_avg_record_ct), else_=0)).label("rows_profiled"),
+            func.count().filter(
+                and_(ranked_runs.c.tg_rank == 1, func.coalesce(ranked_runs.c.status, '') != 'Complete')
+            ).label("failed_profiles"),
+            func.count().filter(in_previous_period).label("prev_total_runs"),
+            func.count().filter(and_(in_previous_period, is_complete)).label("prev_successful_runs"),
+        ).select_from(ranked_runs).one()
+
+        raw_rows_profiled = int(metrics.rows_profiled or 0)
         rows_profiled = format_large_number(raw_rows_profiled)
-        # Success rate calculation based on all filtered runs
-        total_runs_count = len(all_runs)
-        successful_runs_count = sum(1 for run in all_runs if run.status == 'Complete')
 
+        total_runs_count = metrics.total_runs
         success_rate = 0.0
         if total_runs_count > 0:
-            success_rate = (successful_runs_count / total_runs_count) * 100
+            success_rate = (metrics.successful_runs / total_runs_count) * 100
 
         success_rate_change = None
-
-        # Calculate success rate change only if there's sufficient history
-        if total_runs_count > 1:
-            # Get the timestamp of the second latest run (if it exists) to define a "previous" period
-            second_latest_run_query = base_query.order_by(ProfilingRunModel.profiling_endtime.desc()).offset(1).first()
-
-            if second_latest_run_query:
-                previous_period_runs = base_query.filter(
-                    ProfilingRunModel.profiling_endtime < second_latest_run_query.profiling_endtime
-                ).all()
-
-                prev_total_runs = len(previous_period_runs)
-                prev_successful_count = sum(1 for run in previous_period_runs if run.status == 'Complete')
-
-                if prev_total_runs > 0:
-                    previous_period_success_rate = (prev_successful_count / prev_total_runs) * 100
-                    success_rate_change = calculate_success_rate_change(success_rate, previous_period_success_rate)
+        if total_runs_count > 1 and metrics.prev_total_runs > 0:
+            previous_period_success_rate = (metrics.prev_successful_runs / metrics.prev_total_runs) * 100
+            success_rate_change = calculate_success_rate_change(success_rate, previous_period_success_rate)
 
         # Special handling for single run / no history for a specific table group
-        if schema_table_group_uuid:
-            runs_for_specific_tg = db.query(ProfilingRunModel)\
-                .filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)\
-                .filter(ProfilingRunModel.connection_id == database_connection_id if database_connection_id else True)\
-                .all()
-            if len(runs_for_specific_tg) <= 1:
-                success_rate = 100.00
-                success_rate_change = None
-
-        #formatted_rows_profiled = format_large_number(raw_rows_profiled)
+        if schema_table_group_uuid and total_runs_count <= 1:
+            success_rate = 100.00
+            success_rate_change = None
 
         return OverviewMetricsResponse(
-            total_profiles=total_profiles,
-            rows_profiled = rows_profiled,
-            columns_profiled=columns_profiled,
+            total_profiles=metrics.total_profiles,
+            rows_profiled=rows_profiled,
+            columns_profiled=int(metrics.columns_profiled or 0),
             success_rate=round(success_rate, 2),
             success_rate_change=success_rate_change,
-            failed_profiles=failed_profiles_count
+            failed_profiles=metrics.failed_profiles
         )
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -1818,44 +2033,18 @@ def get_profile_run_trend_service(
     metric: str
 ) -> ProfileRunTrendResponse:
     try:
-        query = db.query(ProfilingRunModel)
-        if database_connection_id:
-            query = query.filter(ProfilingRunModel.connection_id == database_connection_id)
-        if schema_table_group_uuid:
-            query = query.filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
-        if start_date:
-            query = query.filter(ProfilingRunModel.profiling_starttime >= start_date)
-        if end_date:
-            query = query.filter(ProfilingRunModel.profiling_starttime <= end_date)
-
-        # Grouping by interval
-        if interval == "day":
-            date_trunc_func = func.date_trunc('day', ProfilingRunModel.profiling_starttime)
-        elif interval == "week":
-            date_trunc_func = func.date_trunc('week', ProfilingRunModel.profiling_starttime)
-        elif interval == "month":
-            date_trunc_func = func.date_trunc('month', ProfilingRunModel.profiling_starttime)
-        else:
+        if interval not in ("day", "week", "month"):
             raise HTTPException(status_code=400, detail="Invalid interval. Choose 'day', 'week', or 'month'.")
+        date_trunc_func = func.date_trunc(interval, ProfilingRunModel.profiling_starttime)
 
-        trend_query = db.query(
+        trend_results = db.query(
             date_trunc_func.label('date'),
             func.count(ProfilingRunModel.id).label('total_runs'),
-            func.sum(case((ProfilingRunModel.status == 'Complete', 1), else_=0)).label('successful_runs'),
+            func.count().filter(ProfilingRunModel.status == 'Complete').label('successful_runs'),
             func.avg(ProfilingRunModel.dq_score_profiling).label('avg_dq_score')
-        )
-
-        # Apply filters to the aggregation query
-        if database_connection_id:
-            trend_query = trend_query.filter(ProfilingRunModel.connection_id == database_connection_id)
-        if schema_table_group_uuid:
-            trend_query = trend_query.filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
-        if start_date:
-            trend_query = trend_query.filter(ProfilingRunModel.profiling_starttime >= start_date)
-        if end_date:
-            trend_query = trend_query.filter(ProfilingRunModel.profiling_starttime <= end_date)
-
-        trend_results = trend_query.group_by(date_trunc_func).order_by(date_trunc_func).all()
+        ).filter(
+            *_get_profiling_run_filters(database_connection_id, schema_table_group_uuid, start_date, end_date)
+        ).group_by(date_trunc_func).order_by(date_trunc_func).all()
 
         trend_data = []
         for row in trend_results:
@@ -1867,6 +2056,8 @@ def get_profile_run_trend_service(
             ))
 
         return ProfileRunTrendResponse(trend_data=trend_data)
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
     except Exception as e:
@@ -1883,22 +2074,6 @@ def get_recent_profile_runs_service(
     sort_order: str
 ) -> RecentProfileRunsResponse:
     try:
-        query = db.query(
-            ProfilingRunModel,
-            Connection.connection_name,
-            Connection.connection_id,
-            TableGroupModel.table_groups_name,
-            TableGroupModel.db_schema,
-            TableGroupModel.id.label('table_group_model_id_uuid')
-        )\
-        .join(Connection, ProfilingRunModel.connection_id == Connection.connection_id)\
-        .join(TableGroupModel, ProfilingRunModel.table_groups_id == TableGroupModel.id)
-
-        if database_connection_id:
-            query = query.filter(ProfilingRunModel.connection_id == database_connection_id)
-        if schema_table_group_uuid:
-            query = query.filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
-
         # Apply sorting
         if sort_by == "profiling_starttime":
             order_column = ProfilingRunModel.profiling_starttime
@@ -1910,17 +2085,37 @@ def get_recent_profile_runs_service(
             raise HTTPException(status_code=400, detail="Invalid sort_by parameter.")
 
         if sort_order == "desc":
-            query = query.order_by(order_column.desc())
+            order_column = order_column.desc()
         elif sort_order == "asc":
-            query = query.order_by(order_column.asc())
+            order_column = order_column.asc()
         else:
             raise HTTPException(status_code=400, detail="Invalid sort_order parameter. Use 'asc' or 'desc'.")
 
-        total_runs = query.count()
-        runs_data = query.offset(offset).limit(limit).all()
+        # The total comes back with the page, so listing takes one round trip
+        query = db.query(
+            ProfilingRunModel,
+            Connection.connection_name,
+            Connection.connection_id,
+            TableGroupModel.table_groups_name,
+            TableGroupModel.db_schema,
+            TableGroupModel.id.label('table_group_model_id_uuid'),
+            func.count().over().label('total_runs')
+        )\
+        .join(Connection, ProfilingRunModel.connection_id == Connection.connection_id)\
+        .join(TableGroupModel, ProfilingRunModel.table_groups_id == TableGroupModel.id)\
+        .filter(*_get_profiling_run_filters(database_connection_id, schema_table_group_uuid))
+
+        runs_data = query.order_by(order_column).offset(offset).limit(limit).all()
+        if runs_data:
+            total_runs = runs_data[0].total_runs
+        elif offset > 0:
+            # Past the last page, so no row carries the total
+            total_runs = query.with_entities(ProfilingRunModel.id).count()
+        else:
+            total_runs = 0
 
         recent_runs_list = []
-        for run, conn_name, conn_id, tg_name, tg_schema, tg_uuid in runs_data:
+        for run, conn_name, conn_id, tg_name, tg_schema, tg_uuid, _ in runs_data:
             recent_runs_list.append(RecentProfileRun(
                 run_display_id=f"Run on {run.profiling_starttime.strftime('%Y-%m-%d %H:%M')} ({run.status})",
                 run_uuid=run.id,
@@ -1935,12 +2130,28 @@ def get_recent_profile_runs_service(
             ))
 
         return RecentProfileRunsResponse(total_runs=total_runs, runs=recent_runs_list)
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
 
+COLUMN_STATS_DISTRIBUTION_CACHE_SIZE = 256
+_column_stats_distribution_cache: "collections.OrderedDict[tuple, ColumnStatsDistributionResponse]" = collections.OrderedDict()
+_column_stats_distribution_lock = threading.Lock()
+
+
+def _get_column_stats_bucket_label(bucket_index: int, bucket_size: float, max_val: float, metric_type: ColumnMetricType) -> str:
+    lower_bound = bucket_index * bucket_size
+    upper_bound = min((bucket_index + 1) * bucket_size, max_val)
+    range_str = f"{int(lower_bound)}-{int(upper_bound)}"
+    if metric_type != ColumnMetricType.AVG_LENGTH:
+        range_str += "%"
+    return range_str
+
+
 def get_column_stats_distribution_service(
     db: Session,
     metric_type: ColumnMetricType,
@@ -1950,9 +2161,7 @@ def get_column_stats_distribution_service(
 ) -> ColumnStatsDistributionResponse:
     try:
         # Step 1: Find the latest successful profile_run_id for the given scope
-        latest_run_id = None
-
-        latest_run_query_base = db.query(ProfilingRunModel)\
+        latest_run_query_base = db.query(ProfilingRunModel.id)\
             .filter(ProfilingRunModel.status == 'Complete')\
             .order_by(ProfilingRunModel.profiling_endtime.desc())
 
@@ -1961,113 +2170,92 @@ def get_column_stats_distribution_service(
         if schema_table_group_uuid:
             latest_run_query_base = latest_run_query_base.filter(ProfilingRunModel.table_groups_id == schema_table_group_uuid)
 
-        latest_run = latest_run_query_base.first()
-        latest_run_id = latest_run.id if latest_run else None
+        latest_run_id = latest_run_query_base.limit(1).scalar()
 
         if not latest_run_id:
             raise HTTPException(status_code=404, detail="No complete profiling runs found for the specified scope.")
 
-        # Step 2: Query ProfileResultModel for the latest successful run
-        profile_results_query = db.query(ProfileResultModel)\
-            .filter(ProfileResultModel.profile_run_id == latest_run_id)
+        # Results of a complete run don't change, so its distributions are cached
+        cache_key = (latest_run_id, metric_type, bucket_size, database_connection_id, schema_table_group_uuid)
+        with _column_stats_distribution_lock:
+            if cache_key in _column_stats_distribution_cache:
+                _column_stats_distribution_cache.move_to_end(cache_key)
+                return _column_stats_distribution_cache[cache_key]
 
+        # Step 2: Bucket the profile results of the latest successful run in the database
+        result_filters = [ProfileResultModel.profile_run_id == latest_run_id]
         if database_connection_id:
-            profile_results_query = profile_results_query.filter(ProfileResultModel.connection_id == database_connection_id)
+            result_filters.append(ProfileResultModel.connection_id == database_connection_id)
         if schema_table_group_uuid:
-            profile_results_query = profile_results_query.filter(ProfileResultModel.table_groups_id == schema_table_group_uuid)
+            result_filters.append(ProfileResultModel.table_groups_id == schema_table_group_uuid)
 
-        profile_results = profile_results_query.all()
+        max_val = 100
+        if metric_type == ColumnMetricType.NULL_PERCENTAGE:
+            chart_title = "Distribution of Null Values"
+            x_axis_label = "Null Value Percentage"
+            metric_value = case(
+                (ProfileResultModel.record_ct > 0, ProfileResultModel.null_value_ct * 100.0 / ProfileResultModel.record_ct),
+                else_=0,
+            )
+        elif metric_type == ColumnMetricType.DISTINCT_PERCENTAGE:
+            chart_title = "Distribution of Distinct Values"
+            x_axis_label = "Distinct Value Percentage"
+            metric_value = case(
+                (ProfileResultModel.record_ct > 0, ProfileResultModel.distinct_value_ct * 100.0 / ProfileResultModel.record_ct),
+                else_=0,
+            )
+        else:
+            chart_title = "Distribution of Average Lengths"
+            x_axis_label = "Average Length"
+            metric_value = ProfileResultModel.avg_length
+            actual_max_length = db.query(func.max(ProfileResultModel.max_length)).filter(*result_filters).scalar()
+            max_val = max((actual_max_length or 0) + 10, 100)
+        metric_value = cast(metric_value, Float)
+
+        # Bucket i holds values from i * bucket_size up to the next bucket, and the maximum falls in the last bucket
+        num_buckets = int(max_val / bucket_size)
+        bucket_index = case(
+            (metric_value == max_val, num_buckets - 1),
+            else_=func.width_bucket(
+                metric_value, cast(0, Float), cast((num_buckets + 1) * bucket_size, Float), num_buckets + 1
+            ) - 1,
+        )
+        bucket_counts = db.query(
+            bucket_index.label("bucket_index"),
+            func.count().label("column_count"),
+        ).filter(*result_filters).group_by("bucket_index").all()
 
-        if not profile_results:
+        if not bucket_counts:
             raise HTTPException(status_code=404, detail="No profile results found for the latest complete run in the specified scope.")
 
         distribution_counts = {}
-        chart_title = ""
-        x_axis_label = ""
-
-        max_val = 100
-        if metric_type == ColumnMetricType.AVG_LENGTH:
-            actual_max_length = max([res.max_length for res in profile_results if res.max_length is not None], default=0)
-            max_val = max(actual_max_length + 10, 100)
-
-        num_buckets = int(max_val / bucket_size)
         for i in range(num_buckets + 1):
-            lower_bound = i * bucket_size
-            upper_bound = (i + 1) * bucket_size
-
-            if upper_bound > max_val:
-                upper_bound = max_val
-
-            if lower_bound == upper_bound:
-                continue
-
-            range_str = f"{int(lower_bound)}-{int(upper_bound)}"
-            if metric_type != ColumnMetricType.AVG_LENGTH:
-                range_str += "%"
-
-            if range_str not in distribution_counts:
-                distribution_counts[range_str] = 0
-
-        for res in profile_results:
-            value_to_bucket = None
-            if metric_type == ColumnMetricType.NULL_PERCENTAGE:
-                chart_title = "Distribution of Null Values"
-                x_axis_label = "Null Value Percentage"
-                if res.record_ct is not None and res.record_ct > 0:
-                    value_to_bucket = (res.null_value_ct / res.record_ct) * 100
-                else:
-                    value_to_bucket = 0
-            elif metric_type == ColumnMetricType.DISTINCT_PERCENTAGE:
-                chart_title = "Distribution of Distinct Values"
-                x_axis_label = "Distinct Value Percentage"
-                if res.record_ct is not None and res.record_ct > 0:
-                    value_to_bucket = (res.distinct_value_ct / res.record_ct) * 100
-                else:
-                    value_to_bucket = 0
-            elif metric_type == ColumnMetricType.AVG_LENGTH:
-                chart_title = "Distribution of Average Lengths"
-                x_axis_label = "Average Length"
-                value_to_bucket = res.avg_length
-
-            if value_to_bucket is not None:
-                bucket_index = int(value_to_bucket // bucket_size)
-
-                if value_to_bucket == max_val and metric_type != ColumnMetricType.AVG_LENGTH:
-                    bucket_index = num_buckets - 1
-                elif value_to_bucket == max_val and metric_type == ColumnMetricType.AVG_LENGTH:
-                    bucket_index = num_buckets - 1
-
-                lower_bound = bucket_index * bucket_size
-                upper_bound = (bucket_index + 1) * bucket_size
-
-                if upper_bound > max_val:
-                    upper_bound = max_val
-
-                range_str = f"{int(lower_bound)}-{int(upper_bound)}"
-                if metric_type != ColumnMetricType.AVG_LENGTH:
-                    range_str += "%"
-
-                if range_str in distribution_counts:
-                    distribution_counts[range_str] += 1
-                else:
-                    distribution_counts[range_str] = 1
-
-        sorted_distribution_data = []
-        def sort_key_for_range(range_str_val):
-            try:
-                return float(range_str_val.split('-')[0].replace('%', ''))
-            except ValueError:
-                return float('inf')
-
-        for key in sorted(distribution_counts.keys(), key=sort_key_for_range):
-            sorted_distribution_data.append(DistributionDataPoint(range=key, column_count=distribution_counts[key]))
-
-        return ColumnStatsDistributionResponse(
+            if i * bucket_size < min((i + 1) * bucket_size, max_val):
+                distribution_counts[i] = 0
+        for row in bucket_counts:
+            if row.bucket_index is not None:
+                distribution_counts[row.bucket_index] = distribution_counts.get(row.bucket_index, 0) + row.column_count
+
+        distribution_data = {}
+        for index in sorted(distribution_counts):
+            range_str = _get_column_stats_bucket_label(index, bucket_size, max_val, metric_type)
+            distribution_data[range_str] = distribution_data.get(range_str, 0) + distribution_counts[index]
+
+        response = ColumnStatsDistributionResponse(
             chart_title=chart_title,
             x_axis_label=x_axis_label,
             y_axis_label="Number of Columns",
-            distribution_data=sorted_distribution_data
+            distribution_data=[
+                DistributionDataPoint(range=key, column_count=count) for key, count in distribution_data.items()
+            ]
         )
+        with _column_stats_distribution_lock:
+            _column_stats_distribution_cache[cache_key] = response
+            if len(_column_stats_distribution_cache) > COLUMN_STATS_DISTRIBUTION_CACHE_SIZE:
+                _column_stats_distribution_cache.popitem(last=False)
+        return response
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
     except Exception as e:
@@ -0,0 +1,137 @@
+"""
+Benchmarks the profile dashboard services against a seeded profiling history.
+
+The history is seeded in a transaction that is rolled back at the end, so the
+configured application database is left unchanged.
+
+    python -m Backend.benchmark_profile_dashboard --table-groups 200 --runs-per-group 25
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from Backend.backend_services import (
+    get_overview_metrics_service,
+    get_profile_run_trend_service,
+    get_recent_profile_runs_service,
+)
+from Backend.db.database import Connection, ProfileResultModel, ProfilingRunModel, SessionLocal, TableGroupModel, engine
+
+PROJECT_CODE = "BENCHMARK"
+STATUSES = ["Complete"] * 8 + ["Error", "Running"]
+
+
+def seed_history(db, table_groups: int, runs_per_group: int, results_per_run: int) -> int:
+    connection = Connection(project_code=None, sql_flavor="postgresql", connection_name="benchmark")
+    db.add(connection)
+    db.flush()
+
+    now = datetime.now()
+    runs = []
+    results = []
+    for group_index in range(table_groups):
+        table_group_id = uuid.uuid4()
+        db.add(TableGroupModel(
+            id=table_group_id,
+            connection_id=connection.connection_id,
+            table_groups_name=f"benchmark_{group_index}",
+            db_schema="benchmark",
+        ))
+        for run_index in range(runs_per_group):
+            run_id = uuid.uuid4()
+            start_time = now - timedelta(days=run_index, minutes=random.randint(0, 1440))
+            status = random.choice(STATUSES)
+            runs.append({
+                "id": run_id,
+                "project_code": PROJECT_CODE,
+                "connection_id": connection.connection_id,
+                "table_groups_id": table_group_id,
+                "profiling_starttime": start_time,
+                "profiling_endtime": None if status == "Running" else start_time + timedelta(minutes=5),
+                "status": status,
+                "column_ct": results_per_run,
+                "dq_score_profiling": random.random(),
+            })
+            results.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "project_code": PROJECT_CODE,
+                    "connection_id": connection.connection_id,
+                    "table_groups_id": table_group_id,
+                    "profile_run_id": run_id,
+                    "table_name": f"table_{column_index % 10}",
+                    "column_name": f"column_{column_index}",
+                    "record_ct": random.randint(1000, 1000000),
+                }
+                for column_index in range(results_per_run)
+            )
+    db.flush()
+    db.bulk_insert_mappings(ProfilingRunModel, runs)
+    db.bulk_insert_mappings(ProfileResultModel, results)
+    db.flush()
+    return connection.connection_id
+
+
+def time_service(label: str, repeat: int, call) -> None:
+    statements = []
+
+    def count_statement(*_):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    timings = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - started)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    print(
+        f"{label:<28} median {statistics.median(timings) * 1000:8.1f} ms   "
+        f"max {max(timings) * 1000:8.1f} ms   {len(statements) / repeat:.0f} statements per call"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--table-groups", type=int, default=200)
+    parser.add_argument("--runs-per-group", type=int, default=25)
+    parser.add_argument("--results-per-run", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        connection_id = seed_history(db, args.table_groups, args.runs_per_group, args.results_per_run)
+        print(
+            f"Seeded {args.table_groups * args.runs_per_group} runs in {args.table_groups} table groups "
+            f"({time.perf_counter() - started:.1f} s)"
+        )
+
+        time_service(
+            "overview_metrics", args.repeat,
+            lambda: get_overview_metrics_service(db, connection_id, None),
+        )
+        time_service(
+            "profile_run_trend", args.repeat,
+            lambda: get_profile_run_trend_service(db, connection_id, None, None, None, "day", "runs"),
+        )
+        time_service(
+            "recent_profile_runs", args.repeat,
+            lambda: get_recent_profile_runs_service(db, connection_id, None, 10, 0, "profiling_starttime", "desc"),
+        )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import parse_obj_as
+
+LOG = logging.getLogger(__name__)
+
+# Number of responses held in memory
+RESPONSE_CACHE_SIZE = int(os.getenv("API_RESPONSE_CACHE_SIZE", "256"))
+# Directory for the optional on-disk tier; responses are only kept in memory when unset
+RESPONSE_CACHE_DIR = os.getenv("API_RESPONSE_CACHE_DIR", "")
+# Total size of the on-disk tier; the least recently used files are removed beyond it
+RESPONSE_CACHE_DIR_MAX_BYTES = int(os.getenv("API_RESPONSE_CACHE_DIR_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Extension of on-disk entries: a JSON header line with the version and ETag, followed by the body
+CACHE_FILE_EXTENSION = ".response"
+
+# Clients may keep responses but must revalidate them, since dispositions can still change
+CACHE_CONTROL = "private, no-cache"
+
+
+class CachedResponse(NamedTuple):
+    version: str
+    etag: str
+    body: bytes
+
+
+class ResponseCache:
+    """
+    LRU of serialized responses, with an optional on-disk tier that survives restarts and is shared by workers.
+    Entries carry the version of the data they were built from; a stale version is a miss.
+    The on-disk tier is kept under max_dir_bytes by removing the files least recently read or written.
+    """
+
+    def __init__(self, max_entries: int, cache_dir: str = "", max_dir_bytes: int = RESPONSE_CACHE_DIR_MAX_BYTES):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_dir_bytes = max_dir_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{CACHE_FILE_EXTENSION}")
+
+    def get(self, key: str, version: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+
+        if not entry and self.cache_dir:
+            file_path = self._get_file_path(key)
+            try:
+                with open(file_path, "rb") as file:
+                    header = json.loads(file.readline())
+                    entry = CachedResponse(str(header["version"]), str(header["etag"]), file.read())
+                # The modification time orders files for eviction
+                os.utime(file_path)
+            except FileNotFoundError:
+                entry = None
+            except Exception:
+                LOG.warning("Discarding unreadable response cache file for %s", key, exc_info=True)
+                entry = None
+            if entry:
+                self._put_memory(key, entry)
+
+        return entry if entry and entry.version == version else None
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        self._put_memory(key, entry)
+        if self.cache_dir:
+            file_path = self._get_file_path(key)
+            temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, "wb") as file:
+                    file.write(json.dumps({"version": entry.version, "etag": entry.etag}).encode() + b"\n")
+                    file.write(entry.body)
+                os.replace(temp_path, file_path)
+            except OSError:
+                LOG.warning("Could not write response cache file for %s", key, exc_info=True)
+            self._prune_dir()
+
+    def _prune_dir(self) -> None:
+        files = []
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.endswith(CACHE_FILE_EXTENSION):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                total_bytes += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total_bytes <= self.max_dir_bytes:
+                break
+            # Another worker may have removed or replaced the file already
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def _put_memory(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_DIR)
+
+
+def _get_cache_key(request: Request) -> str:
+    query_params = sorted(request.query_params.multi_items())
+    return hashlib.sha256(json.dumps([request.url.path, query_params]).encode()).hexdigest()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cached_json_response(
+    request: Request, version: Optional[str], build: Callable[[], Any], response_model: Any = None
+) -> Response:
+    """
+    Returns the JSON response built by `build`, served from the cache while `version` is unchanged.
+    The path and query parameters identify the response; a `version` of None means the data can still
+    change (e.g. the run isn't complete), so it is built on every request and not cached.
+    Raw responses skip the route's response_model, so pass it here to validate the built content.
+    Answers a matching If-None-Match with 304.
+    """
+    def build_content():
+        content = build()
+        return parse_obj_as(response_model, content) if response_model is not None else content
+
+    if version is None:
+        return Response(
+            content=json.dumps(jsonable_encoder(build_content())),
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+
+    key = _get_cache_key(request)
+    entry = response_cache.get(key, version)
+    if not entry:
+        body = json.dumps(jsonable_encoder(build_content())).encode()
+        entry = CachedResponse(version, f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        response_cache.put(key, entry)
+
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
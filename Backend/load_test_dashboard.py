@@ -0,0 +1,87 @@
+"""
+Measures dashboard and results endpoint throughput with N concurrent clients.
+
+Start the API (e.g. `uvicorn Backend.QualityApp:app`), then run the load test
+against it; run it once per revision to compare before and after a change.
+
+    python -m Backend.load_test_dashboard --base-url http://localhost:8000 --clients 1 10 50 --duration 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+
+ENDPOINTS = [
+    "/api/v1/data-quality/overview",
+    "/api/v1/test-runs/recent",
+    "/api/v1/data-quality/trend",
+    "/api/v1/data-sources",
+    "/api/v1/overview_metrics",
+    "/api/v1/profile_run_trend",
+    "/api/v1/recent_profile_runs",
+    "/api/v1/dropdown_options?type=database",
+    "/test_runs/status_summary",
+    "/test_runs_summary_by_suite",
+]
+
+
+async def run_client(client: httpx.AsyncClient, paths: List[str], deadline: float, latencies: List[float], errors: List[str]) -> None:
+    index = 0
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(f"{path}: HTTP {response.status_code}")
+        except httpx.HTTPError as e:
+            errors.append(f"{path}: {e!r}")
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_level(base_url: str, paths: List[str], clients: int, duration: float, token: Optional[str]) -> None:
+    latencies: List[float] = []
+    errors: List[str] = []
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(
+            run_client(client, paths[offset:] + paths[:offset], deadline, latencies, errors)
+            for offset in (index % len(paths) for index in range(clients))
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    print(
+        f"{clients:>4} clients   {len(latencies) / elapsed:8.1f} req/s   "
+        f"median {statistics.median(latencies) * 1000 if latencies else 0:8.1f} ms   "
+        f"p95 {p95 * 1000:8.1f} ms   {len(errors)} errors"
+    )
+    for error in sorted(set(errors))[:5]:
+        print(f"     {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per concurrency level")
+    parser.add_argument("--endpoint", action="append", help="Path to request; repeat for several (default: dashboard endpoints)")
+    parser.add_argument("--token", help="Bearer token, when the API runs with authentication")
+    args = parser.parse_args()
+
+    paths = args.endpoint or ENDPOINTS
+    for clients in args.clients:
+        asyncio.run(run_level(args.base_url, paths, clients, args.duration, args.token))
+
+
+if __name__ == "__main__":
+    main()
@@ -355,7 +355,7 @@ class ProfileResultOut(BaseModel):
        
 class TriggerProfilingRequest(BaseModel):
     connection_id: int
-    table_group_id: str
+    table_group_id: UUID
    
 class RunInfo(BaseModel):
     connection_id: int
@@ -619,6 +619,59 @@ class TestResultsWithConnection(BaseModel):
     
     
     
+class TestResultFields(BaseModel):
+    """
+    A test result holding only the fields that were requested, so every field is optional.
+    """
+    id: Optional[UUID4]
+    result_id: Optional[int]
+    test_type: Optional[str]
+    test_suite_id: Optional[UUID4]
+    test_definition_id: Optional[UUID4]
+    auto_gen: Optional[bool]
+    test_time: Optional[datetime]
+    starttime: Optional[datetime]
+    endtime: Optional[datetime]
+    schema_name: Optional[str]
+    table_name: Optional[str]
+    column_names: Optional[str]
+    skip_errors: Optional[int]
+    input_parameters: Optional[str]
+    result_code: Optional[int]
+    severity: Optional[str]
+    result_status: Optional[str]
+    result_message: Optional[str]
+    result_measure: Optional[str]
+    threshold_value: Optional[str]
+    result_error_data: Optional[str]
+    test_action: Optional[str]
+    disposition: Optional[str]
+    subset_condition: Optional[str]
+    result_query: Optional[str]
+    test_description: Optional[str]
+    test_run_id: Optional[UUID4]
+    table_groups_id: Optional[UUID4]
+    dq_prevalence: Optional[float]
+    dq_record_ct: Optional[int]
+    observability_status: Optional[str]
+
+    # Fields from TestTypeModel
+    test_name_short: Optional[str]
+    test_name_long: Optional[str]
+    test_type_description: Optional[str]
+
+
+class TestResultsPage(BaseModel):
+    """
+    A test suite's results, newest first. Each result holds the requested fields.
+    When a page size was given, pass next_cursor as the cursor to fetch the following page.
+    """
+    connection_name: Optional[str]
+    db_type: Optional[str]
+    results: List[TestResultFields]
+    next_cursor: Optional[int] = None
+
+
 # You can also add a response model for the list of results
 class TestResultsResponse(BaseModel):
     results: List[TestResultWithDetails]
@@ -666,14 +719,17 @@ class AnomalyResultOut(BaseModel):
 class AnomalyGroupedByTable(BaseModel):
     table_group: TableGroupOut
     anomaly_results_by_table: Dict[str, List[AnomalyResultOut]]
+    total_count: Optional[int] = None # Matching results across all pages
  
 class AnomalyGroupedByRun(BaseModel):
     table_group: TableGroupOut
     anomaly_results_by_run: Dict[str, Dict[str, List[AnomalyResultOut]]]
+    total_count: Optional[int] = None # Matching results across all pages
  
 class AnomalyUngrouped(BaseModel):
     table_group: TableGroupOut
     all_anomaly_results: List[AnomalyResultOut]
+    total_count: Optional[int] = None # Matching results across all pages
     
 class LatestTestRunSummary(BaseModel):
     totalTests: int
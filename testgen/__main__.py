@@ -28,6 +28,7 @@ from testgen.commands.run_get_entities import (
     run_table_group_list,
     run_test_info,
 )
+from testgen.commands.run_job_worker import run_job_worker
 from testgen.commands.run_launch_db_config import run_launch_db_config
 from testgen.commands.run_observability_exporter import run_observability_exporter
 from testgen.commands.run_profiling_bridge import run_profiling_queries
@@ -103,12 +104,27 @@ def cli(ctx: Context, verbose: bool):
     help="The identifier for the table group used during a profile run. Use a table_group_id shown in list-table-groups.",
     default=None,
 )
-def run_profile(configuration: Configuration, table_group_id: str):
+@click.option(
+    "--incremental/--full",
+    help="Only re-profile tables that changed since the last profiling run. Defaults to TG_PROFILING_INCREMENTAL.",
+    default=None,
+)
+@click.option(
+    "--approx/--exact",
+    "approx_stats",
+    help="Estimate distinct counts and percentiles with approximate functions. Defaults to TG_PROFILING_APPROX_STATS.",
+    default=None,
+)
+def run_profile(
+    configuration: Configuration, table_group_id: str, incremental: bool | None, approx_stats: bool | None
+):
     click.echo(f"run-profile with table_group_id: {table_group_id}")
     spinner = None
     if not configuration.verbose:
         spinner = MoonSpinner("Processing ... ")
-    message = run_profiling_queries(table_group_id, spinner=spinner)
+    message = run_profiling_queries(
+        table_group_id, spinner=spinner, incremental=incremental, approx_stats=approx_stats
+    )
     click.echo("\n" + message)
 
 
@@ -494,6 +510,35 @@ def export_data(configuration: Configuration, project_key: str, test_suite_key:
     click.echo("\nexport-observability completed successfully.\n")
 
 
+@cli.command("run-worker", help="Runs queued profiling and test jobs as separate processes.")
+@click.option(
+    "--max-jobs",
+    help="Maximum number of jobs running at once across all workers. Defaults to TG_JOB_WORKER_MAX_JOBS.",
+    required=False,
+    type=click.INT,
+    default=settings.JOB_WORKER_MAX_JOBS,
+)
+@click.option(
+    "--max-jobs-per-connection",
+    help="Maximum number of jobs running at once against one connection. Defaults to TG_JOB_WORKER_MAX_JOBS_PER_CONNECTION.",
+    required=False,
+    type=click.INT,
+    default=settings.JOB_WORKER_MAX_JOBS_PER_CONNECTION,
+)
+@click.option(
+    "--poll-seconds",
+    help="Seconds to wait between checks of the job queue. Defaults to TG_JOB_WORKER_POLL_SECONDS.",
+    required=False,
+    type=click.FLOAT,
+    default=settings.JOB_WORKER_POLL_SECONDS,
+)
+@pass_configuration
+def run_worker(configuration: Configuration, max_jobs: int, max_jobs_per_connection: int, poll_seconds: float):
+    click.echo(f"run-worker with max jobs: {max_jobs}, per connection: {max_jobs_per_connection}")
+    LOG.info("CurrentStep: Main Program - Job Worker")
+    run_job_worker(max_jobs, max_jobs_per_connection, poll_seconds)
+
+
 @cli.command("list-test-types", help="Lists all available TestGen test types.")
 @click.option("-d", "--display", help="Show command output in the terminal.", is_flag=True, default=False)
 @pass_configuration
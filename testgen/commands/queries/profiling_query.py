@@ -1,9 +1,62 @@
+import re
 import typing
 
 from testgen.commands.queries.refresh_data_chars_query import CRefreshDataCharsSQL
 from testgen.commands.queries.rollup_scores_query import CRollupScoresSQL
-from testgen.common import date_service, read_template_sql_file, read_template_yaml_file
-from testgen.common.read_file import replace_templated_functions
+from testgen.common import (
+    compile_template_sql_file,
+    date_service,
+    read_template_sql_file,
+    read_template_yaml_file,
+)
+from testgen.common.read_file import render_template
+
+PERCENTILE_ALIAS_PATTERN = re.compile(r"\b(pctile|pct_25|pct_50|pct_75)\b")
+SELECT_ALIAS_PATTERN = re.compile(r"^(.*\S)\s+AS\s+(\w+)$", re.IGNORECASE | re.DOTALL)
+SQL_LITERAL_PATTERN = re.compile(r"^(?:NULL|'(?:[^']|'')*'|-?\d+(?:\.\d+)?)$", re.IGNORECASE | re.DOTALL)
+DISTINCT_CT_PATTERN = re.compile(r"COUNT\(DISTINCT ([^()]+)\)(\s+AS\s+distinct_value_ct\b)", re.IGNORECASE)
+
+# Marks batch layout fields whose values come back from the target DB rather than from a literal
+QUERIED = object()
+
+# Frequency lists show the most common values, then total the rest as "Other Values".
+# Only columns within the distinct count and value length limits get a frequency list.
+FREQ_TOP_VALUES = 10
+FREQ_MAX_DISTINCT = 70
+FREQ_MAX_LENGTH = 70
+
+
+def _split_sql_list(strSQL):
+    # Splits on top-level commas, ignoring those inside parentheses or quotes
+    lstItems = []
+    intDepth = 0
+    chrQuote = None
+    intStart = 0
+    for i, char in enumerate(strSQL):
+        if chrQuote:
+            if char == chrQuote:
+                chrQuote = None
+        elif char in "'\"`":
+            chrQuote = char
+        elif char == "(":
+            intDepth += 1
+        elif char == ")":
+            intDepth -= 1
+        elif char == "," and intDepth == 0:
+            lstItems.append(strSQL[intStart:i])
+            intStart = i + 1
+    lstItems.append(strSQL[intStart:])
+    return [strItem.strip() for strItem in lstItems if strItem.strip()]
+
+
+def _parse_sql_literal(strLiteral):
+    if strLiteral.upper() == "NULL":
+        return None
+    if strLiteral.startswith("'"):
+        return strLiteral[1:-1].replace("''", "'")
+    if "." in strLiteral:
+        return float(strLiteral)
+    return int(strLiteral)
 
 
 class CProfilingSQL:
@@ -49,6 +102,10 @@ class CProfilingSQL:
     sampling_table = ""
     sample_ratio = ""
 
+    max_query_chars = None
+    previous_profile_run_id = ""
+    use_approx_stats = False
+
     process_id = None
 
     contingency_max_values = "4"
@@ -56,6 +113,8 @@ class CProfilingSQL:
 
     exception_message = ""
 
+    dctBatchLayouts: dict = None
+
     _data_chars_sql: CRefreshDataCharsSQL = None
     _rollup_scores_sql: CRollupScoresSQL = None
 
@@ -73,6 +132,7 @@ class CProfilingSQL:
         self.parm_vldb_flag = "N"
         self.parm_do_sample = "N"
         self.today = date_service.get_now_as_string()
+        self.dctBatchLayouts = {}
 
     def _get_data_chars_sql(self) -> CRefreshDataCharsSQL:
         if not self._data_chars_sql:
@@ -81,7 +141,7 @@ class CProfilingSQL:
                 "sql_flavor": self.flavor,
                 "table_group_schema": self.data_schema,
                 "table_groups_id": self.table_groups_id,
-                "max_query_chars": None,
+                "max_query_chars": self.max_query_chars,
                 "profiling_table_set": self.parm_table_set,
                 "profiling_include_mask": self.parm_table_include_mask,
                 "profiling_exclude_mask": self.parm_table_exclude_mask,
@@ -96,82 +156,87 @@ class CProfilingSQL:
     
         return self._rollup_scores_sql
 
-    def ReplaceParms(self, strInputString):
-        strInputString = strInputString.replace("{PROJECT_CODE}", self.project_code)
-        strInputString = strInputString.replace("{CONNECTION_ID}", self.connection_id)
-        strInputString = strInputString.replace("{TABLE_GROUPS_ID}", self.table_groups_id)
-        strInputString = strInputString.replace("{RUN_DATE}", self.run_date)
-        strInputString = strInputString.replace("{DATA_SCHEMA}", self.data_schema)
-        strInputString = strInputString.replace("{DATA_TABLE}", self.data_table)
-        strInputString = strInputString.replace("{COL_NAME}", self.col_name)
-        strInputString = strInputString.replace("{COL_NAME_SANITIZED}", self.col_name.replace("'", "''"))
-        strInputString = strInputString.replace("{COL_GEN_TYPE}", self.col_gen_type)
-        strInputString = strInputString.replace("{COL_TYPE}", self.col_type)
-        strInputString = strInputString.replace("{COL_POS}", str(self.col_ordinal_position))
-        strInputString = strInputString.replace("{TOP_FREQ}", self.col_top_freq_update)
-        strInputString = strInputString.replace("{PROFILE_RUN_ID}", self.profile_run_id)
-        strInputString = strInputString.replace("{PROFILE_ID_COLUMN_MASK}", self.profile_id_column_mask)
-        strInputString = strInputString.replace("{PROFILE_SK_COLUMN_MASK}", self.profile_sk_column_mask)
-        strInputString = strInputString.replace("{START_TIME}", self.today)
-        strInputString = strInputString.replace("{NOW}", date_service.get_now_as_string())
-        strInputString = strInputString.replace("{EXCEPTION_MESSAGE}", self.exception_message)
-        strInputString = strInputString.replace("{SAMPLING_TABLE}", self.sampling_table)
-        strInputString = strInputString.replace("{SAMPLE_SIZE}", str(self.parm_sample_size))
-        strInputString = strInputString.replace("{PROFILE_USE_SAMPLING}", self.profile_use_sampling)
-        strInputString = strInputString.replace("{PROFILE_SAMPLE_PERCENT}", self.profile_sample_percent)
-        strInputString = strInputString.replace("{PROFILE_SAMPLE_MIN_COUNT}", str(self.profile_sample_min_count))
-        strInputString = strInputString.replace("{PROFILE_SAMPLE_RATIO}", str(self.sample_ratio))
-        strInputString = strInputString.replace("{PARM_MAX_PATTERN_LENGTH}", str(self.parm_max_pattern_length))
-        strInputString = strInputString.replace("{CONTINGENCY_COLUMNS}", self.contingency_columns)
-        strInputString = strInputString.replace("{CONTINGENCY_MAX_VALUES}", self.contingency_max_values)
-        strInputString = strInputString.replace("{PROCESS_ID}", str(self.process_id))
-        strInputString = replace_templated_functions(strInputString, self.flavor.lower())
-
-        return strInputString
+    def ReplaceParms(self, strInputString, dctParmValues=None):
+        dctParms = {
+            "PROJECT_CODE": self.project_code,
+            "CONNECTION_ID": self.connection_id,
+            "TABLE_GROUPS_ID": self.table_groups_id,
+            "RUN_DATE": self.run_date,
+            "DATA_SCHEMA": self.data_schema,
+            "DATA_TABLE": self.data_table,
+            "COL_NAME": self.col_name,
+            "COL_NAME_SANITIZED": self.col_name.replace("'", "''"),
+            "COL_GEN_TYPE": self.col_gen_type,
+            "COL_TYPE": self.col_type,
+            "COL_POS": str(self.col_ordinal_position),
+            "TOP_FREQ": self.col_top_freq_update,
+            "PROFILE_RUN_ID": self.profile_run_id,
+            "PROFILE_ID_COLUMN_MASK": self.profile_id_column_mask,
+            "PROFILE_SK_COLUMN_MASK": self.profile_sk_column_mask,
+            "START_TIME": self.today,
+            "NOW": date_service.get_now_as_string(),
+            "EXCEPTION_MESSAGE": self.exception_message,
+            "SAMPLING_TABLE": self.sampling_table,
+            "SAMPLE_SIZE": str(self.parm_sample_size),
+            "PROFILE_USE_SAMPLING": self.profile_use_sampling,
+            "PROFILE_SAMPLE_PERCENT": self.profile_sample_percent,
+            "PROFILE_SAMPLE_MIN_COUNT": str(self.profile_sample_min_count),
+            "PROFILE_SAMPLE_RATIO": str(self.sample_ratio),
+            "PARM_MAX_PATTERN_LENGTH": str(self.parm_max_pattern_length),
+            "CONTINGENCY_COLUMNS": self.contingency_columns,
+            "CONTINGENCY_MAX_VALUES": self.contingency_max_values,
+            "PROCESS_ID": str(self.process_id),
+            "FREQ_TOP_VALUES": str(FREQ_TOP_VALUES),
+            "FREQ_MAX_DISTINCT": str(FREQ_MAX_DISTINCT),
+            "FREQ_MAX_LENGTH": str(FREQ_MAX_LENGTH),
+        }
+        if dctParmValues:
+            dctParms.update(dctParmValues)
+        return render_template(strInputString, dctParms, self.flavor.lower())
 
     def GetSecondProfilingColumnsQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("secondary_profiling_columns.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("secondary_profiling_columns.sql", sub_directory="profiling"))
         return strQ
 
     def GetSecondProfilingUpdateQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("secondary_profiling_update.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("secondary_profiling_update.sql", sub_directory="profiling"))
         return strQ
 
     def GetSecondProfilingStageDeleteQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("secondary_profiling_delete.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("secondary_profiling_delete.sql", sub_directory="profiling"))
         return strQ
 
     def GetDataTypeSuggestionUpdateQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("datatype_suggestions.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("datatype_suggestions.sql", sub_directory="profiling"))
         return strQ
 
     def GetFunctionalDataTypeUpdateQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("functional_datatype.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("functional_datatype.sql", sub_directory="profiling"))
         return strQ
 
     def GetFunctionalTableTypeStageQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("functional_tabletype_stage.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("functional_tabletype_stage.sql", sub_directory="profiling"))
         return strQ
 
     def GetFunctionalTableTypeUpdateQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("functional_tabletype_update.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("functional_tabletype_update.sql", sub_directory="profiling"))
         return strQ
 
     def GetPIIFlagUpdateQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("pii_flag.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("pii_flag.sql", sub_directory="profiling"))
         return strQ
 
     def GetAnomalyStatsRefreshQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("refresh_anomalies.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("refresh_anomalies.sql", sub_directory="profiling"))
         return strQ
 
     def GetAnomalyScoringRollupRunQuery(self):
@@ -182,9 +247,17 @@ class CProfilingSQL:
         # Runs on DK Postgres Server
         return self._get_rollup_scores_sql().GetRollupScoresProfileTableGroupQuery()
 
+    def GetDashboardRollupRunQuery(self):
+        # Runs on DK Postgres Server
+        return self._get_rollup_scores_sql().GetRollupDashboardProfileRunQuery()
+
+    def GetRefreshScoringTablesQuery(self):
+        # Runs on DK Postgres Server
+        return self._get_rollup_scores_sql().GetRefreshScoringTableGroupQuery()
+
     def GetAnomalyTestTypesQuery(self):
         # Runs on DK Postgres Server
-        strQ = self.ReplaceParms(read_template_sql_file("profile_anomaly_types_get.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("profile_anomaly_types_get.sql", sub_directory="profiling"))
         return strQ
 
     def GetAnomalyTestQuery(self, dct_test_type):
@@ -193,21 +266,25 @@ class CProfilingSQL:
 
         match dct_test_type["data_object"]:
             case "Column":
-                strQ = read_template_sql_file("profile_anomalies_screen_column.sql", sub_directory="profiling")
+                strQ = compile_template_sql_file("profile_anomalies_screen_column.sql", sub_directory="profiling")
             case "Multi-Col":
-                strQ = read_template_sql_file("profile_anomalies_screen_multi_column.sql", sub_directory="profiling")
+                strQ = compile_template_sql_file("profile_anomalies_screen_multi_column.sql", sub_directory="profiling")
             case "Dates":
-                strQ = read_template_sql_file("profile_anomalies_screen_table_dates.sql", sub_directory="profiling")
+                strQ = compile_template_sql_file("profile_anomalies_screen_table_dates.sql", sub_directory="profiling")
             case "Table":
-                strQ = read_template_sql_file("profile_anomalies_screen_table.sql", sub_directory="profiling")
+                strQ = compile_template_sql_file("profile_anomalies_screen_table.sql", sub_directory="profiling")
             case "Variant":
-                strQ = read_template_sql_file("profile_anomalies_screen_variants.sql", sub_directory="profiling")
+                strQ = compile_template_sql_file("profile_anomalies_screen_variants.sql", sub_directory="profiling")
 
         if strQ:
-            strQ = strQ.replace("{ANOMALY_ID}", dct_test_type["id"])
-            strQ = strQ.replace("{DETAIL_EXPRESSION}", dct_test_type["detail_expression"])
-            strQ = strQ.replace("{ANOMALY_CRITERIA}", dct_test_type["anomaly_criteria"])
-            strQ = self.ReplaceParms(strQ)
+            strQ = self.ReplaceParms(
+                strQ,
+                {
+                    "ANOMALY_ID": dct_test_type["id"],
+                    "DETAIL_EXPRESSION": dct_test_type["detail_expression"],
+                    "ANOMALY_CRITERIA": dct_test_type["anomaly_criteria"],
+                },
+            )
 
         return strQ
 
@@ -229,21 +306,21 @@ class CProfilingSQL:
     def GetCDEFlaggerQuery(self):
         # Runs on DK Postgres Server
         strQ = self.ReplaceParms(
-            read_template_sql_file("cde_flagger_query.sql", sub_directory="profiling")
+            compile_template_sql_file("cde_flagger_query.sql", sub_directory="profiling")
         )
         return strQ
 
     def GetProfileRunInfoRecordsQuery(self):
         # Runs on DK Postgres Server
         strQ = self.ReplaceParms(
-            read_template_sql_file("project_profile_run_record_insert.sql", sub_directory="profiling")
+            compile_template_sql_file("project_profile_run_record_insert.sql", sub_directory="profiling")
         )
         return strQ
 
     def GetProfileRunInfoRecordUpdateQuery(self):
         # Runs on DK Postgres Server
         strQ = self.ReplaceParms(
-            read_template_sql_file("project_profile_run_record_update.sql", sub_directory="profiling")
+            compile_template_sql_file("project_profile_run_record_update.sql", sub_directory="profiling")
         )
         return strQ
 
@@ -251,24 +328,74 @@ class CProfilingSQL:
         # Runs on Project DB
         return self._get_data_chars_sql().GetDDFQuery()
 
-    def GetProfilingQuery(self):
+    def GetRecordCountQueries(self, lstSchemaTables):
         # Runs on Project DB
+        return self._get_data_chars_sql().GetRecordCountQueries(lstSchemaTables)
+
+    def GetTableChangeSignalsQuery(self):
+        # Runs on Project DB -- only for flavors exposing cheap last-modified or statistics metadata
+        try:
+            strQ = compile_template_sql_file(
+                f"project_table_change_signals_{self.flavor}.sql", sub_directory=f"flavors/{self.flavor.lower()}/profiling"
+            )
+        except ValueError:
+            return None
+        return self.ReplaceParms(strQ)
+
+    def GetApproxStatsSupportQuery(self):
+        # Runs on Project DB -- only for flavors whose estimating functions depend on an optional extension
+        try:
+            strQ = compile_template_sql_file(
+                f"project_approx_stats_support_{self.flavor}.sql", sub_directory=f"flavors/{self.flavor.lower()}/profiling"
+            )
+        except ValueError:
+            return None
+        return self.ReplaceParms(strQ)
+
+    def GetApproxEstimatedFields(self):
+        # Fields computed by estimating functions in approximate mode, for non-numeric and numeric columns
+        lstFields = ["distinct_value_ct"]
+        lstFieldsN = lstFields + ["percentile_25", "percentile_50", "percentile_75"]
+        if "strTemplate99_N_approx" not in self._GetProfilingSnippetTemplate():
+            lstFieldsN = lstFields
+        return ",".join(lstFields), ",".join(lstFieldsN)
+
+    def UpdateProfileResultsToApproxEst(self):
+        # Runs on DK Postgres Server
+        strFields, strFieldsN = self.GetApproxEstimatedFields()
+        strQ = compile_template_sql_file(
+            "project_update_profile_results_to_approx_estimates.sql", sub_directory="profiling"
+        )
+        return self.ReplaceParms(strQ, {"ESTIMATED_FIELDS": strFields, "ESTIMATED_FIELDS_N": strFieldsN})
+
+    def GetPreviousTableSignaturesQuery(self):
+        # Runs on DK Postgres Server
+        strQ = self.ReplaceParms(compile_template_sql_file("profile_table_signatures_get.sql", sub_directory="profiling"))
+        return strQ
+
+    def GetProfileResultsCarryForwardQuery(self, lstReusedTables):
+        # Runs on DK Postgres Server
+        strQ = self.ReplaceParms(
+            compile_template_sql_file("profile_results_carry_forward.sql", sub_directory="profiling"),
+            {
+                "PREVIOUS_PROFILE_RUN_ID": self.previous_profile_run_id,
+                "REUSED_TABLES": ", ".join("'" + strTable.replace("'", "''") + "'" for strTable in lstReusedTables),
+            },
+        )
+        return strQ
+
+    def _GetProfilingSnippetTemplate(self):
         if not self.dctSnippetTemplate:
             self.dctSnippetTemplate = read_template_yaml_file(
                 f"project_profiling_query_{self.flavor.lower()}.yaml", sub_directory=f"flavors/{self.flavor.lower()}/profiling"
             )
+        return self.dctSnippetTemplate
 
-        dctSnippetTemplate = self.dctSnippetTemplate
+    def _GetProfilingSelectTemplate(self):
+        dctSnippetTemplate = self._GetProfilingSnippetTemplate()
 
-        # Assemble in function
-        strQ = ""
-
-        if self.parm_do_sample == "Y":
-            strQ += dctSnippetTemplate["strTemplate01_sampling"]
-        else:
-            strQ += dctSnippetTemplate["strTemplate01_else"]
-
-        strQ += dctSnippetTemplate["strTemplate02_all"]
+        # Assemble select list for current column
+        strQ = dctSnippetTemplate["strTemplate02_all"]
 
         if self.col_gen_type in ["A", "D", "N"]:
             strQ += dctSnippetTemplate["strTemplate03_ADN"]
@@ -327,13 +454,38 @@ class CProfilingSQL:
 
         strQ += dctSnippetTemplate["strTemplate16_ALL"]
 
+        if self.use_approx_stats:
+            strQ = DISTINCT_CT_PATTERN.sub(r"<%APPROX_COUNT_DISTINCT;\1%>\2", strQ)
+
+        return strQ
+
+    def _GetPercentileJoinTemplate(self):
+        dctSnippetTemplate = self._GetProfilingSnippetTemplate()
+        if self.use_approx_stats and "strTemplate99_N_approx" in dctSnippetTemplate:
+            return dctSnippetTemplate["strTemplate99_N_approx"]
+        return dctSnippetTemplate["strTemplate99_N"]
+
+    def GetProfilingQuery(self):
+        # Runs on Project DB
+        dctSnippetTemplate = self._GetProfilingSnippetTemplate()
+
+        # Assemble in function
+        strQ = ""
+
+        if self.parm_do_sample == "Y":
+            strQ += dctSnippetTemplate["strTemplate01_sampling"]
+        else:
+            strQ += dctSnippetTemplate["strTemplate01_else"]
+
+        strQ += self._GetProfilingSelectTemplate()
+
         if self.parm_do_sample == "Y":
             strQ += dctSnippetTemplate["strTemplate98_sampling"]
         else:
             strQ += dctSnippetTemplate["strTemplate98_else"]
 
         if self.col_gen_type == "N":
-            strQ += dctSnippetTemplate["strTemplate99_N"]
+            strQ += self._GetPercentileJoinTemplate()
         else:
             strQ += dctSnippetTemplate["strTemplate99_else"]
 
@@ -344,10 +496,139 @@ class CProfilingSQL:
 
         return strQ
 
+    def GetProfilingBatchColumn(self):
+        # Runs on Project DB
+        # Returns the current column's share of a table-level profiling query
+        strSelect = self._GetProfilingSelectTemplate()
+        strJoin = ""
+        if self.col_gen_type == "N":
+            # Percentile subquery is cross-joined once per numeric column, so its aliases must be unique
+            strJoin = self._GetPercentileJoinTemplate()
+            strSelect = PERCENTILE_ALIAS_PATTERN.sub(r"\1_{COL_POS}", strSelect)
+            strJoin = PERCENTILE_ALIAS_PATTERN.sub(r"\1_{COL_POS}", strJoin)
+
+        lstItems = []
+        for strItem in _split_sql_list(self.ReplaceParms(strSelect)):
+            match = SELECT_ALIAS_PATTERN.match(strItem)
+            if not match:
+                raise ValueError(f"Profiling template item has no alias: {strItem}")
+            strExpression, strAlias = match.groups()
+            lstItems.append((strAlias.lower(), strExpression))
+
+        return {
+            "table": f"{self.data_schema}.{self.data_table}",
+            "position": self.col_ordinal_position,
+            "items": lstItems,
+            "join": self.ReplaceParms(strJoin),
+        }
+
+    def GetProfilingBatchQueries(self, lstBatchColumns, max_query_chars=None, max_columns=None):
+        # Runs on Project DB
+        # Assembles one wide aggregate query per chunk of columns from the same table,
+        #   using the table-level sampling parms currently set
+        dctSnippetTemplate = self._GetProfilingSnippetTemplate()
+
+        if self.parm_do_sample == "Y":
+            strHead = self.ReplaceParms(dctSnippetTemplate["strTemplate01_sampling"])
+            strFrom = self.ReplaceParms(dctSnippetTemplate["strTemplate98_sampling"])
+            strTail = self.ReplaceParms(
+                dctSnippetTemplate["strTemplate99_else"] + dctSnippetTemplate["strTemplate100_sampling"]
+            )
+        else:
+            strHead = self.ReplaceParms(dctSnippetTemplate["strTemplate01_else"])
+            strFrom = self.ReplaceParms(dctSnippetTemplate["strTemplate98_else"])
+            strTail = self.ReplaceParms(dctSnippetTemplate["strTemplate99_else"])
+
+        lstChunks = []
+        lstChunk = []
+        intChunkChars = 0
+        for dctColumn in lstBatchColumns:
+            lstSelect = [
+                f"{strExpression} AS c{dctColumn['position']}_{strAlias}"
+                for strAlias, strExpression in dctColumn["items"]
+                if not SQL_LITERAL_PATTERN.match(strExpression)
+            ]
+            intColumnChars = sum(len(strItem) + 2 for strItem in lstSelect) + len(dctColumn["join"])
+            if lstChunk and (
+                (max_query_chars and intChunkChars + intColumnChars > max_query_chars)
+                or (max_columns and len(lstChunk) >= max_columns)
+            ):
+                lstChunks.append(lstChunk)
+                lstChunk = []
+                intChunkChars = 0
+            lstChunk.append((dctColumn, lstSelect))
+            intChunkChars += intColumnChars
+        if lstChunk:
+            lstChunks.append(lstChunk)
+
+        lstQueries = []
+        for lstChunk in lstChunks:
+            intBatchId = len(self.dctBatchLayouts) + 1
+            lstSelect = [f"{intBatchId} AS profile_batch_id"]
+            strJoins = ""
+            lstLayout = []
+            for dctColumn, lstColumnSelect in lstChunk:
+                lstSelect.extend(lstColumnSelect)
+                strJoins += dctColumn["join"]
+                lstLayout.append(
+                    [
+                        (strAlias, _parse_sql_literal(strExpression) if SQL_LITERAL_PATTERN.match(strExpression) else QUERIED)
+                        for strAlias, strExpression in dctColumn["items"]
+                    ]
+                )
+            self.dctBatchLayouts[intBatchId] = lstLayout
+            lstQueries.append(strHead + ",\n".join(lstSelect) + strFrom + strJoins + strTail)
+
+        return lstQueries
+
+    def UnpivotProfilingBatchResults(self, lstBatchRows):
+        # Splits wide table-level result rows back into one profile_results row per column
+        lstProfiles = []
+        colNames = []
+        for row in lstBatchRows:
+            lstValues = iter(row[1:])
+            for lstLayout in self.dctBatchLayouts[int(row[0])]:
+                if not colNames:
+                    colNames = [strAlias for strAlias, _ in lstLayout]
+                lstProfiles.append(
+                    [next(lstValues) if value is QUERIED else value for _, value in lstLayout]
+                )
+        return lstProfiles, colNames
+
+    def GetFrequencyProfilingQueries(self, lstColumnNames, max_columns=None):
+        # Runs on Project DB -- one grouped scan per table, or per chunk of its columns, instead of one per column,
+        # returning the same rows as GetSecondProfilingQuery
+        clsTemplate = compile_template_sql_file("frequency_profiling_query.sql", sub_directory="flavors/generic/profiling")
+        chrQuote = "`" if self.flavor == "databricks" else '"'
+        intChunkSize = max_columns or len(lstColumnNames)
+
+        lstQueries = []
+        for i in range(0, len(lstColumnNames), intChunkSize):
+            lstChunk = lstColumnNames[i : i + intChunkSize]
+            lstQuoted = [f"{chrQuote}{strColumn}{chrQuote}" for strColumn in lstChunk]
+            strNameCases = " ".join(
+                f"WHEN GROUPING({strQuoted}) = 0 THEN '" + strColumn.replace("'", "''") + "'"
+                for strColumn, strQuoted in zip(lstChunk, lstQuoted, strict=True)
+            )
+            strValueCases = " ".join(f"WHEN GROUPING({strQuoted}) = 0 THEN {strQuoted}" for strQuoted in lstQuoted)
+            strGroupingSets = ", ".join(f"({strQuoted})" for strQuoted in lstQuoted)
+
+            lstQueries.append(
+                self.ReplaceParms(
+                    clsTemplate,
+                    {
+                        "FREQ_NAME_CASES": strNameCases,
+                        "FREQ_VALUE_CASES": strValueCases,
+                        "FREQ_GROUPING_SETS": strGroupingSets,
+                    },
+                )
+            )
+        return lstQueries
+
     def GetSecondProfilingQuery(self):
         # Runs on Project DB
         strQ = self.ReplaceParms(
-            read_template_sql_file(
+            compile_template_sql_file(
                 f"project_secondary_profiling_query_{self.flavor}.sql", sub_directory=f"flavors/{self.flavor.lower()}/profiling"
             )
         )
@@ -356,25 +637,25 @@ class CProfilingSQL:
     def GetTableSampleCount(self):
         # Runs on Project DB
         strQ = self.ReplaceParms(
-            read_template_sql_file("project_get_table_sample_count.sql", sub_directory="profiling")
+            compile_template_sql_file("project_get_table_sample_count.sql", sub_directory="profiling")
         )
         return strQ
 
     def GetContingencyColumns(self):
         # Runs on Project DB
-        strQ = self.ReplaceParms(read_template_sql_file("contingency_columns.sql", sub_directory="profiling"))
+        strQ = self.ReplaceParms(compile_template_sql_file("contingency_columns.sql", sub_directory="profiling"))
         return strQ
 
     def GetContingencyCounts(self):
         # Runs on Project DB
         strQ = self.ReplaceParms(
-            read_template_sql_file("contingency_counts.sql", sub_directory="flavors/generic/profiling")
+            compile_template_sql_file("contingency_counts.sql", sub_directory="flavors/generic/profiling")
         )
         return strQ
 
     def UpdateProfileResultsToEst(self):
         # Runs on Project DB
         strQ = self.ReplaceParms(
-            read_template_sql_file("project_update_profile_results_to_estimates.sql", sub_directory="profiling")
+            compile_template_sql_file("project_update_profile_results_to_estimates.sql", sub_directory="profiling")
         )
         return strQ
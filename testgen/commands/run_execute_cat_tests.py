@@ -5,8 +5,7 @@ from testgen.commands.run_refresh_score_cards_results import run_refresh_score_c
 from testgen.common import (
     RetrieveDBResultsToDictList,
     RunActionQueryList,
-    RunThreadedRetrievalQueryList,
-    WriteListToDB,
+    RunThreadedRetrievalQueryListToDB,
     date_service,
 )
 
@@ -66,10 +65,13 @@ def FinalizeTestRun(clsCATExecute: CCATExecutionSQL):
                   clsCATExecute.FinalizeTestSuiteUpdateSQL(),
                   clsCATExecute.CalcPrevalenceTestResultsSQL(),
                   clsCATExecute.TestScoringRollupRunSQL(),
-                  clsCATExecute.TestScoringRollupTableGroupSQL()]
+                  clsCATExecute.TestScoringRollupTableGroupSQL(),
+                  clsCATExecute.DashboardRollupRunSQL(),
+                  clsCATExecute.RefreshScoringTablesSQL()]
     RunActionQueryList(("DKTG"), lstQueries)
     run_refresh_score_cards_results(
         project_code=clsCATExecute.project_code,
+        table_group_id=clsCATExecute.table_groups_id,
         add_history_entry=True,
         refresh_date=date_service.parse_now(clsCATExecute.run_date),
     )
@@ -94,8 +96,6 @@ def run_cat_test_queries(
     if spinner:
         spinner.next()
 
-    lstAllResults = []
-
     try:
         # Retrieve distinct target tables from metadata
         LOG.info("CurrentStep: Retrieving Target Tables")
@@ -114,15 +114,13 @@ def run_cat_test_queries(
 
             lstCATQueries = PrepCATQueries(clsCATExecute, lstCATParms)
             if lstCATQueries:
-                LOG.info("CurrentStep: Performing CAT Tests")
-                lstAllResults, lstResultColumnNames, intErrors = RunThreadedRetrievalQueryList(
-                    "PROJECT", lstCATQueries, dctParms["max_threads"]
+                LOG.info("CurrentStep: Performing CAT Tests and Saving Results")
+                # Write aggregate result records to aggregate result table at dk db as they are fetched
+                intResultCount, _, intErrors = RunThreadedRetrievalQueryListToDB(
+                    "PROJECT", lstCATQueries, dctParms["max_threads"], "DKTG", "working_agg_cat_results"
                 )
 
-                if lstAllResults:
-                    LOG.info("CurrentStep: Saving CAT Results")
-                    # Write aggregate result records to aggregate result table at dk db
-                    WriteListToDB("DKTG", lstAllResults, lstResultColumnNames, "working_agg_cat_results")
+                if intResultCount:
                     LOG.info("CurrentStep: Parsing CAT Results")
                     ParseCATResults(clsCATExecute)
                     LOG.info("Test results successfully parsed.")
@@ -13,11 +13,10 @@ from testgen.common import (
     RetrieveDBResultsToDictList,
     RetrieveTestExecParms,
     RunActionQueryList,
-    RunThreadedRetrievalQueryList,
-    WriteListToDB,
+    RunThreadedRetrievalQueryListToDB,
     date_service,
 )
-from testgen.common.database.database_service import empty_cache
+from testgen.common.read_file import get_template_cache_stats
 
 from .run_execute_cat_tests import run_cat_test_queries
 from .run_refresh_data_chars import run_refresh_data_chars_queries
@@ -64,16 +63,11 @@ def run_test_queries(dctParms, strTestRunID, strTestTime, strProjectCode, strTes
                 if spinner:
                     spinner.next()
 
-            # Execute list, returning test results
-            LOG.info("CurrentStep: Executing Non-CAT Test Queries")
-            lstTestResults, colResultNames, intErrors = RunThreadedRetrievalQueryList(
-                "PROJECT", lstTestQueries, dctParms["max_threads"]
+            # Execute list, streaming test results to DK DB as they are fetched
+            LOG.info("CurrentStep: Executing Non-CAT Test Queries and Saving Results")
+            _, _, intErrors = RunThreadedRetrievalQueryListToDB(
+                "PROJECT", lstTestQueries, dctParms["max_threads"], "DKTG", "test_results"
             )
-
-            # Copy test results to DK DB
-            LOG.info("CurrentStep: Saving Non-CAT Test Results")
-            if lstTestResults:
-                WriteListToDB("DKTG", lstTestResults, colResultNames, "test_results")
             if intErrors > 0:
                 booErrors = True
                 error_msg = (
@@ -101,7 +95,6 @@ def run_execution_steps_in_background(project_code, test_suite):
     msg = f"Starting run_execution_steps_in_background against test suite: {test_suite}"
     if settings.IS_DEBUG:
         LOG.info(msg + ". Running in debug mode (new thread instead of new process).")
-        empty_cache()
         background_thread = threading.Thread(
             target=run_execution_steps,
             args=(
@@ -147,6 +140,11 @@ def run_execution_steps(project_code: str, test_suite: str, minutes_offset: int=
         test_exec_params["private_key_passphrase"],
         test_exec_params["http_path"],
         "PROJECT",
+        max_threads=test_exec_params["max_threads"],
+        min_threads=test_exec_params["min_threads"],
+        pool_max_overflow=test_exec_params["pool_max_overflow"],
+        pool_pre_ping=test_exec_params["pool_pre_ping"],
+        pool_recycle=test_exec_params["pool_recycle"],
     )
 
     try:
@@ -175,4 +173,5 @@ def run_execution_steps(project_code: str, test_suite: str, minutes_offset: int=
     else:
         error_status = "successfully."
     message = f"Test Execution completed {error_status}"
+    LOG.debug("Query template cache: %s", get_template_cache_stats())
     return message
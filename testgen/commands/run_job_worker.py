@@ -0,0 +1,234 @@
+import logging
+import os
+import socket
+import subprocess
+import time
+import uuid
+
+import psutil
+
+from testgen import settings
+from testgen.common import RetrieveDBResultsToDictList, RunActionQueryList, read_template_sql_file
+
+LOG = logging.getLogger("testgen")
+
+JOB_TYPE_PROFILE = "profile"
+JOB_TYPE_TEST = "test"
+
+# Seconds two readings of a process's start time may differ by and still belong to the same process
+PROCESS_START_TIME_TOLERANCE = 0.5
+
+
+def _get_job_queue_query(template_file_name, dct_parms):
+    str_query = read_template_sql_file(template_file_name, "job_queue")
+    for key, value in dct_parms.items():
+        str_query = str_query.replace("{" + key + "}", str(value))
+    return str_query
+
+
+def _enqueue_job(job_type, table_groups_id="", project_code="", test_suite=""):
+    if table_groups_id:
+        # Raises ValueError for anything but a UUID, so the value is safe to place in the query
+        table_groups_id = str(uuid.UUID(str(table_groups_id)))
+    str_query = _get_job_queue_query(
+        "job_queue_insert.sql",
+        {
+            "JOB_TYPE": job_type,
+            "TABLE_GROUPS_ID": table_groups_id,
+            "PROJECT_CODE": project_code.replace("'", "''"),
+            "TEST_SUITE": test_suite.replace("'", "''"),
+        },
+    )
+    lst_ids = RunActionQueryList("DKTG", [str_query])
+    if not lst_ids or not lst_ids[0]:
+        raise ValueError(f"Cannot queue {job_type} job: table group or test suite not found")
+    return str(lst_ids[0])
+
+
+def enqueue_profiling_job(table_groups_id):
+    return _enqueue_job(JOB_TYPE_PROFILE, table_groups_id=table_groups_id)
+
+
+def enqueue_test_job(project_code, test_suite):
+    return _enqueue_job(JOB_TYPE_TEST, project_code=project_code, test_suite=test_suite)
+
+
+def get_job(job_id):
+    lst_jobs = RetrieveDBResultsToDictList("DKTG", _get_job_queue_query("job_queue_get.sql", {"JOB_ID": job_id}))
+    return dict(lst_jobs[0]) if lst_jobs else None
+
+
+def _get_job_command(dct_job):
+    # Jobs run as regular CLI commands, so they record their own process ids and can be canceled as usual
+    if dct_job["job_type"] == JOB_TYPE_PROFILE:
+        return ["testgen", "run-profile", "-tg", str(dct_job["table_groups_id"])]
+    return ["testgen", "run-tests", "--project-key", dct_job["project_code"], "--test-suite-key", dct_job["test_suite"]]
+
+
+def _finish_job(job_id, str_status, str_message=""):
+    RunActionQueryList(
+        "DKTG",
+        [
+            _get_job_queue_query(
+                "job_queue_finish.sql",
+                {"JOB_ID": job_id, "JOB_STATUS": str_status, "MESSAGE": str_message.replace("'", "''")},
+            )
+        ],
+    )
+
+
+def _finish_exited_job(job_id, returncode=None):
+    # The exit code is unknown for processes started by another worker
+    if returncode is not None and returncode != 0:
+        _finish_job(job_id, "Error", f"Job process exited with code {returncode}")
+        return
+
+    # Profiling and test runs log their own failures and still exit normally
+    lst_runs = RetrieveDBResultsToDictList(
+        "DKTG", _get_job_queue_query("job_queue_get_run_status.sql", {"JOB_ID": job_id})
+    )
+    if not lst_runs:
+        _finish_job(job_id, "Error", "Job process exited without recording a run")
+    elif lst_runs[0]["status"] != "Complete":
+        _finish_job(job_id, "Error", lst_runs[0]["log_message"] or f"Run ended with status {lst_runs[0]['status']}")
+    else:
+        _finish_job(job_id, "Complete")
+
+
+def _get_process(pid, start_time):
+    # A pid can be reused once its process exits, so the process only counts if its start time matches too
+    if not pid or start_time is None:
+        return None
+    try:
+        process = psutil.Process(pid)
+        if (
+            abs(process.create_time() - start_time) < PROCESS_START_TIME_TOLERANCE
+            and process.status() != psutil.STATUS_ZOMBIE
+        ):
+            return process
+    except psutil.Error:
+        pass
+    return None
+
+
+def _poll_process(process):
+    """
+    Returns whether a job process exited and, for processes this worker started, its exit code
+    """
+    if isinstance(process, subprocess.Popen):
+        return process.poll() is not None, process.returncode
+    try:
+        is_running = process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        is_running = False
+    return not is_running, None
+
+
+def _recover_worker_jobs(str_host, worker_id, worker_start_time):
+    """
+    Settles the running jobs of stopped workers on this host, and adopts those whose process survived the worker.
+    Jobs of workers that are still running are left to them. Returns the adopted job processes by job id.
+    """
+    dct_adopted = {}
+    str_query = _get_job_queue_query("job_queue_get_worker_jobs.sql", {"WORKER_HOST": str_host})
+    for dct_job in RetrieveDBResultsToDictList("DKTG", str_query):
+        job_id = str(dct_job["id"])
+        str_pid = dct_job["worker_id"].rsplit(":", 1)[-1]
+        if str_pid.isdigit() and _get_process(int(str_pid), dct_job["worker_start_time"]):
+            continue
+
+        process = _get_process(dct_job["process_id"], dct_job["process_start_time"])
+        if process:
+            str_query = _get_job_queue_query(
+                "job_queue_adopt.sql",
+                {
+                    "JOB_ID": job_id,
+                    "WORKER_ID": worker_id,
+                    "WORKER_START_TIME": worker_start_time,
+                    "PREVIOUS_WORKER_ID": dct_job["worker_id"],
+                },
+            )
+            # Another worker starting on this host at the same time may have adopted it first
+            lst_ids = RunActionQueryList("DKTG", [str_query])
+            if lst_ids and lst_ids[0]:
+                LOG.info("Job %s adopted from stopped worker %s: process %s", job_id, dct_job["worker_id"], process.pid)
+                dct_adopted[job_id] = process
+        elif not dct_job["process_id"]:
+            LOG.warning("Job %s was abandoned by a stopped worker before it started", job_id)
+            _finish_job(job_id, "Error", "Worker stopped before the job started")
+        else:
+            LOG.warning("Job %s process ended while its worker was stopped", job_id)
+            _finish_exited_job(job_id)
+    return dct_adopted
+
+
+def _claim_job(worker_id, worker_start_time, max_jobs, max_jobs_per_connection):
+    str_query = _get_job_queue_query(
+        "job_queue_claim.sql",
+        {
+            "WORKER_ID": worker_id,
+            "WORKER_START_TIME": worker_start_time,
+            "MAX_JOBS": max_jobs,
+            "MAX_JOBS_PER_CONNECTION": max_jobs_per_connection,
+        },
+    )
+    lst_ids = RunActionQueryList("DKTG", [str_query])
+    return str(lst_ids[0]) if lst_ids and lst_ids[0] else None
+
+
+def run_job_worker(max_jobs=None, max_jobs_per_connection=None, poll_seconds=None, run_once=False):
+    """
+    Polls the job queue, running claimed jobs as separate testgen processes within the global and
+    per-connection limits. Limits are enforced across all workers sharing the application database.
+    """
+    max_jobs = max_jobs or settings.JOB_WORKER_MAX_JOBS
+    max_jobs_per_connection = max_jobs_per_connection or settings.JOB_WORKER_MAX_JOBS_PER_CONNECTION
+    poll_seconds = settings.JOB_WORKER_POLL_SECONDS if poll_seconds is None else poll_seconds
+
+    str_host = socket.gethostname()
+    worker_id = f"{str_host}:{os.getpid()}"
+    worker_start_time = psutil.Process().create_time()
+    LOG.info("Job worker %s started: max %s jobs, %s per connection", worker_id, max_jobs, max_jobs_per_connection)
+
+    # Job processes, started here or adopted from a stopped worker, by job id
+    dct_running = _recover_worker_jobs(str_host, worker_id, worker_start_time)
+    try:
+        while True:
+            for job_id, process in list(dct_running.items()):
+                has_exited, returncode = _poll_process(process)
+                if has_exited:
+                    del dct_running[job_id]
+                    _finish_exited_job(job_id, returncode)
+                    LOG.info("Job %s finished with exit code %s", job_id, returncode)
+
+            while len(dct_running) < max_jobs:
+                job_id = _claim_job(worker_id, worker_start_time, max_jobs, max_jobs_per_connection)
+                if not job_id:
+                    break
+                dct_job = get_job(job_id)
+                try:
+                    process = subprocess.Popen(_get_job_command(dct_job))  # NOQA S603
+                except OSError as e:
+                    LOG.exception("Job %s could not be started", job_id)
+                    _finish_job(job_id, "Error", f"Job process could not be started: {e}")
+                    continue
+                dct_running[job_id] = process
+                # The child isn't reaped until polled, so its pid can't have been reused yet
+                str_query = _get_job_queue_query(
+                    "job_queue_start.sql",
+                    {
+                        "JOB_ID": job_id,
+                        "PROCESS_ID": process.pid,
+                        "PROCESS_START_TIME": psutil.Process(process.pid).create_time(),
+                    },
+                )
+                RunActionQueryList("DKTG", [str_query])
+                LOG.info("Job %s started: %s job, process %s", job_id, dct_job["job_type"], process.pid)
+
+            if run_once and not dct_running:
+                break
+            time.sleep(poll_seconds)
+    finally:
+        # Running jobs are left to finish; a restarted worker adopts them, or settles them if their process is gone
+        if dct_running:
+            LOG.warning("Job worker %s stopped with %s jobs still running", worker_id, len(dct_running))
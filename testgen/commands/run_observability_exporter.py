@@ -1,8 +1,14 @@
+import concurrent.futures
+import gzip
+import itertools
 import json
 import logging
 import sys
+import threading
+import time
 import uuid
 from collections import namedtuple
+from functools import partial
 from urllib.parse import urlparse
 
 import click
@@ -24,46 +30,172 @@ DEFAULT_COMPONENT_TYPE = "dataset"
 PAYLOAD_MAX_SIZE = 100000
 PAYLOAD_MAX_ITEMS = 500
 
+REQUEST_TIMEOUT = 60
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF_SECONDS = 1
 
-def calculate_chunk_size(test_outcomes):
-    size = len(json.dumps(test_outcomes))
-    split = size / PAYLOAD_MAX_SIZE * 2
-    chunk_size = int(round(len(test_outcomes) / split))
-    return min(PAYLOAD_MAX_ITEMS, chunk_size)
 
+def chunk_test_outcomes(test_outcomes):
+    """
+    Groups (outcome, result_id) pairs into chunks of serialized outcomes and their result ids. A chunk holds
+    at most PAYLOAD_MAX_ITEMS outcomes, and at most PAYLOAD_MAX_SIZE bytes unless a single outcome is larger.
+    """
+    chunk, chunk_ids, chunk_size = [], [], 0
+    for outcome, result_id in test_outcomes:
+        serialized = json.dumps(outcome).encode()
+        if chunk and (len(chunk) == PAYLOAD_MAX_ITEMS or chunk_size + len(serialized) + 1 > PAYLOAD_MAX_SIZE):
+            yield chunk, chunk_ids
+            chunk, chunk_ids, chunk_size = [], [], 0
+        chunk.append(serialized)
+        chunk_ids.append(result_id)
+        chunk_size += len(serialized) + 1
+    if chunk:
+        yield chunk, chunk_ids
 
-def post_event(event_type, payload, api_url, api_key, test_outcomes, is_test=False):
-    qty_of_events = len(test_outcomes)
-    if not is_test and qty_of_events == 0:
-        click.echo("Nothing to be sent to Observability")
-        return qty_of_events
-
-    def chunkify(collection, chunk_size):
-        return [collection[i : i + chunk_size] for i in range(0, len(collection), chunk_size)]
 
-    if not is_test:
-        chunk_size = calculate_chunk_size(test_outcomes)
-        chunks = chunkify(test_outcomes, chunk_size)
-    else:
-        chunks = [[]]
+def _get_body_prefix(payload):
+    event = {key: value for key, value in payload.items() if key != "test_outcomes"}
+    return json.dumps(event)[:-1].encode() + (b", " if event else b"") + b'"test_outcomes": ['
 
-    session = get_session()
 
-    url = _get_api_endpoint(api_url, event_type)
+def _get_headers(api_key):
     headers = {
         "Content-Type": "application/json",
         "ServiceAccountAuthenticationKey": api_key,
     }
-    for chunk in chunks:
-        payload["test_outcomes"] = chunk
-        response = session.post(url, headers=headers, json=payload, verify=settings.OBSERVABILITY_VERIFY_SSL)
-        if not response.ok:
-            if is_test and "test_outcomes" in response.text and "Length must be between 1 and 500" in response.text:
+    if settings.OBSERVABILITY_EXPORT_GZIP:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def _get_session():
+    # Requests are retried by _post_chunk, so the session's own adapter must not retry them as well
+    session = get_session()
+    adapter = requests.adapters.HTTPAdapter(max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _post_chunk(session, url, headers, body):
+    if settings.OBSERVABILITY_EXPORT_GZIP:
+        body = gzip.compress(body)
+
+    retries = settings.OBSERVABILITY_EXPORT_RETRIES
+    for attempt in range(retries + 1):
+        try:
+            response = session.post(
+                url, headers=headers, data=body, verify=settings.OBSERVABILITY_VERIFY_SSL, timeout=REQUEST_TIMEOUT
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                return response
+            reason = f"status code {response.status_code}"
+
+        delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+        LOG.warning(f"Call to {url} failed with {reason}, retrying in {delay} seconds")
+        time.sleep(delay)
+
+
+def post_chunks(event_type, payload, api_url, api_key, chunks, on_chunk_posted=None):
+    """
+    Posts the chunks from `chunk_test_outcomes` with at most OBSERVABILITY_EXPORT_MAX_IN_FLIGHT requests
+    in flight, calling `on_chunk_posted` with the result ids of each chunk the API accepted.
+    Chunks are only consumed as requests complete, so they can be produced lazily.
+    Returns the number of posted outcomes.
+    """
+    chunks = iter(chunks)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return 0
+    chunks = itertools.chain([first_chunk], chunks)
+
+    url = _get_api_endpoint(api_url, event_type)
+    headers = _get_headers(api_key)
+
+    # Sessions aren't thread-safe, so each worker thread posts through its own
+    thread_local = threading.local()
+    sessions = []
+
+    def open_session():
+        thread_local.session = _get_session()
+        sessions.append(thread_local.session)
+
+    def post(body):
+        return _post_chunk(thread_local.session, url, headers, body)
+
+    body_prefix = _get_body_prefix(payload)
+    max_in_flight = max(1, settings.OBSERVABILITY_EXPORT_MAX_IN_FLIGHT)
+    in_flight = {}
+    qty_of_events = 0
+
+    def acknowledge(done):
+        nonlocal qty_of_events
+        error = None
+        for future in done:
+            result_ids = in_flight.pop(future)
+            try:
+                response = future.result()
+            except requests.RequestException as e:
+                error = error or e
                 continue
-            else:
-                raise requests.HTTPError(
+            if not response.ok:
+                error = error or requests.HTTPError(
                     f"Call to {url} failed with status code: {response.status_code} and message: {response.text}"
                 )
+                continue
+            qty_of_events += len(result_ids)
+            if on_chunk_posted:
+                on_chunk_posted(result_ids)
+        return error
+
+    error = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, initializer=open_session) as executor:
+        for outcomes, result_ids in chunks:
+            if len(in_flight) >= max_in_flight:
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                error = acknowledge(done)
+                if error:
+                    break
+            body = body_prefix + b", ".join(outcomes) + b"]}"
+            in_flight[executor.submit(post, body)] = result_ids
+
+        # Chunks already sent are still acknowledged when a previous one failed
+        done, _ = concurrent.futures.wait(in_flight)
+        error = acknowledge(done) or error
+
+    for session in sessions:
+        session.close()
+
+    if error:
+        raise error
+    return qty_of_events
+
+
+def post_event(event_type, payload, api_url, api_key, test_outcomes, is_test=False):
+    qty_of_events = len(test_outcomes)
+    if not is_test and qty_of_events == 0:
+        click.echo("Nothing to be sent to Observability")
+        return qty_of_events
+
+    if not is_test:
+        return post_chunks(
+            event_type, payload, api_url, api_key, chunk_test_outcomes((outcome, None) for outcome in test_outcomes)
+        )
+
+    url = _get_api_endpoint(api_url, event_type)
+    headers = _get_headers(api_key)
+    response = _post_chunk(_get_session(), url, headers, _get_body_prefix(payload) + b"]}")
+    if not response.ok and not (
+        "test_outcomes" in response.text and "Length must be between 1 and 500" in response.text
+    ):
+        raise requests.HTTPError(
+            f"Call to {url} failed with status code: {response.status_code} and message: {response.text}"
+        )
     return qty_of_events
 
 
@@ -206,54 +338,69 @@ def _get_processed_profiling_table_set(profiling_table_set):
     return items_remove_blank
 
 
-def collect_test_results(test_suite_id, max_qty_events):
-    try:
-        query = (
-            read_template_sql_file("get_test_results.sql", "observability")
-            .replace("{TEST_SUITE_ID}", test_suite_id)
-            .replace("{MAX_QTY_EVENTS}", str(max_qty_events))
-        )
-        query_results = RetrieveDBResultsToDictList("DKTG", query)
-        collected = []
-        updated_ids = []
-    except Exception:
-        LOG.exception("Error collecting test results! EXITING!")
-        sys.exit(2)
-    for result in query_results:
+def iter_test_results(test_suite_id, page_size):
+    """
+    Yields (outcome, result_id) pairs for the suite's queued results, reading them in pages of `page_size`
+    """
+    # Pages follow the export order, start time then result id, with results lacking a start time last
+    last_start_time = "-infinity"
+    last_result_id = 0
+    qty_of_results = 0
+    while True:
         try:
-            result_payload = {
-                "integrations": {
-                    "testgen": {
-                        "columns": result.column_names.split(",") if result.column_names is not None else [],
-                        "table": result.table_name,
-                        "test_suite": result.test_suite,
-                        "test_parameters": _get_input_parameters(result.input_parameters),
-                        "version": 1,
-                    }
-                },
-                "key": str(result.test_definition_id),
-                "type": result.type,
-                "min_threshold": result.min_threshold,
-                "max_threshold": result.max_threshold,
-                "name": result.name,
-                "description": result.description,
-                "metadata": {},
-                "start_time": date_service.as_iso_timestamp(result.start_time),
-                "result": result.result_message,
-                "end_time": date_service.as_iso_timestamp(result.end_time),
-                "dimensions": [result.dq_dimension],
-                "status": result.result_status.upper(),
-                "metric_value": result.metric_value,
-                "metric_name": result.measure_uom,
-                "metric_description": result.measure_uom_description,
-            }
-
-            collected.append(result_payload)
-            updated_ids.append(str(result.result_id))
+            query = (
+                read_template_sql_file("get_test_results.sql", "observability")
+                .replace("{TEST_SUITE_ID}", test_suite_id)
+                .replace("{AFTER_START_TIME}", last_start_time)
+                .replace("{AFTER_RESULT_ID}", str(last_result_id))
+                .replace("{MAX_QTY_EVENTS}", str(page_size))
+            )
+            query_results = RetrieveDBResultsToDictList("DKTG", query)
         except Exception:
-            LOG.warning("Error collecting record", exc_info=True)
-
-    return collected, updated_ids
+            LOG.exception("Error collecting test results! EXITING!")
+            sys.exit(2)
+
+        qty_of_results += len(query_results)
+        click.echo(f"Observability Export Increment - {qty_of_results} results collected so far")
+        for result in query_results:
+            try:
+                yield _get_test_outcome(result), str(result.result_id)
+            except Exception:
+                LOG.warning("Error collecting record", exc_info=True)
+
+        if len(query_results) < page_size:
+            return
+        last_start_time = str(query_results[-1].start_time or "infinity")
+        last_result_id = query_results[-1].result_id
+
+
+def _get_test_outcome(result):
+    return {
+        "integrations": {
+            "testgen": {
+                "columns": result.column_names.split(",") if result.column_names is not None else [],
+                "table": result.table_name,
+                "test_suite": result.test_suite,
+                "test_parameters": _get_input_parameters(result.input_parameters),
+                "version": 1,
+            }
+        },
+        "key": str(result.test_definition_id),
+        "type": result.type,
+        "min_threshold": result.min_threshold,
+        "max_threshold": result.max_threshold,
+        "name": result.name,
+        "description": result.description,
+        "metadata": {},
+        "start_time": date_service.as_iso_timestamp(result.start_time),
+        "result": result.result_message,
+        "end_time": date_service.as_iso_timestamp(result.end_time),
+        "dimensions": [result.dq_dimension],
+        "status": result.result_status.upper(),
+        "metric_value": result.metric_value,
+        "metric_name": result.measure_uom,
+        "metric_description": result.measure_uom_description,
+    }
 
 
 def _get_input_parameters(input_parameters):
@@ -308,15 +455,18 @@ def mark_exported_results(test_suite_id, ids):
 def export_test_results(test_suite_id):
     LOG.info("Observability Export V2 - Privileged UI")
     event, api_url, api_key = collect_event_data(test_suite_id)
-    max_qty_events = settings.OBSERVABILITY_EXPORT_LIMIT
-    qty_of_exported_events = 0
-    while True:
-        click.echo(f"Observability Export Increment - {qty_of_exported_events} exported events so far")
-        test_outcomes, updated_ids = collect_test_results(test_suite_id, max_qty_events)
-        if len(test_outcomes) == 0:
-            return qty_of_exported_events
-        qty_of_exported_events += post_event("test-outcomes", event, api_url, api_key, test_outcomes)
-        mark_exported_results(test_suite_id, updated_ids)
+    test_results = iter_test_results(test_suite_id, settings.OBSERVABILITY_EXPORT_LIMIT)
+    qty_of_exported_events = post_chunks(
+        "test-outcomes",
+        event,
+        api_url,
+        api_key,
+        chunk_test_outcomes(test_results),
+        on_chunk_posted=partial(mark_exported_results, test_suite_id),
+    )
+    if qty_of_exported_events == 0:
+        click.echo("Nothing to be sent to Observability")
+    return qty_of_exported_events
 
 
 def run_observability_exporter(project_code, test_suite):
@@ -1,8 +1,10 @@
+import hashlib
 import logging
 import subprocess
 import threading
 import uuid
 
+import numpy as np
 import pandas as pd
 
 import testgen.common.process_service as process_service
@@ -13,13 +15,15 @@ from testgen.common import (
     AssignConnectParms,
     QuoteCSVItems,
     RetrieveDBResultsToDictList,
+    RetrieveDBResultsToList,
     RetrieveProfilingParms,
     RunActionQueryList,
     RunThreadedRetrievalQueryList,
+    RunThreadedRetrievalQueryListToDB,
     WriteListToDB,
     date_service,
 )
-from testgen.common.database.database_service import empty_cache
+from testgen.common.read_file import get_template_cache_stats
 
 booClean = True
 LOG = logging.getLogger("testgen")
@@ -52,67 +56,61 @@ def CompileAnomalyScoringQueries(clsProfiling, lst_tests):
     return lst_queries
 
 
-def save_contingency_rules(df_merged, threshold_ratio):
-    # Prep rows to save
-    lst_rules = []
-    for row in df_merged.itertuples():
-        # First causes second: almost all of first coincide with second value
-        if row.pair_to_first_ratio >= threshold_ratio:
-            profiling_run_id = row.profiling_run_id
-            schema_name = row.schema_name
-            table_name = row.table_name
-            cause_column_name = row.first_column_name
-            cause_column_value = getattr(row, row.first_column_name)
-            effect_column_name = row.second_column_name
-            effect_column_value = getattr(row, row.second_column_name)
-            pair_count = row.pair_count
-            cause_column_total = row.first_column_overall_count
-            effect_column_total = row.second_column_overall_count
-            rule_ratio = row.pair_to_first_ratio
-            lst_rules.append(
-                [
-                    profiling_run_id,
-                    schema_name,
-                    table_name,
-                    cause_column_name,
-                    cause_column_value,
-                    effect_column_name,
-                    effect_column_value,
-                    pair_count,
-                    cause_column_total,
-                    effect_column_total,
-                    rule_ratio,
-                ]
-            )
+def SetSamplingParms(clsProfiling, dctSampleTables):
+    # Sampling parms are table-level: set them for the current data_schema.data_table
+    clsProfiling.parm_do_sample = "N"
+
+    if clsProfiling.profile_use_sampling == "Y":
+        if dctSampleTables[clsProfiling.data_schema + "." + clsProfiling.data_table][0] > -1:
+            clsProfiling.parm_sample_size = dctSampleTables[clsProfiling.data_schema + "." + clsProfiling.data_table][0]
+            clsProfiling.sample_ratio = dctSampleTables[clsProfiling.data_schema + "." + clsProfiling.data_table][1]
+            clsProfiling.parm_do_sample = clsProfiling.profile_use_sampling
+        else:
+            clsProfiling.parm_sample_size = 0
+            clsProfiling.sample_ratio = ""
 
-        # Second causes first: almost all of second coincide with first value
-        if row.pair_to_second_ratio >= threshold_ratio:
-            profiling_run_id = row.profiling_run_id
-            schema_name = row.schema_name
-            table_name = row.table_name
-            cause_column_name = row.second_column_name
-            cause_column_value = getattr(row, row.second_column_name)
-            effect_column_name = row.first_column_name
-            effect_column_value = getattr(row, row.first_column_name)
-            pair_count = row.pair_count
-            cause_column_total = row.second_column_overall_count
-            effect_column_total = row.first_column_overall_count
-            rule_ratio = row.pair_to_second_ratio
-            lst_rules.append(
-                [
-                    profiling_run_id,
-                    schema_name,
-                    table_name,
-                    cause_column_name,
-                    cause_column_value,
-                    effect_column_name,
-                    effect_column_value,
-                    pair_count,
-                    cause_column_total,
-                    effect_column_total,
-                    rule_ratio,
-                ]
-            )
+
+def save_contingency_rules(df_merged, threshold_ratio):
+    # Prep rows to save, in both directions
+    lst_rule_columns = [
+        "profiling_run_id",
+        "schema_name",
+        "table_name",
+        "cause_column_name",
+        "cause_column_value",
+        "effect_column_name",
+        "effect_column_value",
+        "pair_count",
+        "cause_column_total",
+        "effect_column_total",
+        "rule_ratio",
+    ]
+    # First causes second: almost all of first coincide with second value
+    df_first = df_merged[df_merged["pair_to_first_ratio"] >= threshold_ratio].rename(
+        columns={
+            "first_column_name": "cause_column_name",
+            "first_column_value": "cause_column_value",
+            "second_column_name": "effect_column_name",
+            "second_column_value": "effect_column_value",
+            "first_column_overall_count": "cause_column_total",
+            "second_column_overall_count": "effect_column_total",
+            "pair_to_first_ratio": "rule_ratio",
+        }
+    )
+    # Second causes first: almost all of second coincide with first value
+    df_second = df_merged[df_merged["pair_to_second_ratio"] >= threshold_ratio].rename(
+        columns={
+            "second_column_name": "cause_column_name",
+            "second_column_value": "cause_column_value",
+            "first_column_name": "effect_column_name",
+            "first_column_value": "effect_column_value",
+            "second_column_overall_count": "cause_column_total",
+            "first_column_overall_count": "effect_column_total",
+            "pair_to_second_ratio": "rule_ratio",
+        }
+    )
+    df_rules = pd.concat([df_first[lst_rule_columns], df_second[lst_rule_columns]], ignore_index=True)
+    lst_rules = df_rules.astype(object).where(df_rules.notna(), None).values.tolist()
 
     WriteListToDB(
         "DKTG",
@@ -134,7 +132,153 @@ def save_contingency_rules(df_merged, threshold_ratio):
     )
 
 
-def RunPairwiseContingencyCheck(clsProfiling, threshold_ratio):
+def GetTableSignatures(clsProfiling, lstColumns, dctParms):
+    # Cheap change signals per table: exact record count, flavor metadata where available,
+    # and a hash of the table's columns along with the settings that shape its profile
+    dctTableColumns = {}
+    for dctColumnRecord in lstColumns:
+        strTable = f"{dctColumnRecord['table_schema']}.{dctColumnRecord['table_name']}"
+        dctTableColumns.setdefault(strTable, []).append(
+            f"{dctColumnRecord['column_name']}:{dctColumnRecord['data_type']}"
+        )
+    strSettings = "|".join(
+        str(dctParms[key])
+        for key in [
+            "profile_use_sampling",
+            "profile_sample_percent",
+            "profile_sample_min_count",
+            "profile_id_column_mask",
+            "profile_sk_column_mask",
+        ]
+    )
+
+    lstCounts, _, intErrors = RunThreadedRetrievalQueryList(
+        "PROJECT", clsProfiling.GetRecordCountQueries(list(dctTableColumns)), dctParms["max_threads"]
+    )
+    dctCounts = dict(lstCounts)
+
+    dctChangeSignals = {}
+    strQuery = clsProfiling.GetTableChangeSignalsQuery()
+    if strQuery:
+        try:
+            lstChangeSignals, _ = RetrieveDBResultsToList("PROJECT", strQuery)
+            dctChangeSignals = dict(lstChangeSignals)
+        except Exception:
+            LOG.warning("Table change metadata could not be retrieved. Comparing record counts only.", exc_info=True)
+
+    dctSignatures = {}
+    for strTable, lstTableColumns in dctTableColumns.items():
+        dctSignatures[strTable] = {
+            "record_ct": dctCounts.get(strTable),
+            "column_ct": len(lstTableColumns),
+            "change_signal": dctChangeSignals.get(strTable),
+            "ddf_hash": hashlib.md5(  # NOQA S324
+                "|".join([strSettings, *lstTableColumns]).encode("utf-8")
+            ).hexdigest(),
+            "reused_profile_run_id": None,
+        }
+    return dctSignatures, intErrors
+
+
+def SelectReusableTables(clsProfiling, dctSignatures):
+    # Tables whose signals all match the latest completed run can keep that run's profile
+    lstReusedTables = []
+    for dctPrevious in RetrieveDBResultsToDictList("DKTG", clsProfiling.GetPreviousTableSignaturesQuery()):
+        dctSignature = dctSignatures.get(dctPrevious["schema_table"])
+        if (
+            dctSignature
+            and dctSignature["record_ct"] is not None
+            and dctSignature["record_ct"] == dctPrevious["record_ct"]
+            and dctSignature["change_signal"] == dctPrevious["change_signal"]
+            and dctSignature["ddf_hash"] == dctPrevious["ddf_hash"]
+        ):
+            dctSignature["reused_profile_run_id"] = str(dctPrevious["source_profile_run_id"])
+            clsProfiling.previous_profile_run_id = str(dctPrevious["profile_run_id"])
+            lstReusedTables.append(dctPrevious["schema_table"])
+    return lstReusedTables
+
+
+def SaveTableSignatures(clsProfiling, dctSignatures):
+    lstSignatures = []
+    for strTable, dctSignature in dctSignatures.items():
+        strSchema, strTableName = strTable.split(".", 1)
+        lstSignatures.append(
+            [
+                clsProfiling.profile_run_id,
+                clsProfiling.table_groups_id,
+                strSchema,
+                strTableName,
+                dctSignature["record_ct"],
+                dctSignature["column_ct"],
+                dctSignature["change_signal"],
+                dctSignature["ddf_hash"],
+                dctSignature["reused_profile_run_id"],
+            ]
+        )
+    WriteListToDB(
+        "DKTG",
+        lstSignatures,
+        [
+            "profile_run_id",
+            "table_groups_id",
+            "schema_name",
+            "table_name",
+            "record_ct",
+            "column_ct",
+            "change_signal",
+            "ddf_hash",
+            "reused_profile_run_id",
+        ],
+        "profile_table_signatures",
+    )
+
+
+def GetContingencyPairCounts(df_counts, columns):
+    # Counts every pair of column values at once: each count row contributes to all its column pairs
+    idx_first, idx_second = np.triu_indices(len(columns), k=1)
+    arr_columns = np.array(columns, dtype=object)
+    arr_values = df_counts[columns].to_numpy(dtype=object)
+    arr_counts = df_counts["freq_ct"].to_numpy()
+
+    df_pairs = pd.DataFrame(
+        {
+            "first_column_name": np.tile(arr_columns[idx_first], len(df_counts)),
+            "first_column_value": arr_values[:, idx_first].ravel(),
+            "second_column_name": np.tile(arr_columns[idx_second], len(df_counts)),
+            "second_column_value": arr_values[:, idx_second].ravel(),
+            "pair_count": np.repeat(arr_counts, len(idx_first)),
+        }
+    )
+    df_pairs = (
+        df_pairs.groupby(
+            ["first_column_name", "first_column_value", "second_column_name", "second_column_value"], sort=False
+        )["pair_count"]
+        .sum()
+        .reset_index()
+    )
+
+    # Add overall counts for each column value
+    df_overall = (
+        pd.concat({col: df_counts.groupby(col)["freq_ct"].sum() for col in columns})
+        .rename_axis(["column_name", "column_value"])
+        .reset_index(name="overall_count")
+    )
+    df_overall["column_value"] = df_overall["column_value"].astype(object)
+    for str_side in ["first", "second"]:
+        df_pairs = df_pairs.merge(
+            df_overall.rename(
+                columns={
+                    "column_name": f"{str_side}_column_name",
+                    "column_value": f"{str_side}_column_value",
+                    "overall_count": f"{str_side}_column_overall_count",
+                }
+            ),
+            on=[f"{str_side}_column_name", f"{str_side}_column_value"],
+        )
+    return df_pairs
+
+
+def RunPairwiseContingencyCheck(clsProfiling, threshold_ratio, max_threads=None):
     # Goal: identify pairs of values that represent IF X=A THEN Y=B rules
 
     # Define the threshold percent -- should be high
@@ -148,93 +292,80 @@ def RunPairwiseContingencyCheck(clsProfiling, threshold_ratio):
     clsProfiling.contingency_max_values = str_max_values
     str_query = clsProfiling.GetContingencyColumns()
     lst_tables = RetrieveDBResultsToDictList("DKTG", str_query)
+    if not lst_tables:
+        return
 
-    # Retrieve record counts per column combination
-    df_merged = None
-    if lst_tables:
-        for dct_table in lst_tables:
-            df_merged = None
-            clsProfiling.data_schema = dct_table["schema_name"]
-            clsProfiling.data_table = dct_table["table_name"]
-            clsProfiling.contingency_columns = QuoteCSVItems(dct_table["contingency_columns"])
-            str_query = clsProfiling.GetContingencyCounts()
-            lst_counts = RetrieveDBResultsToDictList("PROJECT", str_query)
-            if lst_counts:
-                df = pd.DataFrame(lst_counts)
-                # Get list of columns
-                columns = dct_table["contingency_columns"].lower().split(",")
-
-                # Calculate overall counts for each column
-                overall_counts = {col: df.groupby(col)["freq_ct"].sum() for col in columns}
-
-                # Prepare to aggregate the data
-                contingency_table = []
-                for i, col1 in enumerate(columns):
-                    for col2 in columns[i + 1 :]:
-                        # Create a pivot table for each pair
-                        pivot = df.pivot_table(index=col1, columns=col2, values="freq_ct", aggfunc="sum", fill_value=0)
-                        pivot = pivot.stack().reset_index()
-                        pivot.rename(columns={0: "pair_count"}, inplace=True)
-
-                        # Add overall counts
-                        pivot["first_column_overall_count"] = pivot[col1].map(overall_counts[col1])
-                        pivot["second_column_overall_count"] = pivot[col2].map(overall_counts[col2])
-
-                        # Add column names
-                        pivot["first_column_name"] = col1
-                        pivot["second_column_name"] = col2
-
-                        contingency_table.append(pivot)
-
-                # Combine all pairs into a single DataFrame
-                contingency_table = pd.concat(contingency_table, ignore_index=True)
-
-                # Calculate the ratios
-                contingency_table["pair_to_first_ratio"] = (
-                    contingency_table["pair_count"] / contingency_table["first_column_overall_count"]
-                )
-                contingency_table["pair_to_second_ratio"] = (
-                    contingency_table["pair_count"] / contingency_table["second_column_overall_count"]
-                )
-
-                # Include rows where both cols meet minimum threshold count (max of 30 or 5%)
-                total_observations = contingency_table["pair_count"].sum()
-                threshold_min = max(total_observations * 0.05, 30)
-                contingency_table = contingency_table[
-                    (contingency_table["first_column_overall_count"] >= threshold_min)
-                    & (contingency_table["second_column_overall_count"] >= threshold_min)
-                ]
-                # Drop rows where neither ratio meets the threshold ratio (keep if either meets it)
-                #   -- note we still have to check individual columns when saving pairs
-                contingency_table = contingency_table[
-                    ~(
-                        (contingency_table["pair_to_first_ratio"] < threshold_ratio)
-                        & (contingency_table["pair_to_second_ratio"] < threshold_ratio)
-                    )
-                ]
-
-                # Add table name
-                contingency_table["profiling_run_id"] = clsProfiling.profile_run_id
-                contingency_table["schema_name"] = dct_table["schema_name"]
-                contingency_table["table_name"] = dct_table["table_name"]
+    # Retrieve record counts per column combination, for all tables in parallel
+    lst_queries = []
+    for dct_table in lst_tables:
+        clsProfiling.data_schema = dct_table["schema_name"]
+        clsProfiling.data_table = dct_table["table_name"]
+        clsProfiling.contingency_columns = QuoteCSVItems(dct_table["contingency_columns"])
+        lst_queries.append(clsProfiling.GetContingencyCounts())
+    lst_counts, _, int_errors = RunThreadedRetrievalQueryList("PROJECT", lst_queries, max_threads)
+    if int_errors > 0:
+        LOG.warning(f"Errors were encountered retrieving contingency counts. ({int_errors} errors occurred.)")
+
+    # Count rows lead with their table's schema and name
+    dct_table_counts = {}
+    for row in lst_counts:
+        dct_table_counts.setdefault((row[0], row[1]), []).append(tuple(row[2:]))
+
+    lst_contingency_tables = []
+    for dct_table in lst_tables:
+        lst_table_counts = dct_table_counts.get((dct_table["schema_name"], dct_table["table_name"]))
+        if not lst_table_counts:
+            continue
+        # Get list of columns
+        columns = dct_table["contingency_columns"].lower().split(",")
+        df = pd.DataFrame(lst_table_counts, columns=[*columns, "freq_ct"], dtype=object)
+        df["freq_ct"] = df["freq_ct"].astype("int64")
+
+        contingency_table = GetContingencyPairCounts(df, columns)
+
+        # Calculate the ratios
+        contingency_table["pair_to_first_ratio"] = (
+            contingency_table["pair_count"] / contingency_table["first_column_overall_count"]
+        )
+        contingency_table["pair_to_second_ratio"] = (
+            contingency_table["pair_count"] / contingency_table["second_column_overall_count"]
+        )
 
-                # Combine with previous tables
-                if df_merged == None:
-                    df_merged = contingency_table
-                else:
-                    df_merged = pd.concat([df_merged, contingency_table], ignore_index=True)
+        # Include rows where both cols meet minimum threshold count (max of 30 or 5%)
+        total_observations = contingency_table["pair_count"].sum()
+        threshold_min = max(total_observations * 0.05, 30)
+        contingency_table = contingency_table[
+            (contingency_table["first_column_overall_count"] >= threshold_min)
+            & (contingency_table["second_column_overall_count"] >= threshold_min)
+        ]
+        # Drop rows where neither ratio meets the threshold ratio (keep if either meets it)
+        #   -- note we still have to check individual columns when saving pairs
+        contingency_table = contingency_table[
+            ~(
+                (contingency_table["pair_to_first_ratio"] < threshold_ratio)
+                & (contingency_table["pair_to_second_ratio"] < threshold_ratio)
+            )
+        ]
 
-        if df_merged is not None:
-            if not df_merged.empty:
-                save_contingency_rules(df_merged, threshold_ratio)
+        # Add table name
+        contingency_table = contingency_table.assign(
+            profiling_run_id=clsProfiling.profile_run_id,
+            schema_name=dct_table["schema_name"],
+            table_name=dct_table["table_name"],
+        )
+        lst_contingency_tables.append(contingency_table)
 
+    if lst_contingency_tables:
+        df_merged = pd.concat(lst_contingency_tables, ignore_index=True)
+        if not df_merged.empty:
+            save_contingency_rules(df_merged, threshold_ratio)
 
 
 def run_profiling_in_background(table_group_id):
     msg = f"Starting run_profiling_in_background against table group_id: {table_group_id}"
     # if settings.IS_DEBUG:
     LOG.info(msg + ". Running in debug mode (new thread instead of new process).")
-    empty_cache()
+    # The run assigns its connection in its own thread's context, alongside any other runs in progress
     background_thread = threading.Thread(target=run_profiling_queries, args=(table_group_id,))
     background_thread.start()
     # else:
@@ -244,11 +375,13 @@ def run_profiling_in_background(table_group_id):
 
 
 
-def run_profiling_queries(strTableGroupsID, spinner=None):
+def run_profiling_queries(strTableGroupsID, spinner=None, incremental=None, approx_stats=None):
     if strTableGroupsID is None:
         raise ValueError("Table Group ID was not specified")
 
     booErrors = False
+    booIncremental = settings.PROFILING_INCREMENTAL if incremental is None else incremental
+    booApproxStats = settings.PROFILING_APPROX_STATS if approx_stats is None else approx_stats
 
     LOG.info("CurrentStep: Retrieving Parameters")
 
@@ -278,6 +411,11 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
         dctParms["private_key_passphrase"],
         dctParms["http_path"],
         "PROJECT",
+        max_threads=dctParms["max_threads"],
+        min_threads=dctParms["min_threads"],
+        pool_max_overflow=dctParms["pool_max_overflow"],
+        pool_pre_ping=dctParms["pool_pre_ping"],
+        pool_recycle=dctParms["pool_recycle"],
     )
 
     # Set General Parms
@@ -301,6 +439,7 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
     clsProfiling.profile_flag_cdes = dctParms["profile_flag_cdes"]
     clsProfiling.profile_sample_percent = dctParms["profile_sample_percent"]
     clsProfiling.profile_sample_min_count = dctParms["profile_sample_min_count"]
+    clsProfiling.max_query_chars = dctParms["max_query_chars"]
     clsProfiling.process_id = process_service.get_current_process_id()
 
     # Add a record in profiling_runs table for the new profile
@@ -318,11 +457,40 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
         if len(lstResult) == 0:
             LOG.warning("SQL retrieved 0 records")
 
+        if lstResult and booApproxStats:
+            strQuery = clsProfiling.GetApproxStatsSupportQuery()
+            lstSupport = RetrieveDBResultsToList("PROJECT", strQuery)[0] if strQuery else [(1,)]
+            if not lstSupport[0][0]:
+                LOG.warning("Approximate statistics are not supported by the project database. Computing exact statistics.")
+            else:
+                clsProfiling.use_approx_stats = True
+
         if lstResult:
+            lstProfileColumns = lstResult
+            lstReusedTables = []
+            # Signatures are recorded by full runs too, so that the next incremental run can compare against them.
+            # They are taken before profiling, so tables changed while the run is in progress are profiled again.
+            LOG.info("CurrentStep: Collecting table change signals")
+            dctSignatures, intErrors = GetTableSignatures(clsProfiling, lstResult, dctParms)
+            if intErrors > 0:
+                LOG.warning(
+                    f"Record counts could not be retrieved for some tables. ({intErrors} errors occurred.) Their previous profile can't be reused."
+                )
+            if booIncremental:
+                lstReusedTables = SelectReusableTables(clsProfiling, dctSignatures)
+                LOG.info("Reusing previous profile for %s of %s tables", len(lstReusedTables), len(dctSignatures))
+                setReusedTables = set(lstReusedTables)
+                lstProfileColumns = [
+                    dctColumnRecord
+                    for dctColumnRecord in lstResult
+                    if f"{dctColumnRecord['table_schema']}.{dctColumnRecord['table_name']}" not in setReusedTables
+                ]
+
+            dctSampleTables = {}
             if clsProfiling.profile_use_sampling == "Y":
                 # Get distinct tables
                 distinct_tables = set()
-                for item in lstResult:
+                for item in lstProfileColumns:
                     schema_name = item["table_schema"]
                     table_name = item["table_name"]
                     distinct_tables.add(f"{schema_name}.{table_name}")
@@ -350,7 +518,8 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
             # Assemble profiling queries
             LOG.info("CurrentStep: Assembling profiling queries, round 1")
             lstQueries = []
-            for dctColumnRecord in lstResult:
+            dctBatchColumns = {}
+            for dctColumnRecord in lstProfileColumns:
                 # Set Column Parms
                 clsProfiling.data_schema = dctColumnRecord["table_schema"]
                 clsProfiling.data_table = dctColumnRecord["table_name"]
@@ -361,38 +530,50 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
                 clsProfiling.col_ordinal_position = dctColumnRecord["ordinal_position"]
                 clsProfiling.col_max_char_length = dctColumnRecord["character_maximum_length"]
                 clsProfiling.col_gen_type = dctColumnRecord["general_type"]
-                clsProfiling.parm_do_sample = "N"
-
-                if clsProfiling.profile_use_sampling == "Y":
-                    if dctSampleTables[clsProfiling.data_schema + "." + clsProfiling.data_table][0] > -1:
-                        clsProfiling.parm_sample_size = dctSampleTables[
-                            clsProfiling.data_schema + "." + clsProfiling.data_table
-                        ][0]
-                        clsProfiling.sample_ratio = dctSampleTables[
-                            clsProfiling.data_schema + "." + clsProfiling.data_table
-                        ][1]
-                        clsProfiling.parm_do_sample = clsProfiling.profile_use_sampling
-                    else:
-                        clsProfiling.parm_sample_size = 0
-                        clsProfiling.sample_ratio = ""
-
-                strQuery = clsProfiling.GetProfilingQuery()
-                lstQueries.append(strQuery)
+                SetSamplingParms(clsProfiling, dctSampleTables)
 
-            # Run Profiling Queries and save results
+                if settings.PROFILING_BATCH_BY_TABLE:
+                    dctBatchColumns.setdefault(
+                        (clsProfiling.data_schema, clsProfiling.data_table), []
+                    ).append(clsProfiling.GetProfilingBatchColumn())
+                else:
+                    strQuery = clsProfiling.GetProfilingQuery()
+                    lstQueries.append(strQuery)
+
+            # Table-level mode: one wide query per table, or per chunk of its columns
+            for (strSchema, strTable), lstBatchColumns in dctBatchColumns.items():
+                clsProfiling.data_schema = strSchema
+                clsProfiling.data_table = strTable
+                SetSamplingParms(clsProfiling, dctSampleTables)
+                lstQueries.extend(
+                    clsProfiling.GetProfilingBatchQueries(
+                        lstBatchColumns, dctParms["max_query_chars"], settings.PROFILING_BATCH_MAX_COLUMNS
+                    )
+                )
+
+            # Run Profiling Queries, saving results to Metadata as they are fetched
             LOG.info("CurrentStep: Profiling Round 1")
             LOG.debug("Running %s profiling queries", len(lstQueries))
 
-            lstProfiles, colProfileNames, intErrors = RunThreadedRetrievalQueryList(
-                "PROJECT", lstQueries, dctParms["max_threads"]
+            _, _, intErrors = RunThreadedRetrievalQueryListToDB(
+                "PROJECT",
+                lstQueries,
+                dctParms["max_threads"],
+                "DKTG",
+                "profile_results",
+                clsProfiling.UnpivotProfilingBatchResults if dctBatchColumns else None,
             )
             if intErrors > 0:
                 booErrors = True
                 LOG.warning(
                     f"Errors were encountered executing profiling queries. ({intErrors} errors occurred.) Please check log."
                 )
-            LOG.info("CurrentStep: Saving Round 1 profiling results to Metadata")
-            WriteListToDB("DKTG", lstProfiles, colProfileNames, "profile_results")
+
+            if lstReusedTables:
+                LOG.info("CurrentStep: Carrying forward profile results of unchanged tables")
+                RunActionQueryList("DKTG", [clsProfiling.GetProfileResultsCarryForwardQuery(lstReusedTables)])
+            if dctSignatures:
+                SaveTableSignatures(clsProfiling, dctSignatures)
 
             if clsProfiling.profile_use_sampling == "Y":
                 lstQueries = []
@@ -405,14 +586,43 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
 
                 RunActionQueryList("DKTG", lstQueries)
 
+            if clsProfiling.use_approx_stats:
+                RunActionQueryList("DKTG", [clsProfiling.UpdateProfileResultsToApproxEst()])
+
+            intUpdates = 0
             if clsProfiling.parm_do_freqs == "Y":
-                lstUpdates = []
                 # Get secondary profiling columns
                 LOG.info("CurrentStep: Selecting columns for frequency analysis")
                 strQuery = clsProfiling.GetSecondProfilingColumnsQuery()
                 lstResult = RetrieveDBResultsToDictList("DKTG", strQuery)
 
-                if lstResult:
+                if lstResult and settings.PROFILING_SINGLE_PASS_FREQS:
+                    # Single-pass frequencies: one grouped scan per table instead of one scan per column
+                    LOG.info("CurrentStep: Generating single-pass frequency queries")
+                    dctFreqColumns = {}
+                    for dctColumnRecord in lstResult:
+                        dctFreqColumns.setdefault(
+                            (dctColumnRecord["schema_name"], dctColumnRecord["table_name"]), []
+                        ).append(dctColumnRecord["column_name"])
+                    lstQueries = []
+                    for (strSchema, strTable), lstFreqColumns in dctFreqColumns.items():
+                        clsProfiling.data_schema = strSchema
+                        clsProfiling.data_table = strTable
+                        lstQueries.extend(
+                            clsProfiling.GetFrequencyProfilingQueries(lstFreqColumns, settings.PROFILING_BATCH_MAX_COLUMNS)
+                        )
+                    # Copied to DQ staging as they are fetched, like the per-column frequency results
+                    LOG.info("CurrentStep: Retrieving frequencies for %s tables from project", len(dctFreqColumns))
+                    intUpdates, _, intErrors = RunThreadedRetrievalQueryListToDB(
+                        "PROJECT", lstQueries, dctParms["max_threads"], "DKTG", "stg_secondary_profile_updates"
+                    )
+                    if intErrors > 0:
+                        booErrors = True
+                        LOG.warning(
+                            f"Errors were encountered executing frequency queries. ({intErrors} errors occurred.) Please check log."
+                        )
+
+                elif lstResult:
                     # Assemble secondary profiling queries
                     #  - Freqs for columns not already freq'd, but with max actual value length under threshold
                     LOG.info("CurrentStep: Generating frequency queries")
@@ -424,10 +634,10 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
 
                         strQuery = clsProfiling.GetSecondProfilingQuery()
                         lstQueries.append(strQuery)
-                    # Run secondary profiling queries
+                    # Run secondary profiling queries, copying results to DQ staging as they are fetched
                     LOG.info("CurrentStep: Retrieving %s frequency results from project", len(lstQueries))
-                    lstUpdates, colProfileNames, intErrors = RunThreadedRetrievalQueryList(
-                        "PROJECT", lstQueries, dctParms["max_threads"]
+                    intUpdates, _, intErrors = RunThreadedRetrievalQueryListToDB(
+                        "PROJECT", lstQueries, dctParms["max_threads"], "DKTG", "stg_secondary_profile_updates"
                     )
                     if intErrors > 0:
                         booErrors = True
@@ -435,17 +645,12 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
                             f"Errors were encountered executing frequency queries. ({intErrors} errors occurred.) Please check log."
                         )
 
-                    if lstUpdates:
-                        # Copy secondary results to DQ staging
-                        LOG.info("CurrentStep: Writing frequency results to Staging")
-                        WriteListToDB("DKTG", lstUpdates, colProfileNames, "stg_secondary_profile_updates")
-
             LOG.info("CurrentStep: Generating profiling update queries")
 
             lstQueries = []
             lstAnomalyTypes = []
 
-            if lstUpdates:
+            if intUpdates:
                 # Run single update query, then delete from staging
                 strQuery = clsProfiling.GetSecondProfilingUpdateQuery()
                 lstQueries.append(strQuery)
@@ -481,7 +686,7 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
 
             if dctParms["profile_do_pair_rules"] == "Y":
                 LOG.info("CurrentStep: Compiling pairwise contingency rules")
-                RunPairwiseContingencyCheck(clsProfiling, dctParms["profile_pair_rule_pct"])
+                RunPairwiseContingencyCheck(clsProfiling, dctParms["profile_pair_rule_pct"], dctParms["max_threads"])
         else:
             LOG.info("No columns were selected to profile.")
     except Exception as e:
@@ -496,10 +701,13 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
             clsProfiling.GetProfileRunInfoRecordUpdateQuery(),
             clsProfiling.GetAnomalyScoringRollupRunQuery(),
             clsProfiling.GetAnomalyScoringRollupTableGroupQuery(),
+            clsProfiling.GetDashboardRollupRunQuery(),
+            clsProfiling.GetRefreshScoringTablesQuery(),
         ]
         RunActionQueryList("DKTG", lstProfileRunQuery)
         run_refresh_score_cards_results(
             project_code=dctParms["project_code"],
+            table_group_id=clsProfiling.table_groups_id,
             add_history_entry=True,
             refresh_date=date_service.parse_now(clsProfiling.run_date),
         )
@@ -509,4 +717,5 @@ def run_profiling_queries(strTableGroupsID, spinner=None):
         else:
             str_error_status = "successfully."
         message += str_error_status
+        LOG.debug("Query template cache: %s", get_template_cache_stats())
     return message
@@ -18,6 +18,7 @@ LOG = logging.getLogger("testgen")
 def run_refresh_score_cards_results(
     project_code: str | None = None,
     definition_id: str | None = None,
+    table_group_id: str | None = None,
     add_history_entry: bool = False,
     refresh_date: datetime.datetime | None = None,
 ):
@@ -27,10 +28,13 @@ def run_refresh_score_cards_results(
 
     try:
         definitions = []
-        if not definition_id:
-            definitions = ScoreDefinition.all(project_code=project_code)
-        else:
+        if definition_id:
             definitions.append(ScoreDefinition.get(str(definition_id)))
+        elif table_group_id and project_code:
+            # Only scorecards that can include the table group's data change after its runs
+            definitions = ScoreDefinition.for_table_group(project_code, table_group_id)
+        else:
+            definitions = ScoreDefinition.all(project_code=project_code)
     except Exception:
         LOG.exception("CurrentStep: Stopping scorecards results refresh after unexpected error")
         return
@@ -41,6 +45,7 @@ def run_refresh_score_cards_results(
             definition.name,
             definition.project_code,
         )
+        definition_start_time = time.time()
 
         try:
             fresh_score_card = definition.as_score_card()
@@ -66,9 +71,10 @@ def run_refresh_score_cards_results(
                         history_entry.add_as_cutoff()
             definition.save()
             LOG.info(
-                "CurrentStep: Done rereshing scorecard %s in project %s",
+                "CurrentStep: Done rereshing scorecard %s in project %s after %s seconds",
                 definition.name,
                 definition.project_code,
+                round(time.time() - definition_start_time, 2),
             )
         except Exception:
             LOG.exception(
@@ -80,6 +86,8 @@ def run_refresh_score_cards_results(
     scope = "all scorecards"
     if project_code:
         scope = f"all scorecards in project {project_code}"
+    if project_code and table_group_id:
+        scope = f"{len(definitions)} scorecards including table group {table_group_id} in project {project_code}"
     if definition_id:
         scope = f"scorecard {definition_id}"
 
@@ -121,23 +129,29 @@ def _score_card_to_results(score_card: ScoreCard) -> list[ScoreDefinitionResult]
 
 
 def _score_definition_to_results_breakdown(score_definition: ScoreDefinition) -> list[ScoreDefinitionBreakdownItem]:
-    score_types = ["score", "cde_score"]
-    categories = ["column_name", "table_name", "dq_dimension", "semantic_data_type"]
-
-    all_breakdown_items = []
-    for category in categories:
-        for score_type in score_types:
-            breakdown = score_definition.get_score_card_breakdown(group_by=category, score_type=score_type)
-            all_breakdown_items.extend([
-                ScoreDefinitionBreakdownItem(
-                    definition_id=score_definition.id,
-                    category=category,
-                    score_type=score_type,
-                    **item,
-                ) for item in breakdown
-            ])
-
-    return all_breakdown_items
+    category_fields = {
+        "column_name": ["table_groups_id", "table_name", "column_name"],
+        "table_name": ["table_groups_id", "table_name"],
+        "dq_dimension": ["dq_dimension"],
+        "semantic_data_type": ["semantic_data_type"],
+    }
+
+    # All groupings and score types come back from one query
+    return [
+        ScoreDefinitionBreakdownItem(
+            definition_id=score_definition.id,
+            category=item["category"],
+            score_type=item["score_type"],
+            impact=item["impact"],
+            score=item["score"],
+            issue_ct=item["issue_ct"],
+            **{
+                field: str(item[field]) if field == "table_groups_id" and item[field] is not None else item[field]
+                for field in category_fields[item["category"]]
+            },
+        )
+        for item in score_definition.get_score_card_breakdowns()
+    ]
 
 
 @with_database_session
@@ -14,6 +14,7 @@ def run_profile_rollup_scoring_queries(project_code: str, run_id: str, table_gro
     queries = [sql_generator.GetRollupScoresProfileRunQuery()]
     if table_group_id: 
         queries.append(sql_generator.GetRollupScoresProfileTableGroupQuery())
+        queries.append(sql_generator.GetRefreshScoringTableGroupQuery())
 
     LOG.info("CurrentStep: Rolling up profiling scores")
     RunActionQueryList("DKTG", queries)
@@ -27,7 +28,18 @@ def run_test_rollup_scoring_queries(project_code: str, run_id: str, table_group_
     queries = [sql_generator.GetRollupScoresTestRunQuery()]
     if table_group_id: 
         queries.append(sql_generator.GetRollupScoresTestTableGroupQuery())
+        queries.append(sql_generator.GetRefreshScoringTableGroupQuery())
 
     LOG.info("CurrentStep: Rolling up testing scores")
     RunActionQueryList("DKTG", queries)
     run_refresh_score_cards_results(project_code=project_code)
+
+
+def run_refresh_dashboard_test_rollup(test_suite_id: str):
+    LOG.info("CurrentStep: Refreshing dashboard rollup for test suite %s", test_suite_id)
+    RunActionQueryList("DKTG", [CRollupScoresSQL(None).GetRollupDashboardTestSuiteQuery(str(test_suite_id))])
+
+
+def run_refresh_scoring_tables(table_group_id: str):
+    LOG.info("CurrentStep: Refreshing scoring tables for table group %s", table_group_id)
+    RunActionQueryList("DKTG", [CRollupScoresSQL(None, str(table_group_id)).GetRefreshScoringTableGroupQuery()])
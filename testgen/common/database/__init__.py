@@ -1,4 +1,5 @@
-from collections.abc import Iterable
+import csv
+from collections.abc import Iterable, Iterator
 from io import StringIO
 
 
@@ -9,3 +10,38 @@ class FilteredStringIO(StringIO):
 
     def write(self, to_write: str):
         return super().write(to_write.translate(self._replacements))
+
+
+class CSVCopyStream:
+    """
+    File-like source for COPY ... FROM STDIN that encodes row chunks to CSV as they are read,
+    so only the chunk being copied is held in memory.
+    """
+
+    def __init__(self, chunks: Iterator[Iterable]):
+        self._chunks = chunks
+        self._buffer = ""
+        # Reads advance an offset into the buffer, so each read copies only the data it returns
+        self._offset = 0
+        self.row_count = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) - self._offset < size:
+            rows = next(self._chunks, None)
+            if rows is None:
+                break
+            sio = FilteredStringIO(["\x00"])
+            csv.writer(sio, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+            self._buffer = self._buffer[self._offset :] + sio.getvalue()
+            self._offset = 0
+            self.row_count += len(rows)
+
+        if size < 0:
+            data = self._buffer[self._offset :]
+        else:
+            data = self._buffer[self._offset : self._offset + size]
+        self._offset += len(data)
+        if self._offset >= len(self._buffer):
+            self._buffer = ""
+            self._offset = 0
+        return data
@@ -1,13 +1,17 @@
 import concurrent.futures
-import csv
+import contextvars
+import hashlib
 import importlib
+import itertools
 import logging
 import queue as qu
+import re
 import threading
+import time
 from contextlib import suppress
 from urllib.parse import quote_plus
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
 
 from testgen import settings
@@ -19,7 +23,7 @@ from testgen.common.credentials import (
     get_tg_schema,
     get_tg_username,
 )
-from testgen.common.database import FilteredStringIO
+from testgen.common.database import CSVCopyStream
 from testgen.common.encrypt import DecryptText
 from testgen.common.read_file import get_template_files
 
@@ -44,14 +48,32 @@ class CConnectParms:
     private_key_passphrase = ""
     password = None
     http_path = ""
+    max_threads = None
+    min_threads = None
+    pool_max_overflow = None
+    pool_pre_ping = None
+    pool_recycle = None
 
     def __init__(self, connectname):
         self.connectname = connectname
 
 
-# Initialize variables global to this script
-clsConnectParms = CConnectParms("NONE")
+# Project connection parameters are scoped to the current run: each thread (and each task copied from it)
+# sees the parameters it assigned, so concurrent runs in one process don't overwrite each other's target
+_connect_parms: contextvars.ContextVar[CConnectParms] = contextvars.ContextVar("connect_parms")
+
+# Engines are shared across runs, keyed by credential set and, for projects, by connection
 dctDBEngines = {}
+_engines_lock = threading.Lock()
+
+
+def _CacheEngine(tupEngineKey, dbEngine):
+    # Keeps the first engine cached for the key: a thread that lost the race to build one disposes its own
+    with _engines_lock:
+        dbCachedEngine = dctDBEngines.setdefault(tupEngineKey, dbEngine)
+    if dbCachedEngine is not dbEngine:
+        dbEngine.dispose()
+    return dbCachedEngine
 
 
 def QuoteCSVItems(str_csv_row, char_quote='"'):
@@ -72,9 +94,24 @@ def QuoteCSVItems(str_csv_row, char_quote='"'):
     return str_csv_row
 
 
-def empty_cache():
-    global dctDBEngines
-    dctDBEngines = {}
+def get_connect_parms() -> CConnectParms:
+    return _connect_parms.get(None) or CConnectParms("NONE")
+
+
+def empty_cache(connection_id=None):
+    """
+    Disposes the cached engines of one project connection, by default the one assigned in the current
+    context. Engines of other connections stay cached, so runs against them are not disturbed.
+    """
+    if connection_id is None:
+        connection_id = get_connect_parms().connectid
+    if connection_id is None or connection_id == "":
+        return
+    with _engines_lock:
+        lstKeys = [key for key in dctDBEngines if key[0] == "PROJECT" and key[1] == str(connection_id)]
+        lstEngines = [dctDBEngines.pop(key) for key in lstKeys]
+    for dbEngine in lstEngines:
+        dbEngine.dispose()
 
 
 def AssignConnectParms(
@@ -94,10 +131,13 @@ def AssignConnectParms(
     http_path,
     connectname="PROJECT",
     password=None,
+    max_threads=None,
+    min_threads=None,
+    pool_max_overflow=None,
+    pool_pre_ping=None,
+    pool_recycle=None,
 ):
-    global clsConnectParms
-
-    clsConnectParms.connectname = connectname
+    clsConnectParms = CConnectParms(connectname)
     clsConnectParms.projectcode = projectcode
     clsConnectParms.connectid = connectid
     clsConnectParms.hostname = host
@@ -113,6 +153,12 @@ def AssignConnectParms(
     clsConnectParms.private_key = private_key
     clsConnectParms.private_key_passphrase = private_key_passphrase
     clsConnectParms.http_path = http_path
+    clsConnectParms.max_threads = max_threads
+    clsConnectParms.min_threads = min_threads
+    clsConnectParms.pool_max_overflow = pool_max_overflow
+    clsConnectParms.pool_pre_ping = pool_pre_ping
+    clsConnectParms.pool_recycle = pool_recycle
+    _connect_parms.set(clsConnectParms)
 
 
 def _RetrieveProjectPW(strProjectCode, strConnID):
@@ -134,9 +180,8 @@ def _RetrieveProjectPW(strProjectCode, strConnID):
 
 
 def _GetDBPassword(strCredentialSet):
-    global clsConnectParms
-
     if strCredentialSet == "PROJECT":
+        clsConnectParms = get_connect_parms()
         if not clsConnectParms.password:
             strPW = _RetrieveProjectPW(clsConnectParms.projectcode, clsConnectParms.connectid)
         else:
@@ -161,9 +206,8 @@ def get_db_type(sql_flavor):
 
 
 def _GetDBCredentials(strCredentialSet):
-    global clsConnectParms
-
     if strCredentialSet == "PROJECT":
+        clsConnectParms = get_connect_parms()
         # Check for unassigned parms
         if clsConnectParms.connectname == "NONE":
             raise ValueError("Project Connection Parameters were not set.")
@@ -186,6 +230,10 @@ def _GetDBCredentials(strCredentialSet):
             "private_key": clsConnectParms.private_key,
             "private_key_passphrase": clsConnectParms.private_key_passphrase,
             "http_path": clsConnectParms.http_path,
+            "max_threads": clsConnectParms.max_threads,
+            "pool_max_overflow": clsConnectParms.pool_max_overflow,
+            "pool_pre_ping": clsConnectParms.pool_pre_ping,
+            "pool_recycle": clsConnectParms.pool_recycle,
         }
     elif strCredentialSet == "DKTG":
         # Get credentials from functions in my_dk_credentials.py
@@ -223,10 +271,27 @@ def _InitDBConnection(strCredentialSet, strRaw="N", strAdmin="N", user_override=
     else:
         flavor_service = get_flavor_service(dctCredentials["dbtype"].lower())
         flavor_service.init(dctCredentials)
-        con = _InitDBConnection_target_db(flavor_service, strCredentialSet, strRaw, user_override, pwd_override)
+        con = _InitDBConnection_target_db(
+            flavor_service, dctCredentials, strCredentialSet, strRaw, user_override, pwd_override
+        )
     return con
 
 
+def _GetEngineKey(dctCredentials, user_override=None, pwd_override=None):
+    if dctCredentials["name"] != "PROJECT":
+        return (dctCredentials["name"],)
+    # Engines of the same connection differ whenever anything they were created from differs
+    strFingerprint = "|".join(
+        str(value)
+        for value in [*dctCredentials.values(), get_connect_parms().password, user_override, pwd_override]
+    )
+    return (
+        "PROJECT",
+        str(get_connect_parms().connectid),
+        hashlib.sha256(strFingerprint.encode("utf-8")).hexdigest(),
+    )
+
+
 def _InitDBConnection_appdb(
     dctCredentials, strCredentialSet, strRaw="N", strAdmin="N", user_override=None, pwd_override=None
 ):
@@ -244,9 +309,10 @@ def _InitDBConnection_appdb(
             dctCredentials["dbname"] = "postgres"
 
     # Get DBEngine using credentials
-    if strCredentialSet in dctDBEngines and strAdmin == "N":
+    tupEngineKey = _GetEngineKey(dctCredentials)
+    if tupEngineKey in dctDBEngines and strAdmin == "N":
         # Retrieve existing engine from store
-        dbEngine = dctDBEngines[strCredentialSet]
+        dbEngine = dctDBEngines[tupEngineKey]
     else:
         # Handle Admin overrides or circumstantial password override
         if strAdmin in {"D", "S"} or pwd_override is not None:
@@ -267,7 +333,8 @@ def _InitDBConnection_appdb(
         try:
             # Timeout in seconds:  1 hour = 60 * 60 second = 3600
             dbEngine = create_engine(strConnect, connect_args={"connect_timeout": 3600})
-            dctDBEngines[strCredentialSet] = dbEngine
+            if strAdmin == "N":
+                dbEngine = _CacheEngine(tupEngineKey, dbEngine)
 
         except SQLAlchemyError as e:
             raise ValueError(
@@ -294,11 +361,14 @@ def _InitDBConnection_appdb(
     return con
 
 
-def _InitDBConnection_target_db(flavor_service, strCredentialSet, strRaw="N", user_override=None, pwd_override=None):
+def _InitDBConnection_target_db(
+    flavor_service, dctCredentials, strCredentialSet, strRaw="N", user_override=None, pwd_override=None
+):
     # Get DBEngine using credentials
-    if strCredentialSet in dctDBEngines:
+    tupEngineKey = _GetEngineKey(dctCredentials, user_override, pwd_override)
+    if tupEngineKey in dctDBEngines:
         # Retrieve existing engine from store
-        dbEngine = dctDBEngines[strCredentialSet]
+        dbEngine = dctDBEngines[tupEngineKey]
     else:
         # Handle user override
         if user_override is not None:
@@ -320,40 +390,42 @@ def _InitDBConnection_target_db(flavor_service, strCredentialSet, strRaw="N", us
 
         try:
             # Timeout in seconds:  1 hour = 60 * 60 second = 3600
-            dbEngine = create_engine(strConnect, connect_args=connect_args)
-            dctDBEngines[strCredentialSet] = dbEngine
+            dbEngine = create_engine(strConnect, connect_args=connect_args, **flavor_service.get_engine_args())
+            queries = flavor_service.get_pre_connection_queries()
+            if queries:
+                event.listen(dbEngine, "connect", _GetPreConnectionListener(queries))
+            dbEngine = _CacheEngine(tupEngineKey, dbEngine)
 
         except SQLAlchemyError as e:
             raise ValueError(f"Failed to create engine for database {flavor_service.get_db_name}") from e
 
-    # Second, create a connection from our engine
-    queries = flavor_service.get_pre_connection_queries()
+    # Second, check out a connection from our engine's pool
     if strRaw == "N":
         connection = dbEngine.connect()
+    else:
+        connection = dbEngine.raw_connection()
+
+    return connection
+
+
+def _GetPreConnectionListener(queries):
+    # Runs once per physical connection, not on every checkout from the pool
+    def _RunPreConnectionQueries(dbapi_connection, connection_record):  # NOQA ARG001
+        cur = dbapi_connection.cursor()
         for query in queries:
             try:
-                connection.execute(text(query))
+                cur.execute(query)
             except Exception:
                 LOG.warning(
                     f"failed executing pre connection query: `{query}`",
                     exc_info=settings.IS_DEBUG,
                     stack_info=settings.IS_DEBUG,
                 )
-    else:
-        connection = dbEngine.raw_connection()
-        with connection.cursor() as cur:
-            for query in queries:
-                try:
-                    cur.execute(query)
-                except Exception:
-                    LOG.warning(
-                        f"failed executing pre connection query: `{query}`",
-                        exc_info=settings.IS_DEBUG,
-                        stack_info=settings.IS_DEBUG,
-                    )
-        connection.commit()
+        cur.close()
+        # Commit so session settings survive the rollback when connections are returned to the pool
+        dbapi_connection.commit()
 
-    return connection
+    return _RunPreConnectionQueries
 
 
 def CreateDatabaseIfNotExists(strDBName: str, params_mapping: dict, delete_db: bool, drop_users_and_roles: bool = True):
@@ -453,80 +525,409 @@ class _CThreadedFetch:
         self.strCredentialSet = strCredentialSet
         self.count_lock = count_lock
         self.count = 0
+        self.thread_local = threading.local()
+        self.connections = []
+
+    def _GetConnection(self):
+        # Each worker keeps the connection it checked out for the whole run
+        con = getattr(self.thread_local, "connection", None)
+        if con is None:
+            con = _InitDBConnection(self.strCredentialSet)
+            self.thread_local.connection = con
+            with self.count_lock:
+                self.connections.append(con)
+        return con
+
+    def _DiscardConnection(self, con):
+        self.thread_local.connection = None
+        with self.count_lock:
+            self.connections.remove(con)
+        # Invalidate rather than close, so the pool replaces the connection instead of handing it out again
+        with suppress(Exception):
+            con.invalidate()
+        with suppress(Exception):
+            con.close()
 
-    def __call__(self, strQuery):
+    def close(self):
+        # Returns all worker connections to the pool
+        with self.count_lock:
+            connections, self.connections = self.connections, []
+        for con in connections:
+            with suppress(Exception):
+                con.close()
+
+    def __call__(self, strQuery, booFinalAttempt=True):
         colNames = None
         lstResult = None
         booError = False
+        booThrottled = False
 
         with self.count_lock:
             self.count += 1
             i = self.count
 
         try:
-            with _InitDBConnection(self.strCredentialSet) as con:
-                try:
-                    exQ = con.execute(text(strQuery))
-                    lstResult = exQ.fetchall()
-                    if not colNames:
-                        colNames = exQ.keys()
-                    LOG.info("(Processed Threaded Query %s on thread %s)", i, threading.current_thread().name)
-                except Exception:
-                    LOG.exception(f"Failed Query. LastQuery: {strQuery}")
-                    booError = True
+            con = self._GetConnection()
         except Exception as e:
             LOG.info("LastQuery: %s", strQuery)
             raise ValueError(f"Failed to execute threaded query: {e}") from e
-        else:
-            return lstResult, colNames, booError
 
+        start_time = time.monotonic()
+        try:
+            with con.begin():
+                exQ = con.execute(text(strQuery))
+                colNames = exQ.keys()
+                lstResult = self._FetchResults(exQ, colNames)
+            lstResult = self._DeliverResults(lstResult, colNames)
+            LOG.info("(Processed Threaded Query %s on thread %s)", i, threading.current_thread().name)
+        except Exception as e:
+            booError = True
+            booThrottled = _IsThrottleError(e)
+            if booThrottled and not booFinalAttempt:
+                LOG.warning("Threaded Query %s was throttled by the database and will be retried: %s", i, e)
+            else:
+                LOG.exception(f"Failed Query. LastQuery: {strQuery}")
+            # Don't reuse a connection that may have been left in a failed state
+            self._DiscardConnection(con)
+
+        return lstResult, colNames, booError, booThrottled, time.monotonic() - start_time
+
+    def _FetchResults(self, exQ, colNames):  # NOQA ARG002
+        return exQ.fetchall()
+
+    def _DeliverResults(self, lstResult, colNames):  # NOQA ARG002
+        # Called once the query has succeeded, with everything _FetchResults returned
+        return lstResult
+
+
+# Driver error codes raised when the database rejects a query because of concurrency,
+# queueing or rate limits rather than a problem with the query
+THROTTLE_SQLSTATES = {
+    "53300",  # too_many_connections (PostgreSQL, Redshift)
+    "53400",  # configuration_limit_exceeded (PostgreSQL, Redshift)
+}
+THROTTLE_SNOWFLAKE_ERRNOS = {
+    610,  # Warehouse queue timeout
+    625,  # Statement queue limit reached
+}
+THROTTLE_MSSQL_ERROR_NUMBERS = {
+    "10928",  # Resource limit reached (Azure SQL)
+    "10929",  # Minimum resources not available (Azure SQL)
+    "40501",  # Service is busy (Azure SQL)
+}
+THROTTLE_TRINO_ERROR_NAMES = {"QUERY_QUEUE_FULL"}
+THROTTLE_HTTP_STATUSES = {429, 503}
+
+# Seconds of added latency ignored as jitter when deciding whether concurrency is hurting query times
+MIN_LATENCY_DEGRADATION = 0.5
+
+
+def _IsThrottleError(exception):
+    # Only the driver error is classified: SQLAlchemy's message also carries the statement and its parameters
+    orig = getattr(exception, "orig", None)
+    if orig is None:
+        return False
+
+    if (getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)) in THROTTLE_SQLSTATES:
+        return True
+    if type(orig).__module__.startswith("snowflake."):
+        return getattr(orig, "errno", None) in THROTTLE_SNOWFLAKE_ERRNOS
+    if type(orig).__module__.startswith("databricks."):
+        context = getattr(orig, "context", None) or {}
+        return context.get("http-code") in THROTTLE_HTTP_STATUSES
+    if type(orig).__module__.startswith("trino."):
+        return (
+            getattr(orig, "error_name", None) in THROTTLE_TRINO_ERROR_NAMES
+            or getattr(orig, "status_code", None) in THROTTLE_HTTP_STATUSES
+        )
+    if type(orig).__module__ == "pyodbc" and len(orig.args) > 1:
+        # pyodbc messages end with the native error number, e.g. "... Service is busy. (40501)"
+        error_numbers = re.findall(r"\((\d+)\)", str(orig.args[1]))
+        return any(number in THROTTLE_MSSQL_ERROR_NUMBERS for number in error_numbers)
+    return False
+
+
+class _CConcurrencyController:
+    """
+    Adjusts the number of concurrent queries between min and max limits:
+    grows by one after each window of queries that ran without errors at steady latency,
+    shrinks by one when latency degrades or most queries fail, and halves on throttling.
+    """
+
+    def __init__(self, intMinThreads, intMaxThreads, fltLatencyTolerance):
+        self.min_threads = intMinThreads
+        self.max_threads = intMaxThreads
+        self.latency_tolerance = fltLatencyTolerance
+        self.limit = intMinThreads
+        self.baseline_latency = None
+        self._ResetWindow()
+        LOG.info(
+            "Adaptive concurrency: starting at %s concurrent queries (min %s, max %s)",
+            self.limit,
+            self.min_threads,
+            self.max_threads,
+        )
+
+    def _ResetWindow(self):
+        self.window_latencies = []
+        self.window_errors = 0
+
+    def _SetLimit(self, intLimit, strReason):
+        intLimit = max(self.min_threads, min(self.max_threads, intLimit))
+        if intLimit != self.limit:
+            LOG.info("Adaptive concurrency: %s -> %s concurrent queries (%s)", self.limit, intLimit, strReason)
+            self.limit = intLimit
+        self._ResetWindow()
+
+    def Record(self, fltLatency, booError, booThrottled):
+        if booThrottled:
+            self._SetLimit(self.limit // 2, "database throttled a query")
+            return
+
+        self.window_latencies.append(fltLatency)
+        self.window_errors += 1 if booError else 0
+        # Judge each setting on as many queries as were allowed to run at once
+        if len(self.window_latencies) < self.limit:
+            return
+
+        fltAvgLatency = sum(self.window_latencies) / len(self.window_latencies)
+        if self.baseline_latency is None or fltAvgLatency < self.baseline_latency:
+            self.baseline_latency = fltAvgLatency
+        else:
+            # Let the baseline drift so a run of uniformly heavier queries doesn't pin concurrency down
+            self.baseline_latency = 0.9 * self.baseline_latency + 0.1 * fltAvgLatency
+
+        if self.window_errors * 2 > len(self.window_latencies):
+            self._SetLimit(self.limit - 1, f"{self.window_errors} of {len(self.window_latencies)} queries failed")
+        elif fltAvgLatency > max(
+            self.baseline_latency * self.latency_tolerance, self.baseline_latency + MIN_LATENCY_DEGRADATION
+        ):
+            self._SetLimit(
+                self.limit - 1,
+                f"average latency {fltAvgLatency:.2f}s above baseline {self.baseline_latency:.2f}s",
+            )
+        elif self.window_errors == 0 and self.limit < self.max_threads:
+            self._SetLimit(self.limit + 1, f"average latency {fltAvgLatency:.2f}s steady")
+        else:
+            self._ResetWindow()
 
-def RunThreadedRetrievalQueryList(strCredentialSet, lstQueries, intMaxThreads):
-    LOG.info("CurrentDB Operation: RunThreadedRetrievalQueryList. Creds: %s", strCredentialSet)
 
-    lstResults = []
+def _RunThreadedFetch(clsThreadedFetch, lstQueries, intMaxThreads, intMinThreads, evtStop=None):
+    # evtStop, when set, stops queries that haven't started yet from running
     colNames = []
     intErrors = 0
 
-    if intMaxThreads is None:
-        intMaxThreads = 4
-    elif intMaxThreads < 1 or intMaxThreads > 10:
-        intMaxThreads = 4
+    if intMaxThreads is None or intMaxThreads < 1:
+        intMaxThreads = settings.PROJECT_CONNECTION_MAX_THREADS
+    if intMinThreads is None and clsThreadedFetch.strCredentialSet == "PROJECT":
+        intMinThreads = get_connect_parms().min_threads
+    if intMinThreads is None:
+        intMinThreads = settings.PROJECT_CONNECTION_MIN_THREADS
+    intMinThreads = max(1, min(intMinThreads, intMaxThreads))
 
     qq = qu.Queue()
 
-    for query in lstQueries:
-        qq.put(query)
+    for intOrder, query in enumerate(lstQueries):
+        qq.put((query, intOrder, 0))
 
-    # Initialize count and lock
-    count_lock = threading.Lock()
+    clsController = _CConcurrencyController(
+        intMinThreads, intMaxThreads, settings.PROJECT_CONNECTION_LATENCY_TOLERANCE
+    )
 
-    clsThreadedFetch = _CThreadedFetch(strCredentialSet, count_lock)
+    # Results are keyed by query position so they come back in query order, retries included
+    dctResults = {}
+    dctFutures = {}
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=intMaxThreads) as executor:
         try:
-            futures = []
-            while not qq.empty():
-                query = qq.get()
-                futures.append(executor.submit(clsThreadedFetch, query))
-
-            for future in futures:
-                lstOneResult, colName, booError = future.result()
-                # if spinner:
-                #     spinner.next()
-                intErrors += 1 if booError else 0
-                if lstOneResult:
-                    lstResults.append(lstOneResult)
-                    colNames = colName
+            while not qq.empty() or dctFutures:
+                if evtStop is not None and evtStop.is_set() and not qq.empty():
+                    LOG.warning("Threaded queries stopped: %s queries were not run", qq.qsize())
+                    with suppress(qu.Empty):
+                        while True:
+                            qq.get_nowait()
+                while not qq.empty() and len(dctFutures) < clsController.limit:
+                    query, intOrder, intAttempt = qq.get()
+                    booFinalAttempt = intAttempt >= settings.PROJECT_CONNECTION_THROTTLE_RETRIES
+                    # Workers run in a copy of the caller's context, to use the same project connection
+                    future = executor.submit(
+                        contextvars.copy_context().run, clsThreadedFetch, query, booFinalAttempt
+                    )
+                    dctFutures[future] = (query, intOrder, intAttempt)
+
+                done, _ = concurrent.futures.wait(dctFutures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    query, intOrder, intAttempt = dctFutures.pop(future)
+                    lstOneResult, colName, booError, booThrottled, fltLatency = future.result()
+                    clsController.Record(fltLatency, booError, booThrottled)
+                    if booThrottled and intAttempt < settings.PROJECT_CONNECTION_THROTTLE_RETRIES:
+                        qq.put((query, intOrder, intAttempt + 1))
+                        continue
+                    intErrors += 1 if booError else 0
+                    if lstOneResult:
+                        dctResults[intOrder] = lstOneResult
+                    if colName:
+                        colNames = colName
 
         except Exception:
             LOG.exception("Failed to execute threaded queries")
 
+    # Workers are done: return their connections to the pool
+    clsThreadedFetch.close()
+
+    return dctResults, colNames, intErrors
+
+
+def RunThreadedRetrievalQueryList(strCredentialSet, lstQueries, intMaxThreads, intMinThreads=None):
+    LOG.info("CurrentDB Operation: RunThreadedRetrievalQueryList. Creds: %s", strCredentialSet)
+
+    # Initialize count and lock
+    count_lock = threading.Lock()
+
+    clsThreadedFetch = _CThreadedFetch(strCredentialSet, count_lock)
+    dctResults, colNames, intErrors = _RunThreadedFetch(clsThreadedFetch, lstQueries, intMaxThreads, intMinThreads)
+
+    lstResults = [dctResults[intOrder] for intOrder in sorted(dctResults)]
+
     lstResults = [element for sublist in lstResults for element in sublist]
 
     return lstResults, colNames, intErrors
 
 
+def _CopyChunksToDB(strCredentialSet, iterChunks, lstColumns, strDBTable):
+    con = _InitDBConnection(strCredentialSet, "Y")
+    try:
+        cur = con.cursor()
+
+        # Get list of column names for COPY statement
+        strColumnNames = ", ".join(lstColumns)
+        strCopySQL = f"COPY {strDBTable} ({strColumnNames}) FROM STDIN WITH (FORMAT CSV)"
+        LOG.debug("Last Query='%s'", strCopySQL)
+
+        clsCopyStream = CSVCopyStream(iterChunks)
+        cur.copy_expert(strCopySQL, clsCopyStream)
+        con.commit()
+    finally:
+        con.close()
+    return clsCopyStream.row_count
+
+
+class _CThreadedStreamFetch(_CThreadedFetch):
+    """
+    Threaded fetch that passes each successful query's result rows to a bounded queue in chunks
+    instead of returning them, blocking workers whenever the writer falls behind.
+    """
+
+    def __init__(self, strCredentialSet, count_lock, chunk_queue, writer_failed):
+        super().__init__(strCredentialSet, count_lock)
+        self.chunk_queue = chunk_queue
+        self.writer_failed = writer_failed
+
+    def _PutChunk(self, colNames, lstRows):
+        while True:
+            if self.writer_failed.is_set():
+                raise ValueError("Streaming ingestion writer stopped before all results were saved.")
+            try:
+                self.chunk_queue.put((colNames, lstRows), timeout=1)
+                return
+            except qu.Full:
+                continue
+
+    def _FetchResults(self, exQ, colNames):  # NOQA ARG002
+        # Rows are staged until the query has returned all of them, so a query that fails
+        # or is retried after throttling leaves nothing behind in the target table
+        lstChunks = []
+        while lstRows := exQ.fetchmany(settings.INGEST_CHUNK_ROWS):
+            lstChunks.append(lstRows)
+        return lstChunks
+
+    def _DeliverResults(self, lstResult, colNames):
+        # Errors from here on come from the writer, never the database, so the query isn't retried
+        colNames = list(colNames)
+        for lstRows in lstResult:
+            self._PutChunk(colNames, lstRows)
+        return None
+
+
+def RunThreadedRetrievalQueryListToDB(
+    strCredentialSet, lstQueries, intMaxThreads, strTargetCredentialSet, strDBTable, fnTransformRows=None
+):
+    """
+    Runs queries like RunThreadedRetrievalQueryList, but copies each query's result rows into the
+    target table once the query succeeds, so memory use doesn't grow with the total number of result rows.
+
+    fnTransformRows optionally reshapes each chunk of rows, returning (rows, column names).
+    Returns the number of rows saved, the column names and the number of failed queries.
+    """
+    LOG.info(
+        "CurrentDB Operation: RunThreadedRetrievalQueryListToDB. Creds: %s -> %s (%s)",
+        strCredentialSet,
+        strTargetCredentialSet,
+        strDBTable,
+    )
+
+    chunk_queue = qu.Queue(maxsize=settings.INGEST_QUEUE_CHUNKS)
+    writer_failed = threading.Event()
+    dctWriter = {"row_count": 0, "error": None}
+
+    def _GetChunk(tupChunk):
+        lstColumns, lstRows = tupChunk
+        if fnTransformRows:
+            lstRows, lstColumns = fnTransformRows(lstRows)
+        return list(lstColumns), lstRows
+
+    def _GetChunks(lstColumns):
+        while (tupChunk := chunk_queue.get()) is not None:
+            lstChunkColumns, lstRows = _GetChunk(tupChunk)
+            # The COPY statement names its columns once, so every chunk must share them
+            if lstChunkColumns != lstColumns:
+                raise ValueError(
+                    f"Result columns {lstChunkColumns} don't match the columns being saved to {strDBTable}: {lstColumns}"
+                )
+            yield lstRows
+
+    def _WriteChunks():
+        try:
+            # Column names are only known once the first query returns rows
+            tupFirstChunk = chunk_queue.get()
+            if tupFirstChunk is None:
+                return
+            lstColumns, lstFirstRows = _GetChunk(tupFirstChunk)
+            iterChunks = itertools.chain([lstFirstRows], _GetChunks(lstColumns))
+            dctWriter["row_count"] = _CopyChunksToDB(strTargetCredentialSet, iterChunks, lstColumns, strDBTable)
+        except Exception as e:
+            dctWriter["error"] = e
+            writer_failed.set()
+            # Unblock any workers waiting on a full queue
+            with suppress(qu.Empty):
+                while True:
+                    chunk_queue.get_nowait()
+
+    # Initialize count and lock
+    count_lock = threading.Lock()
+
+    clsThreadedFetch = _CThreadedStreamFetch(strCredentialSet, count_lock, chunk_queue, writer_failed)
+
+    writer_thread = threading.Thread(
+        target=contextvars.copy_context().run, args=(_WriteChunks,), name="ingest-writer"
+    )
+    writer_thread.start()
+    try:
+        _, colNames, intErrors = _RunThreadedFetch(clsThreadedFetch, lstQueries, intMaxThreads, None, writer_failed)
+    finally:
+        while writer_thread.is_alive():
+            with suppress(qu.Full):
+                chunk_queue.put(None, timeout=1)
+                break
+        writer_thread.join()
+
+    if dctWriter["error"]:
+        raise ValueError(f"Failed to save results to {strDBTable}") from dctWriter["error"]
+
+    LOG.info("%s records saved to %s", dctWriter["row_count"], strDBTable)
+    return dctWriter["row_count"], colNames, intErrors
+
+
 def RetrieveDBResultsToList(strCredentialSet, strRunSQL):
     LOG.info("CurrentDB Operation: RetrieveDBResultsToList. Creds: %s", strCredentialSet)
 
@@ -586,39 +987,21 @@ def WriteListToDB(strCredentialSet, lstData, lstColumns, strDBTable):
     LOG.debug("(Processing ingestion query: %s records)", lstData)
 
     # List should have same column names as destination table, though not all columns in table are required
-    # Use COPY for DKTG database, otherwise executemany()
-    con = _InitDBConnection(strCredentialSet, "Y")
-    cur = con.cursor()
+    # Use COPY for DKTG database, otherwise the flavor's bulk insert
     if strCredentialSet == "DKTG":
-        # Write List to CSV in memory
-        sio = FilteredStringIO(["\x00"])
-        writer = csv.writer(sio, quoting=csv.QUOTE_MINIMAL)
-        writer.writerows(lstData)
-        sio.seek(0)
-
-        # Get list of column names for COPY statement
-        strColumnNames = ", ".join(lstColumns)
-        strCopySQL = f"COPY {strDBTable} ({strColumnNames}) FROM STDIN WITH (FORMAT CSV)"
-        LOG.debug("Last Query='%s'", strCopySQL)
-
-        cur.copy_expert(strCopySQL, sio)
-        con.commit()
+        # Encode to CSV one chunk at a time rather than copying the whole list into memory
+        intChunkRows = settings.INGEST_CHUNK_ROWS
+        iterChunks = (lstData[i : i + intChunkRows] for i in range(0, len(lstData), intChunkRows))
+        _CopyChunksToDB(strCredentialSet, iterChunks, lstColumns, strDBTable)
     else:
-        # Get list of column names and column names formatted as parms
-        strColumnNames = ", ".join(lstColumns)
-        lstColumnParms = [":" + column_name for column_name in lstColumns]
-        strColumnParms = ", ".join(lstColumnParms)
-
-        # Prep data as list of dictionaries
-        lstRowDicts = [dict(row) for row in lstData]
-
-        strInsertSQL = "INSERT INTO " + strDBTable + "(" + strColumnNames + ")" + " VALUES (" + strColumnParms + ")"
-        LOG.debug("Last Query='%s'", strInsertSQL)
+        # Bulk load the way the target flavor handles best
+        dctCredentials = _GetDBCredentials(strCredentialSet)
+        flavor_service = get_flavor_service(dctCredentials["dbtype"])
+        flavor_service.init(dctCredentials)
 
-        exQ = con.execute(text(strInsertSQL), lstRowDicts)
-        con.commit()
-        LOG.debug("%s records saved", exQ.rowcount)
-    con.close()
+        with _InitDBConnection(strCredentialSet) as con, con.begin():
+            intRowCount = flavor_service.bulk_insert(con, strDBTable, lstColumns, lstData)
+        LOG.debug("%s records saved", intRowCount)
 
 
 def replace_params(query: str, params_mapping: dict) -> str:
@@ -1,9 +1,20 @@
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from sqlalchemy import column, table
+from sqlalchemy.engine import Connection
 
 from testgen import settings
 from testgen.common.encrypt import DecryptText
 
 
+def batched_rows(rows: Iterable, batch_size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
 class FlavorService:
 
     url = None
@@ -19,6 +30,10 @@ class FlavorService:
     private_key_passphrase = None
     http_path = None
     catalog = None
+    max_threads = None
+    pool_max_overflow = None
+    pool_pre_ping = None
+    pool_recycle = None
 
     def init(self, connection_params: dict):
         self.url = connection_params.get("url", None)
@@ -32,6 +47,10 @@ class FlavorService:
         self.connect_by_key = connection_params.get("connect_by_key", False)
         self.http_path = connection_params.get("http_path", None)
         self.catalog = connection_params.get("catalog", None)
+        self.max_threads = connection_params.get("max_threads", None)
+        self.pool_max_overflow = connection_params.get("pool_max_overflow", None)
+        self.pool_pre_ping = connection_params.get("pool_pre_ping", None)
+        self.pool_recycle = connection_params.get("pool_recycle", None)
 
         private_key = connection_params.get("private_key", None)
         if isinstance(private_key, memoryview):
@@ -57,9 +76,31 @@ class FlavorService:
             return {"TrustServerCertificate": "yes"}
         return {}
 
+    def get_engine_args(self) -> dict:
+        # Pool is sized so each worker of the threaded query runner keeps its own connection.
+        # Pool settings come from the connection, falling back to the global settings.
+        return {
+            "pool_size": self.max_threads or settings.PROJECT_CONNECTION_MAX_THREADS,
+            "max_overflow": (
+                self.pool_max_overflow if self.pool_max_overflow is not None else settings.TARGET_DB_POOL_MAX_OVERFLOW
+            ),
+            "pool_pre_ping": self.pool_pre_ping if self.pool_pre_ping is not None else settings.TARGET_DB_POOL_PRE_PING,
+            "pool_recycle": self.pool_recycle if self.pool_recycle is not None else settings.TARGET_DB_POOL_RECYCLE,
+        }
+
     def get_concat_operator(self):
         return "||"
 
+    def bulk_insert(self, connection: Connection, table_name: str, columns: list[str], rows: Iterable) -> int:
+        # Generic fallback: batches of rows sent as multi-row INSERT ... VALUES statements rendered by the dialect
+        schema, _, name = table_name.rpartition(".")
+        target = table(name, *[column(column_name) for column_name in columns], schema=schema or None)
+        row_count = 0
+        for batch in batched_rows(rows, settings.TARGET_DB_INSERT_BATCH_SIZE):
+            connection.execute(target.insert().values([dict(zip(columns, row, strict=True)) for row in batch]))
+            row_count += len(batch)
+        return row_count
+
     def get_connection_string(self, strPW, is_password_overwritten: bool = False):
         if self.connect_by_url:
             header = self.get_connection_string_head(strPW)
@@ -1,7 +1,8 @@
 from urllib.parse import quote_plus
 import logging
 
-from testgen.common.database.flavor.flavor_service import FlavorService
+from testgen import settings
+from testgen.common.database.flavor.flavor_service import FlavorService, batched_rows
 
 LOG = logging.getLogger(__name__)
 
@@ -59,3 +60,15 @@ class MssqlFlavorService(FlavorService):
 
     def get_concat_operator(self):
         return "+"
+
+    def bulk_insert(self, connection, table_name, columns, rows):
+        # pyodbc sends whole parameter arrays in one round trip with fast_executemany
+        cursor = connection.connection.cursor()
+        cursor.fast_executemany = True
+        insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        row_count = 0
+        for batch in batched_rows(rows, settings.TARGET_DB_INSERT_BATCH_SIZE):
+            cursor.executemany(insert_sql, [tuple(row) for row in batch])
+            row_count += len(batch)
+        cursor.close()
+        return row_count
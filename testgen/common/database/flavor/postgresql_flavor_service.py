@@ -1,5 +1,15 @@
 from testgen.common.database.flavor.redshift_flavor_service import RedshiftFlavorService
 import logging
 
+from testgen import settings
+from testgen.common.database import CSVCopyStream
+from testgen.common.database.flavor.flavor_service import batched_rows
+
+
 class PostgresqlFlavorService(RedshiftFlavorService):
-    pass
+    def bulk_insert(self, connection, table_name, columns, rows):
+        cursor = connection.connection.cursor()
+        copy_stream = CSVCopyStream(batched_rows(rows, settings.TARGET_DB_INSERT_BATCH_SIZE))
+        cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)", copy_stream)
+        cursor.close()
+        return copy_stream.row_count
@@ -1,7 +1,10 @@
 from urllib.parse import quote_plus
 import logging
 
-from testgen.common.database.flavor.flavor_service import FlavorService
+from psycopg2.extras import execute_values
+
+from testgen import settings
+from testgen.common.database.flavor.flavor_service import FlavorService, batched_rows
 
 LOG = logging.getLogger("testgen")
 
@@ -25,3 +28,14 @@ class RedshiftFlavorService(FlavorService):
 
     def get_connect_args(self, is_password_overwritten: bool = False):  # NOQA ARG002
         return {}
+
+    def bulk_insert(self, connection, table_name, columns, rows):
+        # Redshift only COPYs from cloud storage: send pages of multi-row VALUES through psycopg2 instead
+        cursor = connection.connection.cursor()
+        insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+        row_count = 0
+        for batch in batched_rows(rows, settings.TARGET_DB_INSERT_BATCH_SIZE):
+            execute_values(cursor, insert_sql, [tuple(row) for row in batch], page_size=len(batch))
+            row_count += len(batch)
+        cursor.close()
+        return row_count
@@ -105,6 +105,26 @@ class ScoreDefinition(Base):
         definitions = db_session.scalars(query).unique().all()
         return definitions
 
+    @classmethod
+    def for_table_group(cls, project_code: str, table_group_id: str) -> "Iterable[Self]":
+        """
+        Returns the definitions whose filters can include data of the table group.
+
+        Query templates:
+        get_table_group_score_definitions.sql
+        """
+        db_session = get_current_session()
+        definition_ids = db_session.scalars(text(
+            read_template_sql_file("get_table_group_score_definitions.sql", sub_directory="score_cards")
+            .replace("{project_code}", project_code)
+            .replace("{table_group_id}", str(table_group_id))
+        )).all()
+        if not definition_ids:
+            return []
+
+        query = select(ScoreDefinition).where(ScoreDefinition.id.in_(definition_ids)).order_by(ScoreDefinition.name)
+        return db_session.scalars(query).unique().all()
+
     def save(self) -> None:
         db_session = get_current_session()
         db_session.add(self)
@@ -261,6 +281,32 @@ class ScoreDefinition(Base):
 
         return [row.to_dict() for _, row in results.iterrows()]
 
+    def get_score_card_breakdowns(self) -> list[dict]:
+        """
+        Executes a single raw query for the breakdowns of every grouping
+        and score type, each limited to its 100 highest impact items.
+
+        Query templates:
+        get_score_card_breakdowns.sql
+        """
+        profile_records_filters = self._get_raw_query_filters(prefix="profiling_records.")
+        test_records_filters = self._get_raw_query_filters(prefix="test_records.")
+        records_count_filters = " AND ".join([
+            f"({profile_filter} OR {test_filter})"
+            for profile_filter, test_filter in zip(profile_records_filters, test_records_filters, strict=False)
+        ])
+        cde_records_count_filter = (
+            "(profiling_records.critical_data_element IN (true) OR test_records.critical_data_element IN (true))"
+        )
+
+        query = (
+            read_template_sql_file("get_score_card_breakdowns.sql", sub_directory="score_cards")
+            .replace("{filters}", " AND ".join(self._get_raw_query_filters()))
+            .replace("{records_count_filters}", records_count_filters)
+            .replace("{cde_records_count_filter}", cde_records_count_filter)
+        )
+        return [dict(row) for row in get_current_session().execute(text(query)).mappings().all()]
+
     def get_score_card_issues(
         self,
         score_type: Literal["score", "cde_score"],
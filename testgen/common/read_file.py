@@ -1,4 +1,10 @@
-__all__ = ["get_template_files", "read_template_sql_file", "read_template_yaml_file"]
+__all__ = [
+    "compile_template_sql_file",
+    "get_template_files",
+    "read_template_sql_file",
+    "read_template_yaml_file",
+    "render_template",
+]
 
 import logging
 import re
@@ -13,6 +19,7 @@ LOG = logging.getLogger("testgen")
 
 DK_FUNCTIONS_PATTERN = re.compile(r"<%(\w+)(?:;(.+?))?%>")
 DK_FUNCTIONS_ARG_REPL_PATTERN = re.compile(r"\{\$(\d+)\}")
+TEMPLATE_PARM_PATTERN = re.compile(r"\{([A-Z][A-Z0-9_]*)\}")
 
 def _get_template_package_resource(
     template_file_name: str | None = None,
@@ -91,6 +98,9 @@ def replace_templated_functions(query: str, db_flavour: str) -> str:
     # I.E OK TO DO sql: "<%FOO;{COLUM_NAME}%>" and yaml: "FOO: foo({$1})"
     # NOT OK TO DO sql: "<%FOO%>" and yaml: "FOO: foo({"COLUM_NAME"})"
 
+    if "<%" not in query:
+        return query
+
     query_parts = []
     end_pos = 0
     for func_match in DK_FUNCTIONS_PATTERN.finditer(query):
@@ -116,3 +126,52 @@ def replace_templated_functions(query: str, db_flavour: str) -> str:
 
     query_parts.append(query[end_pos:])
     return "".join(query_parts)
+
+
+class CompiledTemplate:
+    """
+    A query template split once into its literal text and the parameter names between them
+    """
+
+    __slots__ = ("literals", "parm_names")
+
+    def __init__(self, template: str):
+        parts = TEMPLATE_PARM_PATTERN.split(template)
+        # Split alternates literal text and captured parameter names, starting and ending with literal text
+        self.literals = parts[0::2]
+        self.parm_names = parts[1::2]
+
+    def render(self, parms: dict[str, str]) -> str:
+        query_parts = [self.literals[0]]
+        for parm_name, literal in zip(self.parm_names, self.literals[1:], strict=True):
+            value = parms.get(parm_name)
+            if value is None:
+                # Unknown parameters are left in place, as a chain of replacements would
+                value = "{" + parm_name + "}"
+            query_parts.append(value)
+            query_parts.append(literal)
+        return "".join(query_parts)
+
+
+@cache
+def compile_template_sql_file(template_file_name: str, sub_directory: str | None = None) -> CompiledTemplate:
+    return CompiledTemplate(read_template_sql_file(template_file_name, sub_directory))
+
+
+def render_template(template: str | CompiledTemplate, parms: dict[str, str], db_flavour: str | None = None) -> str:
+    """
+    Renders all {PARM} placeholders of the template in a single pass, then expands templated functions
+    for the flavor. Values are inserted as they are, without resolving placeholders inside them.
+    Template files should be passed compiled; strings are compiled for this call only.
+    """
+    if isinstance(template, str):
+        template = CompiledTemplate(template)
+    query = template.render(parms)
+    if db_flavour:
+        query = replace_templated_functions(query, db_flavour)
+    return query
+
+
+def get_template_cache_stats() -> dict[str, int]:
+    cache_info = compile_template_sql_file.cache_info()
+    return {"hits": cache_info.hits, "misses": cache_info.misses, "size": cache_info.currsize}
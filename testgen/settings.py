@@ -204,6 +204,35 @@ from env variable: `PROJECT_CONNECTION_MAX_THREADS`
 defaults to: `4`
 """
 
+PROJECT_CONNECTION_MIN_THREADS: int = int(os.getenv("TG_PROJECT_CONNECTION_MIN_THREADS", "2"))
+"""
+Number of concurrent queries the threaded query runner starts with and
+never backs off below, for connections that don't set `min_threads`.
+Concurrency is ramped from here up to the connection's `max_threads`
+while query latency holds steady.
+
+from env variable: `TG_PROJECT_CONNECTION_MIN_THREADS`
+defaults to: `2`
+"""
+
+PROJECT_CONNECTION_LATENCY_TOLERANCE: float = float(os.getenv("TG_PROJECT_CONNECTION_LATENCY_TOLERANCE", "2.0"))
+"""
+Factor by which the average query latency may exceed its best observed
+level before the threaded query runner reduces concurrency.
+
+from env variable: `TG_PROJECT_CONNECTION_LATENCY_TOLERANCE`
+defaults to: `2.0`
+"""
+
+PROJECT_CONNECTION_THROTTLE_RETRIES: int = int(os.getenv("TG_PROJECT_CONNECTION_THROTTLE_RETRIES", "3"))
+"""
+Number of times a query rejected by the database for exceeding its
+concurrency or rate limits is queued again before counting as an error.
+
+from env variable: `TG_PROJECT_CONNECTION_THROTTLE_RETRIES`
+defaults to: `3`
+"""
+
 PROJECT_CONNECTION_MAX_QUERY_CHAR: int = int(os.getenv("PROJECT_CONNECTION_MAX_QUERY_CHAR", "5000"))
 """
 Determine how many tests are grouped together in a single query.
@@ -275,6 +304,128 @@ from env variable: `TG_TARGET_DB_TRUST_SERVER_CERTIFICATE`
 defaults to: `True`
 """
 
+TARGET_DB_POOL_MAX_OVERFLOW: int = int(os.getenv("TG_TARGET_DB_POOL_MAX_OVERFLOW", "2"))
+"""
+Connections that may be opened to the database under testing beyond
+the pool size, which is set to the connection's `max_threads`.
+Applies to connections that don't set `pool_max_overflow`.
+
+from env variable: `TG_TARGET_DB_POOL_MAX_OVERFLOW`
+defaults to: `2`
+"""
+
+TARGET_DB_POOL_PRE_PING: bool = os.getenv("TG_TARGET_DB_POOL_PRE_PING", "yes").lower() in ["yes", "true"]
+"""
+When True, pooled connections to the database under testing are
+checked for liveness before being reused.
+Applies to connections that don't set `pool_pre_ping`.
+
+from env variable: `TG_TARGET_DB_POOL_PRE_PING`
+defaults to: `True`
+"""
+
+TARGET_DB_POOL_RECYCLE: int = int(os.getenv("TG_TARGET_DB_POOL_RECYCLE", "3600"))
+"""
+Seconds after which pooled connections to the database under testing
+are replaced, so they don't outlive server-side idle timeouts.
+Applies to connections that don't set `pool_recycle`.
+
+from env variable: `TG_TARGET_DB_POOL_RECYCLE`
+defaults to: `3600`
+"""
+
+APP_DB_POOL_SIZE: int = int(os.getenv("TG_APP_DB_POOL_SIZE", "5"))
+"""
+Connections kept open to the TestGen database by the UI, shared by all
+sessions of the process.
+
+from env variable: `TG_APP_DB_POOL_SIZE`
+defaults to: `5`
+"""
+
+APP_DB_POOL_MAX_OVERFLOW: int = int(os.getenv("TG_APP_DB_POOL_MAX_OVERFLOW", "10"))
+"""
+Connections the UI may open to the TestGen database beyond the pool size
+under load.
+
+from env variable: `TG_APP_DB_POOL_MAX_OVERFLOW`
+defaults to: `10`
+"""
+
+APP_DB_POOL_RECYCLE: int = int(os.getenv("TG_APP_DB_POOL_RECYCLE", "3600"))
+"""
+Seconds after which the UI's pooled connections to the TestGen database
+are replaced.
+
+from env variable: `TG_APP_DB_POOL_RECYCLE`
+defaults to: `3600`
+"""
+
+APP_DB_SLOW_QUERY_SECONDS: float = float(os.getenv("TG_APP_DB_SLOW_QUERY_SECONDS", "1"))
+"""
+UI queries to the TestGen database taking longer than this are logged as
+warnings; all query timings are logged at debug level.
+
+from env variable: `TG_APP_DB_SLOW_QUERY_SECONDS`
+defaults to: `1`
+"""
+
+UI_TARGET_DB_POOL_SIZE: int = int(os.getenv("TG_UI_TARGET_DB_POOL_SIZE", "2"))
+"""
+Connections the UI keeps open to each database under testing for source
+data lookups and data previews. The pool does not overflow.
+
+from env variable: `TG_UI_TARGET_DB_POOL_SIZE`
+defaults to: `2`
+"""
+
+UI_TARGET_DB_ENGINE_IDLE_SECONDS: int = int(os.getenv("TG_UI_TARGET_DB_ENGINE_IDLE_SECONDS", "600"))
+"""
+Seconds after its last use that the UI closes the connections to a
+database under testing.
+
+from env variable: `TG_UI_TARGET_DB_ENGINE_IDLE_SECONDS`
+defaults to: `600`
+"""
+
+UI_TARGET_DB_MAX_ENGINES: int = int(os.getenv("TG_UI_TARGET_DB_MAX_ENGINES", "16"))
+"""
+Databases under testing the UI keeps connections to at once; the least
+recently used is closed beyond this.
+
+from env variable: `TG_UI_TARGET_DB_MAX_ENGINES`
+defaults to: `16`
+"""
+
+TARGET_DB_INSERT_BATCH_SIZE: int = int(os.getenv("TG_TARGET_DB_INSERT_BATCH_SIZE", "1000"))
+"""
+Number of rows sent per batch when bulk loading into the database under
+testing: one multi-row INSERT, executemany call or COPY chunk.
+
+from env variable: `TG_TARGET_DB_INSERT_BATCH_SIZE`
+defaults to: `1000`
+"""
+
+INGEST_CHUNK_ROWS: int = int(os.getenv("TG_INGEST_CHUNK_ROWS", "5000"))
+"""
+Number of result rows fetched from the database under testing, and
+encoded for COPY into the application database, at a time.
+
+from env variable: `TG_INGEST_CHUNK_ROWS`
+defaults to: `5000`
+"""
+
+INGEST_QUEUE_CHUNKS: int = int(os.getenv("TG_INGEST_QUEUE_CHUNKS", "8"))
+"""
+Number of fetched result chunks that may wait to be copied into the
+application database before query workers pause. Each query's rows are
+held until the query completes, so memory use is bounded by the results of
+the queries in flight plus these chunks.
+
+from env variable: `TG_INGEST_QUEUE_CHUNKS`
+defaults to: `8`
+"""
+
 DEFAULT_TABLE_GROUPS_NAME: str = os.getenv("DEFAULT_TABLE_GROUPS_NAME", "default")
 """
 Name assigned to the auto generated table group.
@@ -352,6 +503,98 @@ from env variable: `DEFAULT_PROFILING_USE_SAMPLING`
 defaults to: `N`
 """
 
+PROFILING_BATCH_BY_TABLE: bool = os.getenv("TG_PROFILING_BATCH_BY_TABLE", "no").lower() in ["yes", "true"]
+"""
+When True, profiling builds one wide aggregate query per table instead
+of one query per column, so each table is scanned once. Tables whose
+columns don't fit in the connection's `max_query_chars` are split into
+several queries.
+
+from env variable: `TG_PROFILING_BATCH_BY_TABLE`
+defaults to: `False`
+"""
+
+PROFILING_BATCH_MAX_COLUMNS: int = int(os.getenv("TG_PROFILING_BATCH_MAX_COLUMNS", "50"))
+"""
+When `PROFILING_BATCH_BY_TABLE` is set, the maximum number of columns
+profiled by a single table-level query. Keeps the select list under the
+column limits of the target databases.
+
+from env variable: `TG_PROFILING_BATCH_MAX_COLUMNS`
+defaults to: `50`
+"""
+
+PROFILING_INCREMENTAL: bool = os.getenv("TG_PROFILING_INCREMENTAL", "no").lower() in ["yes", "true"]
+"""
+When True, profiling runs only re-profile tables that changed since the
+table group's last completed run, judged by exact record count, by
+last-modified or write statistics metadata where the flavor exposes it,
+and by the table's columns. Other tables carry forward their previous
+profile results, marked with the run they were reused from. Full runs
+record these signals too, so an incremental run can follow either kind.
+
+from env variable: `TG_PROFILING_INCREMENTAL`
+defaults to: `False`
+"""
+
+PROFILING_APPROX_STATS: bool = os.getenv("TG_PROFILING_APPROX_STATS", "no").lower() in ["yes", "true"]
+"""
+When True, profiling runs estimate distinct value counts and percentiles
+with the flavor's approximate functions (HyperLogLog and sketch based)
+instead of computing them exactly. Estimated fields are listed in each
+profile result's `estimated_fields`. On PostgreSQL, this requires the
+`hll` extension; runs fall back to exact statistics without it.
+
+from env variable: `TG_PROFILING_APPROX_STATS`
+defaults to: `False`
+"""
+
+PROFILING_SINGLE_PASS_FREQS: bool = os.getenv("TG_PROFILING_SINGLE_PASS_FREQS", "no").lower() in ["yes", "true"]
+"""
+When True, frequency analysis runs as one grouped scan per table across
+its qualifying columns, instead of a separate scan of every qualifying column.
+Columns qualify by the distinct count and value length found in the first
+profiling round.
+
+from env variable: `TG_PROFILING_SINGLE_PASS_FREQS`
+defaults to: `False`
+"""
+
+JOB_QUEUE_ENABLED: bool = os.getenv("TG_JOB_QUEUE_ENABLED", "no").lower() in ["yes", "true"]
+"""
+When True, profiling and test runs requested through the API or its
+scheduler are queued in the application database instead of running in
+the API process. They are executed by `testgen run-worker` processes.
+
+from env variable: `TG_JOB_QUEUE_ENABLED`
+defaults to: `False`
+"""
+
+JOB_WORKER_MAX_JOBS: int = int(os.getenv("TG_JOB_WORKER_MAX_JOBS", "4"))
+"""
+Maximum number of queued jobs running at once, across all workers.
+
+from env variable: `TG_JOB_WORKER_MAX_JOBS`
+defaults to: `4`
+"""
+
+JOB_WORKER_MAX_JOBS_PER_CONNECTION: int = int(os.getenv("TG_JOB_WORKER_MAX_JOBS_PER_CONNECTION", "1"))
+"""
+Maximum number of queued jobs running at once against the same
+connection, across all workers.
+
+from env variable: `TG_JOB_WORKER_MAX_JOBS_PER_CONNECTION`
+defaults to: `1`
+"""
+
+JOB_WORKER_POLL_SECONDS: float = float(os.getenv("TG_JOB_WORKER_POLL_SECONDS", "5"))
+"""
+Seconds a worker waits between checks of the job queue.
+
+from env variable: `TG_JOB_WORKER_POLL_SECONDS`
+defaults to: `5`
+"""
+
 OBSERVABILITY_API_URL: str = os.getenv("OBSERVABILITY_API_URL", "")
 """
 API URL of your instance of Observability where to send events to for
@@ -384,12 +627,40 @@ defaults to: `True`
 OBSERVABILITY_EXPORT_LIMIT: int = int(os.getenv("TG_OBSERVABILITY_EXPORT_MAX_QTY", "5000"))
 """
 When exporting to your instance of Observabilty, the maximum number of
-events that will be sent to the events API on a single export.
+queued results read from the database at a time.
 
 from env variable: `TG_OBSERVABILITY_EXPORT_MAX_QTY`
 defaults to: `5000`
 """
 
+OBSERVABILITY_EXPORT_MAX_IN_FLIGHT: int = int(os.getenv("TG_OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", "4"))
+"""
+When exporting to your instance of Observabilty, the maximum number of
+event requests sent to the events API concurrently.
+
+from env variable: `TG_OBSERVABILITY_EXPORT_MAX_IN_FLIGHT`
+defaults to: `4`
+"""
+
+OBSERVABILITY_EXPORT_RETRIES: int = int(os.getenv("TG_OBSERVABILITY_EXPORT_RETRIES", "3"))
+"""
+When exporting to your instance of Observabilty, the number of times an
+event request is retried after a connection error, a timeout or a
+429/5xx response, waiting twice as long before each retry.
+
+from env variable: `TG_OBSERVABILITY_EXPORT_RETRIES`
+defaults to: `3`
+"""
+
+OBSERVABILITY_EXPORT_GZIP: bool = os.getenv("TG_OBSERVABILITY_EXPORT_GZIP", "no").lower() in ["yes", "true"]
+"""
+When True, event requests sent to your instance of Observabilty are
+gzip-compressed. Enable only if your instance accepts gzip request bodies.
+
+from env variable: `TG_OBSERVABILITY_EXPORT_GZIP`
+defaults to: `False`
+"""
+
 OBSERVABILITY_DEFAULT_COMPONENT_TYPE: str = os.getenv("OBSERVABILITY_DEFAULT_COMPONENT_TYPE", "dataset")
 """
 When exporting to your instance of Observabilty, the type of event that
@@ -72,7 +72,11 @@ CREATE TABLE connections (
    connection_name        VARCHAR(40),
    project_pw_encrypted   BYTEA,
    max_threads            INTEGER DEFAULT 4,
+   min_threads            INTEGER,
    max_query_chars        INTEGER,
+   pool_max_overflow      INTEGER,
+   pool_pre_ping          BOOLEAN,
+   pool_recycle           INTEGER,
    url VARCHAR(200) default '',
    connect_by_url BOOLEAN default FALSE,
    connect_by_key BOOLEAN DEFAULT FALSE,
@@ -115,7 +119,8 @@ CREATE TABLE table_groups
     data_product             VARCHAR(40),
     last_complete_profile_run_id UUID,
     dq_score_profiling       FLOAT,
-    dq_score_testing         FLOAT
+    dq_score_testing         FLOAT,
+    last_disposition_update  TIMESTAMP
 );
 
 
@@ -302,11 +307,211 @@ CREATE TABLE profile_results (
    pii_flag              VARCHAR(50),
    functional_data_type  VARCHAR(50),
    functional_table_type VARCHAR(50),
-   sample_ratio          FLOAT
+   sample_ratio          FLOAT,
+   estimated_fields      VARCHAR(200),
+   reused_profile_run_id UUID
 );
 
 ALTER SEQUENCE profile_results_dk_id_seq OWNED BY profile_results.dk_id;
 
+CREATE TABLE job_queue (
+   id                 UUID DEFAULT gen_random_uuid() NOT NULL
+      CONSTRAINT pk_job_queue_id
+         PRIMARY KEY,
+   job_type           VARCHAR(20)  NOT NULL,
+   connection_id      BIGINT,
+   table_groups_id    UUID,
+   project_code       VARCHAR(30),
+   test_suite         VARCHAR(200),
+   status             VARCHAR(20)  DEFAULT 'Queued' NOT NULL,
+   enqueued_at        TIMESTAMP    DEFAULT NOW(),
+   started_at         TIMESTAMP,
+   completed_at       TIMESTAMP,
+   worker_id          VARCHAR(150),
+   worker_start_time  DOUBLE PRECISION,
+   process_id         INTEGER,
+   process_start_time DOUBLE PRECISION,
+   message            VARCHAR
+);
+
+CREATE TABLE profile_table_signatures (
+   profile_run_id        UUID,
+   table_groups_id       UUID,
+   schema_name           VARCHAR(50),
+   table_name            VARCHAR(120),
+   record_ct             BIGINT,
+   column_ct             BIGINT,
+   change_signal         VARCHAR(100),
+   ddf_hash              VARCHAR(40),
+   reused_profile_run_id UUID,
+   CONSTRAINT profile_table_signatures_pk
+      PRIMARY KEY (profile_run_id, schema_name, table_name)
+);
+
+
+CREATE TABLE dashboard_profiling_rollup (
+   rollup_date            DATE   NOT NULL,
+   connection_id          BIGINT NOT NULL,
+   table_groups_id        UUID   NOT NULL,
+   profiling_run_ct       INTEGER,
+   scored_run_ct          INTEGER,
+   dq_score_profiling_sum FLOAT,
+   result_ct              BIGINT,
+   record_ct_sum          BIGINT,
+   null_value_ct_sum      BIGINT,
+   distinct_value_ct_sum  BIGINT,
+   refreshed_at           TIMESTAMP,
+   CONSTRAINT dashboard_profiling_rollup_pk
+      PRIMARY KEY (rollup_date, connection_id, table_groups_id)
+);
+
+CREATE TABLE dashboard_profiling_tables (
+   table_groups_id UUID         NOT NULL,
+   table_name      VARCHAR(120) NOT NULL,
+   connection_id   BIGINT,
+   max_record_ct   BIGINT,
+   CONSTRAINT dashboard_profiling_tables_pk
+      PRIMARY KEY (table_groups_id, table_name)
+);
+
+CREATE TABLE dashboard_profiling_columns (
+   table_groups_id UUID         NOT NULL,
+   column_name     VARCHAR(120) NOT NULL,
+   connection_id   BIGINT,
+   CONSTRAINT dashboard_profiling_columns_pk
+      PRIMARY KEY (table_groups_id, column_name)
+);
+
+CREATE TABLE dashboard_test_rollup (
+   rollup_date           DATE   NOT NULL,
+   connection_id         BIGINT NOT NULL,
+   table_groups_id       UUID   NOT NULL,
+   test_suite_id         UUID   NOT NULL,
+   test_run_ct           INTEGER,
+   scored_run_ct         INTEGER,
+   dq_score_test_run_sum FLOAT,
+   test_ct               BIGINT,
+   passed_ct             BIGINT,
+   failed_ct             BIGINT,
+   warning_ct            BIGINT,
+   dq_record_ct_sum      BIGINT,
+   refreshed_at          TIMESTAMP,
+   CONSTRAINT dashboard_test_rollup_pk
+      PRIMARY KEY (rollup_date, connection_id, table_groups_id, test_suite_id)
+);
+
+-- Latest scoring detail per table group, refreshed from the v_dq_*_scoring_latest_* views after each run
+CREATE TABLE dq_profile_scoring_latest_by_column (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   profile_run_id     UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   profiling_run_date TIMESTAMP,
+   issue_ct           BIGINT,
+   record_ct          BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dpslc_pc_tg_tn_cn
+   ON dq_profile_scoring_latest_by_column(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_profile_scoring_latest_by_dimension (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   profile_run_id     UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   dq_dimension       VARCHAR(50),
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   run_date           TIMESTAMP,
+   record_ct          BIGINT,
+   issue_ct           BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dpsld_pc_tg_tn_cn
+   ON dq_profile_scoring_latest_by_dimension(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_test_scoring_latest_by_column (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   test_suite_id      UUID,
+   test_run_id        UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   test_time          TIMESTAMP,
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(500),
+   test_ct            BIGINT,
+   passed_ct          BIGINT,
+   issue_ct           BIGINT,
+   dq_record_ct       BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dtslc_pc_tg_tn_cn
+   ON dq_test_scoring_latest_by_column(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_test_scoring_latest_by_dimension (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   test_suite_id      UUID,
+   test_run_id        UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   dq_dimension       VARCHAR(50),
+   test_time          TIMESTAMP,
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   test_ct            BIGINT,
+   passed_ct          BIGINT,
+   issue_ct           BIGINT,
+   dq_record_ct       BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dtsld_pc_tg_tn_cn
+   ON dq_test_scoring_latest_by_dimension(project_code, table_groups_id, table_name, column_name);
 
 CREATE TABLE profile_anomaly_types (
    id                  VARCHAR(10)  NOT NULL
@@ -728,6 +933,10 @@ CREATE INDEX profile_results_tgid_sn_tn_cn
     ON profile_results (table_groups_id, schema_name, table_name, column_name);
 
 
+-- Index job_queue
+CREATE INDEX ix_jq_status_enqueued
+   ON job_queue(status, enqueued_at);
+
 -- Index test_suites
 CREATE UNIQUE INDEX uix_ts_id
    ON test_suites(id);
@@ -775,6 +984,9 @@ CREATE INDEX ix_tr_pc_ts
 CREATE INDEX ix_tr_trun
    ON test_results(test_run_id);
 
+CREATE INDEX ix_tr_ts_rid
+   ON test_results(test_suite_id, result_id);
+
 CREATE INDEX ix_tr_tt
    ON test_results(test_type);
 
@@ -17,6 +17,16 @@ GRANT SELECT, INSERT, DELETE, UPDATE ON
     {SCHEMA_NAME}.test_definitions,
     {SCHEMA_NAME}.profiling_runs,
     {SCHEMA_NAME}.profile_results,
+    {SCHEMA_NAME}.profile_table_signatures,
+    {SCHEMA_NAME}.job_queue,
+    {SCHEMA_NAME}.dashboard_profiling_rollup,
+    {SCHEMA_NAME}.dashboard_profiling_tables,
+    {SCHEMA_NAME}.dashboard_profiling_columns,
+    {SCHEMA_NAME}.dashboard_test_rollup,
+    {SCHEMA_NAME}.dq_profile_scoring_latest_by_column,
+    {SCHEMA_NAME}.dq_profile_scoring_latest_by_dimension,
+    {SCHEMA_NAME}.dq_test_scoring_latest_by_column,
+    {SCHEMA_NAME}.dq_test_scoring_latest_by_dimension,
     {SCHEMA_NAME}.profile_pair_rules,
     {SCHEMA_NAME}.profile_anomaly_results,
     {SCHEMA_NAME}.stg_functional_table_updates,
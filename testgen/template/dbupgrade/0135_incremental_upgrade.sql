@@ -0,0 +1,18 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+ALTER TABLE profile_results
+   ADD COLUMN reused_profile_run_id UUID;
+
+CREATE TABLE profile_table_signatures (
+   profile_run_id        UUID,
+   table_groups_id       UUID,
+   schema_name           VARCHAR(50),
+   table_name            VARCHAR(120),
+   record_ct             BIGINT,
+   column_ct             BIGINT,
+   change_signal         VARCHAR(100),
+   ddf_hash              VARCHAR(40),
+   reused_profile_run_id UUID,
+   CONSTRAINT profile_table_signatures_pk
+      PRIMARY KEY (profile_run_id, schema_name, table_name)
+);
@@ -0,0 +1,4 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+ALTER TABLE profile_results
+   ADD COLUMN estimated_fields VARCHAR(200);
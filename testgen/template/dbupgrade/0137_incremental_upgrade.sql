@@ -0,0 +1,22 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+CREATE TABLE job_queue (
+   id              UUID DEFAULT gen_random_uuid() NOT NULL
+      CONSTRAINT pk_job_queue_id
+         PRIMARY KEY,
+   job_type        VARCHAR(20)  NOT NULL,
+   connection_id   BIGINT,
+   table_groups_id UUID,
+   project_code    VARCHAR(30),
+   test_suite      VARCHAR(200),
+   status          VARCHAR(20)  DEFAULT 'Queued' NOT NULL,
+   enqueued_at     TIMESTAMP    DEFAULT NOW(),
+   started_at      TIMESTAMP,
+   completed_at    TIMESTAMP,
+   worker_id       VARCHAR(150),
+   process_id      INTEGER,
+   message         VARCHAR
+);
+
+CREATE INDEX ix_jq_status_enqueued
+   ON job_queue(status, enqueued_at);
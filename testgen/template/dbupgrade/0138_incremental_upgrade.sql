@@ -0,0 +1,125 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+CREATE TABLE dashboard_profiling_rollup (
+   rollup_date            DATE   NOT NULL,
+   connection_id          BIGINT NOT NULL,
+   table_groups_id        UUID   NOT NULL,
+   profiling_run_ct       INTEGER,
+   scored_run_ct          INTEGER,
+   dq_score_profiling_sum FLOAT,
+   result_ct              BIGINT,
+   record_ct_sum          BIGINT,
+   null_value_ct_sum      BIGINT,
+   distinct_value_ct_sum  BIGINT,
+   refreshed_at           TIMESTAMP,
+   CONSTRAINT dashboard_profiling_rollup_pk
+      PRIMARY KEY (rollup_date, connection_id, table_groups_id)
+);
+
+CREATE TABLE dashboard_profiling_tables (
+   table_groups_id UUID         NOT NULL,
+   table_name      VARCHAR(120) NOT NULL,
+   connection_id   BIGINT,
+   max_record_ct   BIGINT,
+   CONSTRAINT dashboard_profiling_tables_pk
+      PRIMARY KEY (table_groups_id, table_name)
+);
+
+CREATE TABLE dashboard_profiling_columns (
+   table_groups_id UUID         NOT NULL,
+   column_name     VARCHAR(120) NOT NULL,
+   connection_id   BIGINT,
+   CONSTRAINT dashboard_profiling_columns_pk
+      PRIMARY KEY (table_groups_id, column_name)
+);
+
+CREATE TABLE dashboard_test_rollup (
+   rollup_date           DATE   NOT NULL,
+   connection_id         BIGINT NOT NULL,
+   table_groups_id       UUID   NOT NULL,
+   test_suite_id         UUID   NOT NULL,
+   test_run_ct           INTEGER,
+   scored_run_ct         INTEGER,
+   dq_score_test_run_sum FLOAT,
+   test_ct               BIGINT,
+   passed_ct             BIGINT,
+   failed_ct             BIGINT,
+   warning_ct            BIGINT,
+   dq_record_ct_sum      BIGINT,
+   refreshed_at          TIMESTAMP,
+   CONSTRAINT dashboard_test_rollup_pk
+      PRIMARY KEY (rollup_date, connection_id, table_groups_id, test_suite_id)
+);
+
+-- Backfill the dashboard rollups from existing history
+INSERT INTO dashboard_profiling_rollup
+      (rollup_date, connection_id, table_groups_id,
+       profiling_run_ct, scored_run_ct, dq_score_profiling_sum,
+       result_ct, record_ct_sum, null_value_ct_sum, distinct_value_ct_sum, refreshed_at)
+SELECT r.profiling_starttime::DATE,
+       r.connection_id,
+       r.table_groups_id,
+       COUNT(*),
+       COUNT(r.dq_score_profiling),
+       SUM(r.dq_score_profiling),
+       SUM(pr.result_ct),
+       SUM(pr.record_ct_sum),
+       SUM(pr.null_value_ct_sum),
+       SUM(pr.distinct_value_ct_sum),
+       NOW()
+  FROM profiling_runs r
+LEFT JOIN (SELECT profile_run_id,
+                  COUNT(*) AS result_ct,
+                  SUM(record_ct) AS record_ct_sum,
+                  SUM(null_value_ct) AS null_value_ct_sum,
+                  SUM(distinct_value_ct) AS distinct_value_ct_sum
+             FROM profile_results
+           GROUP BY profile_run_id) pr
+   ON (r.id = pr.profile_run_id)
+ WHERE r.profiling_starttime IS NOT NULL
+GROUP BY r.profiling_starttime::DATE, r.connection_id, r.table_groups_id;
+
+INSERT INTO dashboard_profiling_tables
+      (table_groups_id, table_name, connection_id, max_record_ct)
+SELECT table_groups_id, table_name, MAX(connection_id), MAX(record_ct)
+  FROM profile_results
+ WHERE table_groups_id IS NOT NULL
+   AND table_name IS NOT NULL
+GROUP BY table_groups_id, table_name;
+
+INSERT INTO dashboard_profiling_columns
+      (table_groups_id, column_name, connection_id)
+SELECT table_groups_id, column_name, MAX(connection_id)
+  FROM profile_results
+ WHERE table_groups_id IS NOT NULL
+   AND column_name IS NOT NULL
+GROUP BY table_groups_id, column_name;
+
+INSERT INTO dashboard_test_rollup
+      (rollup_date, connection_id, table_groups_id, test_suite_id,
+       test_run_ct, scored_run_ct, dq_score_test_run_sum,
+       test_ct, passed_ct, failed_ct, warning_ct, dq_record_ct_sum, refreshed_at)
+SELECT r.test_starttime::DATE,
+       s.connection_id,
+       s.table_groups_id,
+       r.test_suite_id,
+       COUNT(*),
+       COUNT(r.dq_score_test_run),
+       SUM(r.dq_score_test_run),
+       SUM(r.test_ct),
+       SUM(r.passed_ct),
+       SUM(r.failed_ct),
+       SUM(r.warning_ct),
+       SUM(tr.dq_record_ct_sum),
+       NOW()
+  FROM test_runs r
+INNER JOIN test_suites s
+   ON (r.test_suite_id = s.id)
+LEFT JOIN (SELECT test_run_id, SUM(dq_record_ct) AS dq_record_ct_sum
+             FROM test_results
+           GROUP BY test_run_id) tr
+   ON (r.id = tr.test_run_id)
+ WHERE r.test_starttime IS NOT NULL
+   AND s.connection_id IS NOT NULL
+   AND s.table_groups_id IS NOT NULL
+GROUP BY r.test_starttime::DATE, s.connection_id, s.table_groups_id, r.test_suite_id;
@@ -0,0 +1,4 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+CREATE INDEX ix_tr_ts_rid
+   ON test_results(test_suite_id, result_id);
@@ -0,0 +1,158 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+CREATE TABLE dq_profile_scoring_latest_by_column (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   profile_run_id     UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   profiling_run_date TIMESTAMP,
+   issue_ct           BIGINT,
+   record_ct          BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dpslc_pc_tg_tn_cn
+   ON dq_profile_scoring_latest_by_column(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_profile_scoring_latest_by_dimension (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   profile_run_id     UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   dq_dimension       VARCHAR(50),
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   run_date           TIMESTAMP,
+   record_ct          BIGINT,
+   issue_ct           BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dpsld_pc_tg_tn_cn
+   ON dq_profile_scoring_latest_by_dimension(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_test_scoring_latest_by_column (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   test_suite_id      UUID,
+   test_run_id        UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   test_time          TIMESTAMP,
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(500),
+   test_ct            BIGINT,
+   passed_ct          BIGINT,
+   issue_ct           BIGINT,
+   dq_record_ct       BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dtslc_pc_tg_tn_cn
+   ON dq_test_scoring_latest_by_column(project_code, table_groups_id, table_name, column_name);
+
+CREATE TABLE dq_test_scoring_latest_by_dimension (
+   project_code       VARCHAR(30),
+   table_groups_id    UUID,
+   test_suite_id      UUID,
+   test_run_id        UUID,
+   table_groups_name  VARCHAR(100),
+   data_location      VARCHAR(40),
+   data_source        VARCHAR(40),
+   source_system      VARCHAR(40),
+   source_process     VARCHAR(40),
+   business_domain    VARCHAR(40),
+   stakeholder_group  VARCHAR(40),
+   transform_level    VARCHAR(40),
+   critical_data_element BOOLEAN,
+   data_product       VARCHAR(40),
+   semantic_data_type VARCHAR(50),
+   dq_dimension       VARCHAR(50),
+   test_time          TIMESTAMP,
+   table_name         VARCHAR(120),
+   column_name        VARCHAR(120),
+   test_ct            BIGINT,
+   passed_ct          BIGINT,
+   issue_ct           BIGINT,
+   dq_record_ct       BIGINT,
+   good_data_pct      FLOAT
+);
+
+CREATE INDEX ix_dtsld_pc_tg_tn_cn
+   ON dq_test_scoring_latest_by_dimension(project_code, table_groups_id, table_name, column_name);
+
+-- Fill the scoring tables from the scoring views
+INSERT INTO dq_profile_scoring_latest_by_column
+      (project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, table_name, column_name, profiling_run_date, issue_ct,
+       record_ct, good_data_pct)
+SELECT project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, table_name, column_name, profiling_run_date, issue_ct,
+       record_ct, good_data_pct
+  FROM v_dq_profile_scoring_latest_by_column;
+
+INSERT INTO dq_profile_scoring_latest_by_dimension
+      (project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, dq_dimension, table_name, column_name, run_date,
+       record_ct, issue_ct, good_data_pct)
+SELECT project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, dq_dimension, table_name, column_name, run_date,
+       record_ct, issue_ct, good_data_pct
+  FROM v_dq_profile_scoring_latest_by_dimension;
+
+INSERT INTO dq_test_scoring_latest_by_column
+      (project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, test_time, table_name, column_name,
+       test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, test_time, table_name, column_name,
+       test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct
+  FROM v_dq_test_scoring_latest_by_column;
+
+INSERT INTO dq_test_scoring_latest_by_dimension
+      (project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, dq_dimension, test_time, table_name,
+       column_name, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, dq_dimension, test_time, table_name,
+       column_name, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct
+  FROM v_dq_test_scoring_latest_by_dimension;
@@ -0,0 +1,6 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+ALTER TABLE connections
+   ADD COLUMN pool_max_overflow INTEGER,
+   ADD COLUMN pool_pre_ping     BOOLEAN,
+   ADD COLUMN pool_recycle      INTEGER;
@@ -0,0 +1,4 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+ALTER TABLE connections
+   ADD COLUMN min_threads INTEGER;
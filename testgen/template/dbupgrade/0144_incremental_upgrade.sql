@@ -0,0 +1,6 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Process start times, as epoch seconds, tell a worker or job process apart from a later process reusing its pid
+ALTER TABLE job_queue
+   ADD COLUMN worker_start_time DOUBLE PRECISION,
+   ADD COLUMN process_start_time DOUBLE PRECISION;
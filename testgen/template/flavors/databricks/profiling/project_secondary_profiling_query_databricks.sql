@@ -11,12 +11,12 @@ AS
 consol_vals
 AS (
     SELECT COALESCE (
-                CASE WHEN rn <= 10 THEN '| ' || `{COL_NAME}` || ' | ' || ct ELSE NULL END,
+                CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' || `{COL_NAME}` || ' | ' || ct ELSE NULL END,
                 '| Other Values (' || COUNT(DISTINCT CAST(`{COL_NAME}` as STRING)) || ') | ' || SUM(ct)
            ) AS val,
            MIN (rn) as min_rn
     FROM ranked_vals
-    GROUP BY CASE WHEN rn <= 10 THEN '| ' || `{COL_NAME}` || ' | ' || ct ELSE NULL
+    GROUP BY CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' || `{COL_NAME}` || ' | ' || ct ELSE NULL
              END
     )
 SELECT '{PROJECT_CODE}' as project_code,
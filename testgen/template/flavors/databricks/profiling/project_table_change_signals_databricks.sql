@@ -0,0 +1,4 @@
+SELECT table_schema || '.' || table_name AS schema_table,
+       CAST(last_altered AS STRING) AS change_signal
+  FROM information_schema.tables
+ WHERE table_schema = '{DATA_SCHEMA}';
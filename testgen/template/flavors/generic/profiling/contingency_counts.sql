@@ -1,3 +1,3 @@
-SELECT {CONTINGENCY_COLUMNS}, COUNT(*) as freq_ct
+SELECT '{DATA_SCHEMA}' AS schema_name, '{DATA_TABLE}' AS table_name, {CONTINGENCY_COLUMNS}, COUNT(*) as freq_ct
   FROM {DATA_SCHEMA}.{DATA_TABLE}
 GROUP BY {CONTINGENCY_COLUMNS};
@@ -0,0 +1,49 @@
+-- Get Freqs for all selected columns of a table in a single scan, in the same layout and order
+-- as the per-column secondary profiling queries, with each column's distinct value hash
+-- computed from the same counts
+WITH value_counts
+   AS (SELECT CASE {FREQ_NAME_CASES} END AS column_name,
+              CASE {FREQ_VALUE_CASES} END AS column_value,
+              COUNT(*) AS ct
+         FROM {DATA_SCHEMA}.{DATA_TABLE}
+        GROUP BY GROUPING SETS ({FREQ_GROUPING_SETS})),
+value_hashes
+   AS (SELECT column_name,
+              <%DISTINCT_VALUE_HASH;column_value%> AS distinct_value_hash
+         FROM value_counts
+        GROUP BY column_name),
+ranked_vals
+   AS (SELECT column_name,
+              column_value,
+              ct,
+              ROW_NUMBER() OVER (PARTITION BY column_name ORDER BY ct DESC, column_value) AS rn
+         FROM value_counts
+        WHERE column_value > ' '),
+consol_vals
+   AS (SELECT column_name,
+              <%FREQ_VALUE_LINE;column_value;ct%> AS val,
+              rn
+         FROM ranked_vals
+        WHERE rn <= {FREQ_TOP_VALUES}
+       UNION ALL
+       SELECT column_name,
+              <%FREQ_OTHER_LINE;COUNT(*);SUM(ct)%> AS val,
+              {FREQ_TOP_VALUES} + 1 AS rn
+         FROM ranked_vals
+        WHERE rn > {FREQ_TOP_VALUES}
+        GROUP BY column_name),
+top_freqs
+   AS (SELECT column_name,
+              <%FREQ_LINES_AGG;val;rn%> AS top_freq_values
+         FROM consol_vals
+        GROUP BY column_name)
+SELECT '{PROJECT_CODE}' AS project_code,
+       '{DATA_SCHEMA}' AS schema_name,
+       '{RUN_DATE}' AS run_date,
+       '{DATA_TABLE}' AS table_name,
+       h.column_name,
+       f.top_freq_values,
+       h.distinct_value_hash
+  FROM value_hashes h
+LEFT JOIN top_freqs f
+   ON (h.column_name = f.column_name);
@@ -10,14 +10,14 @@ AS
     ),
 consol_vals
 AS (
-    SELECT COALESCE (CASE WHEN rn <= 10 THEN '| ' + "{COL_NAME}" + ' | ' + CAST (ct AS VARCHAR)
+    SELECT COALESCE (CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' + "{COL_NAME}" + ' | ' + CAST (ct AS VARCHAR)
                                         ELSE NULL
                      END,
                     '| Other Values (' + CAST ( CAST(COUNT (DISTINCT CAST ("{COL_NAME}" as VARCHAR)) AS VARCHAR ) + ') | '
                     + CAST (SUM (ct) as VARCHAR) AS VARCHAR)) AS val,
             MIN (rn) as min_rn
     FROM ranked_vals
-    GROUP BY CASE WHEN rn <= 10 THEN '| ' + "{COL_NAME}" + ' | ' + CAST (ct AS VARCHAR) ELSE NULL
+    GROUP BY CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' + "{COL_NAME}" + ' | ' + CAST (ct AS VARCHAR) ELSE NULL
              END
     )
 SELECT '{PROJECT_CODE}' as project_code,
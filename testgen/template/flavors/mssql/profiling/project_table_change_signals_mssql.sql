@@ -0,0 +1,11 @@
+-- Last write since the server started: NULL after a restart, when only row counts are compared
+SELECT s.name + '.' + t.name AS schema_table,
+       CONVERT(VARCHAR(30), MAX(u.last_user_update), 126) AS change_signal
+  FROM sys.tables t
+INNER JOIN sys.schemas s
+   ON (t.schema_id = s.schema_id)
+LEFT JOIN sys.dm_db_index_usage_stats u
+  ON (u.database_id = DB_ID()
+ AND  u.object_id = t.object_id)
+ WHERE s.name = '{DATA_SCHEMA}'
+GROUP BY s.name, t.name;
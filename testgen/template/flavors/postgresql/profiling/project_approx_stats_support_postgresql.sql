@@ -0,0 +1,4 @@
+-- Approximate distinct counts rely on the postgresql-hll extension
+SELECT COUNT(*) AS support_ct
+  FROM pg_extension
+ WHERE extname = 'hll';
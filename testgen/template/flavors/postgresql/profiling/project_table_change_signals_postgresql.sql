@@ -0,0 +1,5 @@
+-- Rows written since statistics were last reset: changes whenever the table is modified
+SELECT schemaname || '.' || relname AS schema_table,
+       CAST(n_tup_ins + n_tup_upd + n_tup_del AS VARCHAR) AS change_signal
+  FROM pg_stat_user_tables
+ WHERE schemaname = '{DATA_SCHEMA}';
@@ -8,12 +8,12 @@ WITH ranked_vals AS (
    GROUP BY "{COL_NAME}"
 ),
 consol_vals AS (
-  SELECT COALESCE(CASE WHEN rn <= 10 THEN '| ' || "{COL_NAME}" || ' | ' || CAST(ct AS VARCHAR)
+  SELECT COALESCE(CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' || "{COL_NAME}" || ' | ' || CAST(ct AS VARCHAR)
                        ELSE NULL
                   END, '| Other Values (' || CAST(COUNT(DISTINCT "{COL_NAME}")  as VARCHAR) || ') | '  || CAST(SUM(ct)  as VARCHAR) ) AS val,
          MIN(rn) as min_rn
     FROM ranked_vals
-   GROUP BY CASE WHEN rn <= 10 THEN '| ' || "{COL_NAME}" || ' | ' || CAST(ct AS VARCHAR)
+   GROUP BY CASE WHEN rn <= {FREQ_TOP_VALUES} THEN '| ' || "{COL_NAME}" || ' | ' || CAST(ct AS VARCHAR)
                  ELSE NULL
             END
 )
@@ -0,0 +1,8 @@
+-- Moves a running job to a new worker, unless another worker already took it over
+UPDATE job_queue
+   SET worker_id = '{WORKER_ID}',
+       worker_start_time = {WORKER_START_TIME}
+ WHERE id = '{JOB_ID}'::UUID
+   AND status = 'Running'
+   AND worker_id = '{PREVIOUS_WORKER_ID}'
+RETURNING id;
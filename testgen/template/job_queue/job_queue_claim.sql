@@ -0,0 +1,28 @@
+-- Claims the oldest queued job that fits under the global and per-connection limits.
+-- The advisory lock serializes claims across workers, so running counts are exact.
+SELECT pg_advisory_xact_lock(hashtext('testgen_job_queue'));
+
+WITH running
+   AS (SELECT connection_id, COUNT(*) AS running_ct
+         FROM job_queue
+        WHERE status = 'Running'
+        GROUP BY connection_id),
+candidate
+   AS (SELECT q.id
+         FROM job_queue q
+       LEFT JOIN running r
+              ON (q.connection_id = r.connection_id)
+        WHERE q.status = 'Queued'
+          AND COALESCE(r.running_ct, 0) < {MAX_JOBS_PER_CONNECTION}
+          AND (SELECT COALESCE(SUM(running_ct), 0) FROM running) < {MAX_JOBS}
+        ORDER BY q.enqueued_at
+        LIMIT 1
+          FOR UPDATE OF q SKIP LOCKED)
+UPDATE job_queue
+   SET status = 'Running',
+       started_at = NOW(),
+       worker_id = '{WORKER_ID}',
+       worker_start_time = {WORKER_START_TIME}
+  FROM candidate
+ WHERE job_queue.id = candidate.id
+RETURNING job_queue.id;
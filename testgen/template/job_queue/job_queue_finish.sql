@@ -0,0 +1,5 @@
+UPDATE job_queue
+   SET status = '{JOB_STATUS}',
+       completed_at = NOW(),
+       message = NULLIF('{MESSAGE}', '')
+ WHERE id = '{JOB_ID}'::UUID;
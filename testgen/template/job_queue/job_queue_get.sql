@@ -0,0 +1,22 @@
+SELECT id,
+       job_type,
+       connection_id,
+       table_groups_id,
+       project_code,
+       test_suite,
+       status,
+       enqueued_at,
+       started_at,
+       completed_at,
+       worker_id,
+       process_id,
+       message,
+       CASE
+          WHEN status = 'Queued'
+             THEN (SELECT COUNT(*)
+                     FROM job_queue q
+                    WHERE q.status = 'Queued'
+                      AND q.enqueued_at < job_queue.enqueued_at)
+       END AS queue_position
+  FROM job_queue
+ WHERE id = '{JOB_ID}'::UUID;
@@ -0,0 +1,21 @@
+-- Latest profiling or test run recorded by a job's process, since the process exits normally after a failed run
+SELECT runs.status, runs.log_message
+  FROM job_queue j
+INNER JOIN (
+     SELECT 'profile' AS job_type, pr.table_groups_id, NULL::VARCHAR AS project_code, NULL::VARCHAR AS test_suite,
+            pr.process_id, pr.status, pr.log_message, pr.profiling_starttime AS run_starttime
+       FROM profiling_runs pr
+     UNION ALL
+     SELECT 'test', NULL::UUID, ts.project_code, ts.test_suite,
+            tr.process_id, tr.status, tr.log_message, tr.test_starttime
+       FROM test_runs tr
+     INNER JOIN test_suites ts
+             ON (tr.test_suite_id = ts.id)
+  ) runs
+       ON (runs.job_type = j.job_type
+       AND runs.process_id = j.process_id
+       AND (j.job_type <> 'profile' OR runs.table_groups_id = j.table_groups_id)
+       AND (j.job_type <> 'test' OR (runs.project_code = j.project_code AND runs.test_suite = j.test_suite)))
+ WHERE j.id = '{JOB_ID}'::UUID
+ORDER BY runs.run_starttime DESC
+ LIMIT 1;
@@ -0,0 +1,5 @@
+-- Jobs running under workers on this host, to settle or adopt those whose worker stopped
+SELECT id, worker_id, worker_start_time, process_id, process_start_time
+  FROM job_queue
+ WHERE status = 'Running'
+   AND worker_id LIKE '{WORKER_HOST}:%';
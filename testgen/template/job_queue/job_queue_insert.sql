@@ -0,0 +1,17 @@
+-- Queues a profiling or test job, recording the connection it runs against for per-connection limits
+INSERT INTO job_queue
+      (job_type, connection_id, table_groups_id, project_code, test_suite, status, enqueued_at)
+SELECT '{JOB_TYPE}',
+       COALESCE(tg.connection_id, ts.connection_id),
+       tg.id,
+       COALESCE(ts.project_code, tg.project_code),
+       ts.test_suite,
+       'Queued',
+       NOW()
+  FROM (SELECT 1) AS one
+LEFT JOIN table_groups tg
+       ON ('{JOB_TYPE}' = 'profile' AND tg.id = NULLIF('{TABLE_GROUPS_ID}', '')::UUID)
+LEFT JOIN test_suites ts
+       ON ('{JOB_TYPE}' = 'test' AND ts.project_code = '{PROJECT_CODE}' AND ts.test_suite = '{TEST_SUITE}')
+ WHERE tg.id IS NOT NULL OR ts.id IS NOT NULL
+RETURNING id;
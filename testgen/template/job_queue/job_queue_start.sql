@@ -0,0 +1,4 @@
+UPDATE job_queue
+   SET process_id = {PROCESS_ID},
+       process_start_time = {PROCESS_START_TIME}
+ WHERE id = '{JOB_ID}'::UUID;
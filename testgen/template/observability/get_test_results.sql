@@ -36,5 +36,6 @@ SELECT
 	measure_uom_description
 FROM v_queued_observability_results
 where test_suite_id = '{TEST_SUITE_ID}'
-order by start_time asc
+  and (COALESCE(start_time, 'infinity'::TIMESTAMP), result_id) > ('{AFTER_START_TIME}'::TIMESTAMP, {AFTER_RESULT_ID})
+order by COALESCE(start_time, 'infinity'::TIMESTAMP) asc, result_id asc
 limit {MAX_QTY_EVENTS}
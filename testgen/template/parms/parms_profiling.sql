@@ -27,7 +27,12 @@ SELECT cc.project_code,
        tg.profile_sample_min_count,
        tg.profile_do_pair_rules,
        tg.profile_pair_rule_pct,
-       cc.max_threads
+       cc.max_threads,
+       cc.min_threads,
+       cc.max_query_chars,
+       cc.pool_max_overflow,
+       cc.pool_pre_ping,
+       cc.pool_recycle
   FROM table_groups tg
   INNER JOIN connections cc
          on cc.project_code = tg.project_code
@@ -18,7 +18,11 @@ SELECT ts.project_code,
        cc.private_key,
        cc.private_key_passphrase,
        cc.max_threads,
+       cc.min_threads,
        cc.max_query_chars,
+       cc.pool_max_overflow,
+       cc.pool_pre_ping,
+       cc.pool_recycle,
        cc.url,
        cc.connect_by_url,
        cc.http_path
@@ -0,0 +1,146 @@
+-- Copies the latest profile of tables that haven't changed since the previous run into this run,
+-- keeping the run that actually profiled them in reused_profile_run_id
+INSERT INTO profile_results
+      (profile_run_id,
+       run_date,
+       reused_profile_run_id,
+       column_id,
+       project_code,
+       connection_id,
+       table_groups_id,
+       schema_name,
+       table_name,
+       position,
+       column_name,
+       column_type,
+       general_type,
+       record_ct,
+       value_ct,
+       distinct_value_ct,
+       distinct_std_value_ct,
+       null_value_ct,
+       min_length,
+       max_length,
+       avg_length,
+       zero_value_ct,
+       zero_length_ct,
+       lead_space_ct,
+       quoted_value_ct,
+       includes_digit_ct,
+       filled_value_ct,
+       min_text,
+       max_text,
+       upper_case_ct,
+       lower_case_ct,
+       non_alpha_ct,
+       numeric_ct,
+       date_ct,
+       top_patterns,
+       top_freq_values,
+       distinct_value_hash,
+       min_value,
+       min_value_over_0,
+       max_value,
+       avg_value,
+       stdev_value,
+       percentile_25,
+       percentile_50,
+       percentile_75,
+       fractional_sum,
+       min_date,
+       max_date,
+       before_1yr_date_ct,
+       before_5yr_date_ct,
+       before_20yr_date_ct,
+       before_100yr_date_ct,
+       within_1yr_date_ct,
+       within_1mo_date_ct,
+       future_date_ct,
+       distant_future_date_ct,
+       date_days_present,
+       date_weeks_present,
+       date_months_present,
+       boolean_true_ct,
+       datatype_suggestion,
+       distinct_pattern_ct,
+       embedded_space_ct,
+       avg_embedded_spaces,
+       std_pattern_match,
+       pii_flag,
+       functional_data_type,
+       functional_table_type,
+       sample_ratio,
+       estimated_fields)
+SELECT '{PROFILE_RUN_ID}'::UUID AS profile_run_id,
+       '{RUN_DATE}' AS run_date,
+       COALESCE(p.reused_profile_run_id, p.profile_run_id) AS reused_profile_run_id,
+       p.column_id,
+       p.project_code,
+       p.connection_id,
+       p.table_groups_id,
+       p.schema_name,
+       p.table_name,
+       p.position,
+       p.column_name,
+       p.column_type,
+       p.general_type,
+       p.record_ct,
+       p.value_ct,
+       p.distinct_value_ct,
+       p.distinct_std_value_ct,
+       p.null_value_ct,
+       p.min_length,
+       p.max_length,
+       p.avg_length,
+       p.zero_value_ct,
+       p.zero_length_ct,
+       p.lead_space_ct,
+       p.quoted_value_ct,
+       p.includes_digit_ct,
+       p.filled_value_ct,
+       p.min_text,
+       p.max_text,
+       p.upper_case_ct,
+       p.lower_case_ct,
+       p.non_alpha_ct,
+       p.numeric_ct,
+       p.date_ct,
+       p.top_patterns,
+       p.top_freq_values,
+       p.distinct_value_hash,
+       p.min_value,
+       p.min_value_over_0,
+       p.max_value,
+       p.avg_value,
+       p.stdev_value,
+       p.percentile_25,
+       p.percentile_50,
+       p.percentile_75,
+       p.fractional_sum,
+       p.min_date,
+       p.max_date,
+       p.before_1yr_date_ct,
+       p.before_5yr_date_ct,
+       p.before_20yr_date_ct,
+       p.before_100yr_date_ct,
+       p.within_1yr_date_ct,
+       p.within_1mo_date_ct,
+       p.future_date_ct,
+       p.distant_future_date_ct,
+       p.date_days_present,
+       p.date_weeks_present,
+       p.date_months_present,
+       p.boolean_true_ct,
+       p.datatype_suggestion,
+       p.distinct_pattern_ct,
+       p.embedded_space_ct,
+       p.avg_embedded_spaces,
+       p.std_pattern_match,
+       p.pii_flag,
+       p.functional_data_type,
+       p.functional_table_type,
+       p.sample_ratio,
+       p.estimated_fields
+  FROM profile_results p
+ WHERE p.profile_run_id = '{PREVIOUS_PROFILE_RUN_ID}'::UUID
+   AND p.schema_name || '.' || p.table_name IN ({REUSED_TABLES});
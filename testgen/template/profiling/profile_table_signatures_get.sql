@@ -0,0 +1,21 @@
+-- Change signals recorded by the table group's latest completed profiling run,
+-- for tables whose profile in that run is complete
+SELECT s.schema_name || '.' || s.table_name AS schema_table,
+       s.record_ct,
+       s.change_signal,
+       s.ddf_hash,
+       s.profile_run_id,
+       COALESCE(s.reused_profile_run_id, s.profile_run_id) AS source_profile_run_id
+  FROM profile_table_signatures s
+INNER JOIN (SELECT id
+              FROM profiling_runs
+             WHERE table_groups_id = '{TABLE_GROUPS_ID}'::UUID
+               AND status = 'Complete'
+             ORDER BY profiling_starttime DESC
+             LIMIT 1) r
+   ON (s.profile_run_id = r.id)
+ WHERE s.column_ct = (SELECT COUNT(*)
+                        FROM profile_results p
+                       WHERE p.profile_run_id = s.profile_run_id
+                         AND p.schema_name = s.schema_name
+                         AND p.table_name = s.table_name);
@@ -0,0 +1,8 @@
+-- Flag profile results of an approximate-statistics run with the fields
+-- that were computed by estimating functions rather than exactly.
+
+update profile_results
+set estimated_fields = CASE WHEN general_type = 'N' THEN '{ESTIMATED_FIELDS_N}' ELSE '{ESTIMATED_FIELDS}' END
+where profile_run_id = '{PROFILE_RUN_ID}'
+and reused_profile_run_id IS NULL
+and estimated_fields IS NULL;
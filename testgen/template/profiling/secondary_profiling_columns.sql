@@ -6,7 +6,8 @@ SELECT schema_name,
   FROM profile_results p
  WHERE p.profile_run_id = '{PROFILE_RUN_ID}'
    AND p.top_freq_values IS NULL
+   AND p.reused_profile_run_id IS NULL
    AND p.general_type = 'A'
-   AND p.distinct_value_ct BETWEEN 2 and 70
-   AND p.max_length <= 70
+   AND p.distinct_value_ct BETWEEN 2 and {FREQ_MAX_DISTINCT}
+   AND p.max_length <= {FREQ_MAX_LENGTH}
 ;
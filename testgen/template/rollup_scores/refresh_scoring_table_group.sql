@@ -0,0 +1,60 @@
+-- Replaces the table group's rows in the scoring tables with the current contents of the scoring views
+DELETE FROM dq_profile_scoring_latest_by_column
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+INSERT INTO dq_profile_scoring_latest_by_column
+      (project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, table_name, column_name, profiling_run_date, issue_ct,
+       record_ct, good_data_pct)
+SELECT project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, table_name, column_name, profiling_run_date, issue_ct,
+       record_ct, good_data_pct
+  FROM v_dq_profile_scoring_latest_by_column
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+DELETE FROM dq_profile_scoring_latest_by_dimension
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+INSERT INTO dq_profile_scoring_latest_by_dimension
+      (project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, dq_dimension, table_name, column_name, run_date,
+       record_ct, issue_ct, good_data_pct)
+SELECT project_code, table_groups_id, profile_run_id, table_groups_name, data_location, data_source,
+       source_system, source_process, business_domain, stakeholder_group, transform_level, critical_data_element,
+       data_product, semantic_data_type, dq_dimension, table_name, column_name, run_date,
+       record_ct, issue_ct, good_data_pct
+  FROM v_dq_profile_scoring_latest_by_dimension
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+DELETE FROM dq_test_scoring_latest_by_column
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+INSERT INTO dq_test_scoring_latest_by_column
+      (project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, test_time, table_name, column_name,
+       test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, test_time, table_name, column_name,
+       test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct
+  FROM v_dq_test_scoring_latest_by_column
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+DELETE FROM dq_test_scoring_latest_by_dimension
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
+
+INSERT INTO dq_test_scoring_latest_by_dimension
+      (project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, dq_dimension, test_time, table_name,
+       column_name, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT project_code, table_groups_id, test_suite_id, test_run_id, table_groups_name, data_location,
+       data_source, source_system, source_process, business_domain, stakeholder_group, transform_level,
+       critical_data_element, data_product, semantic_data_type, dq_dimension, test_time, table_name,
+       column_name, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct
+  FROM v_dq_test_scoring_latest_by_dimension
+ WHERE table_groups_id = '{TABLE_GROUPS_ID}';
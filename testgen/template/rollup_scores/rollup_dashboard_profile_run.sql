@@ -0,0 +1,55 @@
+-- Refresh the dashboard rollup for the profiling run's day and table group
+DELETE FROM dashboard_profiling_rollup d
+ USING profiling_runs r
+ WHERE r.id = '{RUN_ID}'
+   AND d.table_groups_id = r.table_groups_id
+   AND d.rollup_date = r.profiling_starttime::DATE;
+
+INSERT INTO dashboard_profiling_rollup
+      (rollup_date, connection_id, table_groups_id,
+       profiling_run_ct, scored_run_ct, dq_score_profiling_sum,
+       result_ct, record_ct_sum, null_value_ct_sum, distinct_value_ct_sum, refreshed_at)
+SELECT r.profiling_starttime::DATE,
+       r.connection_id,
+       r.table_groups_id,
+       COUNT(*),
+       COUNT(r.dq_score_profiling),
+       SUM(r.dq_score_profiling),
+       SUM(pr.result_ct),
+       SUM(pr.record_ct_sum),
+       SUM(pr.null_value_ct_sum),
+       SUM(pr.distinct_value_ct_sum),
+       NOW()
+  FROM profiling_runs this_run
+INNER JOIN profiling_runs r
+   ON (r.table_groups_id = this_run.table_groups_id
+  AND  r.profiling_starttime >= this_run.profiling_starttime::DATE
+  AND  r.profiling_starttime < this_run.profiling_starttime::DATE + 1)
+LEFT JOIN LATERAL (SELECT COUNT(*) AS result_ct,
+                          SUM(record_ct) AS record_ct_sum,
+                          SUM(null_value_ct) AS null_value_ct_sum,
+                          SUM(distinct_value_ct) AS distinct_value_ct_sum
+                     FROM profile_results
+                    WHERE profile_run_id = r.id) pr
+   ON (TRUE)
+ WHERE this_run.id = '{RUN_ID}'
+GROUP BY r.profiling_starttime::DATE, r.connection_id, r.table_groups_id;
+
+-- Tables and columns are counted once however many runs profiled them
+INSERT INTO dashboard_profiling_tables
+      (table_groups_id, table_name, connection_id, max_record_ct)
+SELECT table_groups_id, table_name, MAX(connection_id), MAX(record_ct)
+  FROM profile_results
+ WHERE profile_run_id = '{RUN_ID}'
+GROUP BY table_groups_id, table_name
+ON CONFLICT (table_groups_id, table_name) DO UPDATE
+   SET connection_id = EXCLUDED.connection_id,
+       max_record_ct = GREATEST(dashboard_profiling_tables.max_record_ct, EXCLUDED.max_record_ct);
+
+INSERT INTO dashboard_profiling_columns
+      (table_groups_id, column_name, connection_id)
+SELECT table_groups_id, column_name, MAX(connection_id)
+  FROM profile_results
+ WHERE profile_run_id = '{RUN_ID}'
+GROUP BY table_groups_id, column_name
+ON CONFLICT (table_groups_id, column_name) DO NOTHING;
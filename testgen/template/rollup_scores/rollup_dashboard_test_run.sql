@@ -0,0 +1,39 @@
+-- Refresh the dashboard rollup for the test run's day and test suite
+DELETE FROM dashboard_test_rollup d
+ USING test_runs r
+ WHERE r.id = '{RUN_ID}'
+   AND d.test_suite_id = r.test_suite_id
+   AND d.rollup_date = r.test_starttime::DATE;
+
+INSERT INTO dashboard_test_rollup
+      (rollup_date, connection_id, table_groups_id, test_suite_id,
+       test_run_ct, scored_run_ct, dq_score_test_run_sum,
+       test_ct, passed_ct, failed_ct, warning_ct, dq_record_ct_sum, refreshed_at)
+SELECT r.test_starttime::DATE,
+       s.connection_id,
+       s.table_groups_id,
+       r.test_suite_id,
+       COUNT(*),
+       COUNT(r.dq_score_test_run),
+       SUM(r.dq_score_test_run),
+       SUM(r.test_ct),
+       SUM(r.passed_ct),
+       SUM(r.failed_ct),
+       SUM(r.warning_ct),
+       SUM(tr.dq_record_ct_sum),
+       NOW()
+  FROM test_runs this_run
+INNER JOIN test_runs r
+   ON (r.test_suite_id = this_run.test_suite_id
+  AND  r.test_starttime >= this_run.test_starttime::DATE
+  AND  r.test_starttime < this_run.test_starttime::DATE + 1)
+INNER JOIN test_suites s
+   ON (r.test_suite_id = s.id)
+LEFT JOIN LATERAL (SELECT SUM(dq_record_ct) AS dq_record_ct_sum
+                     FROM test_results
+                    WHERE test_run_id = r.id) tr
+   ON (TRUE)
+ WHERE this_run.id = '{RUN_ID}'
+   AND s.connection_id IS NOT NULL
+   AND s.table_groups_id IS NOT NULL
+GROUP BY r.test_starttime::DATE, s.connection_id, s.table_groups_id, r.test_suite_id;
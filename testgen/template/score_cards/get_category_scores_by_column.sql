@@ -5,7 +5,7 @@ FROM (
     SELECT
         {category} AS category,
         SUM(COALESCE(good_data_pct * record_ct, 0)) / NULLIF(SUM(COALESCE(record_ct, 0)), 0) AS score
-    FROM v_dq_profile_scoring_latest_by_column
+    FROM dq_profile_scoring_latest_by_column
     WHERE NULLIF({category}, '') IS NOT NULL AND {filters}
     GROUP BY {category}
 )  AS profiling_category_scores
@@ -13,7 +13,7 @@ FULL OUTER JOIN (
     SELECT
         {category} AS category,
         SUM(COALESCE(good_data_pct * dq_record_ct, 0)) / NULLIF(SUM(COALESCE(dq_record_ct, 0)), 0) AS score
-    FROM v_dq_test_scoring_latest_by_column
+    FROM dq_test_scoring_latest_by_column
     WHERE NULLIF({category}, '') IS NOT NULL AND {filters}
     GROUP BY {category}
 ) AS test_category_scores
@@ -9,7 +9,7 @@ FROM (
         SUM(good_data_pct * record_ct) / NULLIF(SUM(record_ct), 0) AS score,
         SUM(CASE critical_data_element WHEN true THEN (good_data_pct * record_ct) ELSE 0 END)
             / NULLIF(SUM(CASE critical_data_element WHEN true THEN record_ct ELSE 0 END), 0) AS cde_score
-    FROM v_dq_profile_scoring_latest_by_column
+    FROM dq_profile_scoring_latest_by_column
     WHERE {filters}
     GROUP BY project_code
 )  AS profiling_scores
@@ -19,7 +19,7 @@ FULL OUTER JOIN (
         SUM(good_data_pct * dq_record_ct) / NULLIF(SUM(dq_record_ct), 0) AS score,
             SUM(CASE critical_data_element WHEN true THEN (good_data_pct * dq_record_ct) ELSE 0 END)
                 / NULLIF(SUM(CASE critical_data_element WHEN true THEN dq_record_ct ELSE 0 END), 0) AS cde_score
-    FROM v_dq_test_scoring_latest_by_column
+    FROM dq_test_scoring_latest_by_column
     WHERE {filters}
     GROUP BY project_code
 ) AS test_scores
@@ -6,7 +6,7 @@ profiling_records AS (
         SUM(issue_ct) AS issue_ct,
         SUM(record_ct) AS data_point_ct,
         SUM(record_ct * good_data_pct) / NULLIF(SUM(record_ct), 0) AS score
-    FROM v_dq_profile_scoring_latest_by_dimension
+    FROM dq_profile_scoring_latest_by_dimension
     WHERE NULLIF({group_by}, '') IS NOT NULL
         AND {filters}
     GROUP BY project_code, {columns}
@@ -18,7 +18,7 @@ test_records AS (
         SUM(issue_ct) AS issue_ct,
         SUM(dq_record_ct) AS data_point_ct,
         SUM(dq_record_ct * good_data_pct) / NULLIF(SUM(dq_record_ct), 0) AS score
-    FROM v_dq_test_scoring_latest_by_dimension
+    FROM dq_test_scoring_latest_by_dimension
     WHERE NULLIF({group_by}, '') IS NOT NULL
         AND {filters}
     GROUP BY project_code, {columns}
@@ -28,8 +28,8 @@ parent AS (
         COALESCE(profiling_records.project_code, test_records.project_code) AS project_code,
         SUM(COALESCE(profiling_records.record_ct, 0)) AS profiling_data_points,
         SUM(COALESCE(test_records.dq_record_ct, 0)) AS test_data_points
-    FROM v_dq_profile_scoring_latest_by_column AS profiling_records
-    FULL OUTER JOIN v_dq_test_scoring_latest_by_column AS test_records ON (
+    FROM dq_profile_scoring_latest_by_column AS profiling_records
+    FULL OUTER JOIN dq_test_scoring_latest_by_column AS test_records ON (
         test_records.project_code = profiling_records.project_code
         AND test_records.table_groups_id = profiling_records.table_groups_id
         AND test_records.table_name = profiling_records.table_name
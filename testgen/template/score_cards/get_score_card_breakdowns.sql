@@ -0,0 +1,182 @@
+WITH
+profiling_records AS (
+    SELECT
+        CASE GROUPING(table_groups_id, table_name, column_name, semantic_data_type)
+            WHEN 1 THEN 'column_name'
+            WHEN 3 THEN 'table_name'
+            WHEN 14 THEN 'semantic_data_type'
+        END AS category,
+        table_groups_id, table_name, column_name, semantic_data_type, NULL::VARCHAR AS dq_dimension,
+        COUNT(*) AS row_ct,
+        SUM(issue_ct) AS issue_ct,
+        SUM(record_ct) AS data_point_ct,
+        SUM(record_ct * good_data_pct) / NULLIF(SUM(record_ct), 0) AS score,
+        COUNT(*) FILTER (WHERE critical_data_element) AS cde_row_ct,
+        SUM(issue_ct) FILTER (WHERE critical_data_element) AS cde_issue_ct,
+        SUM(record_ct) FILTER (WHERE critical_data_element) AS cde_data_point_ct,
+        SUM(record_ct * good_data_pct) FILTER (WHERE critical_data_element)
+            / NULLIF(SUM(record_ct) FILTER (WHERE critical_data_element), 0) AS cde_score
+    FROM dq_profile_scoring_latest_by_column
+    WHERE {filters}
+    GROUP BY GROUPING SETS (
+        (table_groups_id, table_name, column_name),
+        (table_groups_id, table_name),
+        (semantic_data_type)
+    )
+    UNION ALL
+    SELECT
+        'dq_dimension' AS category,
+        NULL, NULL, NULL, NULL, dq_dimension,
+        COUNT(*),
+        SUM(issue_ct),
+        SUM(record_ct),
+        SUM(record_ct * good_data_pct) / NULLIF(SUM(record_ct), 0),
+        COUNT(*) FILTER (WHERE critical_data_element),
+        SUM(issue_ct) FILTER (WHERE critical_data_element),
+        SUM(record_ct) FILTER (WHERE critical_data_element),
+        SUM(record_ct * good_data_pct) FILTER (WHERE critical_data_element)
+            / NULLIF(SUM(record_ct) FILTER (WHERE critical_data_element), 0)
+    FROM dq_profile_scoring_latest_by_dimension
+    WHERE {filters}
+    GROUP BY dq_dimension
+),
+test_records AS (
+    SELECT
+        CASE GROUPING(table_groups_id, table_name, column_name, semantic_data_type)
+            WHEN 1 THEN 'column_name'
+            WHEN 3 THEN 'table_name'
+            WHEN 14 THEN 'semantic_data_type'
+        END AS category,
+        table_groups_id, table_name, column_name, semantic_data_type, NULL::VARCHAR AS dq_dimension,
+        COUNT(*) AS row_ct,
+        SUM(issue_ct) AS issue_ct,
+        SUM(dq_record_ct) AS data_point_ct,
+        SUM(dq_record_ct * good_data_pct) / NULLIF(SUM(dq_record_ct), 0) AS score,
+        COUNT(*) FILTER (WHERE critical_data_element) AS cde_row_ct,
+        SUM(issue_ct) FILTER (WHERE critical_data_element) AS cde_issue_ct,
+        SUM(dq_record_ct) FILTER (WHERE critical_data_element) AS cde_data_point_ct,
+        SUM(dq_record_ct * good_data_pct) FILTER (WHERE critical_data_element)
+            / NULLIF(SUM(dq_record_ct) FILTER (WHERE critical_data_element), 0) AS cde_score
+    FROM dq_test_scoring_latest_by_column
+    WHERE {filters}
+    GROUP BY GROUPING SETS (
+        (table_groups_id, table_name, column_name),
+        (table_groups_id, table_name),
+        (semantic_data_type)
+    )
+    UNION ALL
+    SELECT
+        'dq_dimension' AS category,
+        NULL, NULL, NULL, NULL, dq_dimension,
+        COUNT(*),
+        SUM(issue_ct),
+        SUM(dq_record_ct),
+        SUM(dq_record_ct * good_data_pct) / NULLIF(SUM(dq_record_ct), 0),
+        COUNT(*) FILTER (WHERE critical_data_element),
+        SUM(issue_ct) FILTER (WHERE critical_data_element),
+        SUM(dq_record_ct) FILTER (WHERE critical_data_element),
+        SUM(dq_record_ct * good_data_pct) FILTER (WHERE critical_data_element)
+            / NULLIF(SUM(dq_record_ct) FILTER (WHERE critical_data_element), 0)
+    FROM dq_test_scoring_latest_by_dimension
+    WHERE {filters}
+    GROUP BY dq_dimension
+),
+-- One row per score type; CDE scores only cover critical data elements
+profiling_scores AS (
+    SELECT
+        category, score_type,
+        CONCAT_WS(CHR(31), table_groups_id, table_name, column_name, semantic_data_type, dq_dimension) AS group_key,
+        table_groups_id, table_name, column_name, semantic_data_type, dq_dimension,
+        type_scores.issue_ct, type_scores.data_point_ct, type_scores.score
+    FROM profiling_records
+    CROSS JOIN LATERAL (
+        VALUES ('score', row_ct, issue_ct, data_point_ct, score),
+               ('cde_score', cde_row_ct, cde_issue_ct, cde_data_point_ct, cde_score)
+    ) AS type_scores (score_type, row_ct, issue_ct, data_point_ct, score)
+    WHERE type_scores.row_ct > 0
+        AND NULLIF(CASE category
+            WHEN 'column_name' THEN column_name
+            WHEN 'table_name' THEN table_name
+            WHEN 'semantic_data_type' THEN semantic_data_type
+            ELSE dq_dimension
+        END, '') IS NOT NULL
+),
+test_scores AS (
+    SELECT
+        category, score_type,
+        CONCAT_WS(CHR(31), table_groups_id, table_name, column_name, semantic_data_type, dq_dimension) AS group_key,
+        table_groups_id, table_name, column_name, semantic_data_type, dq_dimension,
+        type_scores.issue_ct, type_scores.data_point_ct, type_scores.score
+    FROM test_records
+    CROSS JOIN LATERAL (
+        VALUES ('score', row_ct, issue_ct, data_point_ct, score),
+               ('cde_score', cde_row_ct, cde_issue_ct, cde_data_point_ct, cde_score)
+    ) AS type_scores (score_type, row_ct, issue_ct, data_point_ct, score)
+    WHERE type_scores.row_ct > 0
+        AND NULLIF(CASE category
+            WHEN 'column_name' THEN column_name
+            WHEN 'table_name' THEN table_name
+            WHEN 'semantic_data_type' THEN semantic_data_type
+            ELSE dq_dimension
+        END, '') IS NOT NULL
+),
+parent AS (
+    SELECT
+        SUM(COALESCE(profiling_records.record_ct, 0)) AS profiling_data_points,
+        SUM(COALESCE(test_records.dq_record_ct, 0)) AS test_data_points,
+        SUM(COALESCE(profiling_records.record_ct, 0)) FILTER (WHERE {cde_records_count_filter}) AS cde_profiling_data_points,
+        SUM(COALESCE(test_records.dq_record_ct, 0)) FILTER (WHERE {cde_records_count_filter}) AS cde_test_data_points
+    FROM dq_profile_scoring_latest_by_column AS profiling_records
+    FULL OUTER JOIN dq_test_scoring_latest_by_column AS test_records ON (
+        test_records.project_code = profiling_records.project_code
+        AND test_records.table_groups_id = profiling_records.table_groups_id
+        AND test_records.table_name = profiling_records.table_name
+        AND test_records.column_name = profiling_records.column_name
+    )
+    WHERE {records_count_filters}
+    GROUP BY COALESCE(profiling_records.project_code, test_records.project_code)
+),
+scores AS (
+    SELECT
+        COALESCE(profiling_scores.category, test_scores.category) AS category,
+        COALESCE(profiling_scores.score_type, test_scores.score_type) AS score_type,
+        COALESCE(profiling_scores.table_groups_id, test_scores.table_groups_id) AS table_groups_id,
+        COALESCE(profiling_scores.table_name, test_scores.table_name) AS table_name,
+        COALESCE(profiling_scores.column_name, test_scores.column_name) AS column_name,
+        COALESCE(profiling_scores.semantic_data_type, test_scores.semantic_data_type) AS semantic_data_type,
+        COALESCE(profiling_scores.dq_dimension, test_scores.dq_dimension) AS dq_dimension,
+        100 * (
+            COALESCE(profiling_scores.data_point_ct * (1 - profiling_scores.score) / NULLIF(
+                CASE COALESCE(profiling_scores.score_type, test_scores.score_type)
+                    WHEN 'cde_score' THEN parent.cde_profiling_data_points
+                    ELSE parent.profiling_data_points
+                END, 0), 0)
+            + COALESCE(test_scores.data_point_ct * (1 - test_scores.score) / NULLIF(
+                CASE COALESCE(profiling_scores.score_type, test_scores.score_type)
+                    WHEN 'cde_score' THEN parent.cde_test_data_points
+                    ELSE parent.test_data_points
+                END, 0), 0)
+        ) AS impact,
+        (COALESCE(profiling_scores.score, 1) * COALESCE(test_scores.score, 1)) AS score,
+        (COALESCE(profiling_scores.issue_ct, 0) + COALESCE(test_scores.issue_ct, 0)) AS issue_ct
+    FROM profiling_scores
+    FULL OUTER JOIN test_scores ON (
+        test_scores.category = profiling_scores.category
+        AND test_scores.score_type = profiling_scores.score_type
+        AND test_scores.group_key = profiling_scores.group_key
+    )
+    CROSS JOIN parent
+),
+ranked_scores AS (
+    SELECT
+        scores.*,
+        ROW_NUMBER() OVER (PARTITION BY category, score_type ORDER BY impact DESC) AS impact_rank
+    FROM scores
+)
+SELECT
+    category, score_type,
+    table_groups_id, table_name, column_name, semantic_data_type, dq_dimension,
+    impact, score, issue_ct
+FROM ranked_scores
+WHERE impact_rank <= 100
+ORDER BY category, score_type, impact DESC
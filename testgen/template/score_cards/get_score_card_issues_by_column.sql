@@ -3,7 +3,7 @@ WITH score_profiling_runs AS (
         profile_run_id,
         table_name,
         column_name
-    FROM v_dq_profile_scoring_latest_by_column
+    FROM dq_profile_scoring_latest_by_column
     WHERE {filters} AND {group_by} = '{value}'
 ),
 anomalies AS (
@@ -35,7 +35,7 @@ score_test_runs AS (
     SELECT test_run_id,
         table_name,
         column_name
-    FROM v_dq_test_scoring_latest_by_column
+    FROM dq_test_scoring_latest_by_column
     WHERE {filters}
         AND {group_by} = '{value}'
 ),
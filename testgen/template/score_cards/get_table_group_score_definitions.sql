@@ -0,0 +1,91 @@
+-- Scorecards whose filters can include the table group: every filter on a table group or
+-- column attribute must accept one of the table group's values for it
+WITH table_group_values AS (
+    -- The table group's own attributes, which apply even when none of its columns were profiled
+    SELECT attribute_values.field, attribute_values.value
+    FROM table_groups tg
+    CROSS JOIN LATERAL (
+        VALUES ('table_groups_name', tg.table_groups_name),
+               ('data_location', tg.data_location),
+               ('data_source', tg.data_source),
+               ('source_system', tg.source_system),
+               ('source_process', tg.source_process),
+               ('business_domain', tg.business_domain),
+               ('stakeholder_group', tg.stakeholder_group),
+               ('transform_level', tg.transform_level),
+               ('data_product', tg.data_product)
+    ) AS attribute_values (field, value)
+    WHERE tg.id = '{table_group_id}'
+        AND attribute_values.value IS NOT NULL
+    UNION
+    -- Profiled columns
+    SELECT attribute_values.field, attribute_values.value
+    FROM data_column_chars dcc
+    INNER JOIN table_groups tg
+       ON (dcc.table_groups_id = tg.id)
+    INNER JOIN data_table_chars dtc
+       ON (dcc.table_id = dtc.table_id)
+    CROSS JOIN LATERAL (
+        VALUES ('data_source', COALESCE(dcc.data_source, dtc.data_source, tg.data_source)),
+               ('source_system', COALESCE(dcc.source_system, dtc.source_system, tg.source_system)),
+               ('source_process', COALESCE(dcc.source_process, dtc.source_process, tg.source_process)),
+               ('business_domain', COALESCE(dcc.business_domain, dtc.business_domain, tg.business_domain)),
+               ('stakeholder_group', COALESCE(dcc.stakeholder_group, dtc.stakeholder_group, tg.stakeholder_group)),
+               ('transform_level', COALESCE(dcc.transform_level, dtc.transform_level, tg.transform_level)),
+               ('data_product', COALESCE(dcc.data_product, dtc.data_product, tg.data_product)),
+               ('table_name', dtc.table_name),
+               ('column_name', dcc.column_name),
+               ('semantic_data_type', dcc.functional_data_type)
+    ) AS attribute_values (field, value)
+    WHERE tg.id = '{table_group_id}'
+        AND dcc.drop_date IS NULL
+        AND attribute_values.value IS NOT NULL
+    UNION
+    -- Tested columns, joined to their characteristics as in v_dq_test_scoring_latest_by_column,
+    -- since tests can cover tables and columns that weren't profiled
+    SELECT attribute_values.field, attribute_values.value
+    FROM test_results r
+    INNER JOIN test_suites s
+       ON (r.test_run_id = s.last_complete_test_run_id)
+    INNER JOIN table_groups tg
+       ON (r.table_groups_id = tg.id)
+    LEFT JOIN data_table_chars dtc
+       ON (r.table_groups_id = dtc.table_groups_id
+       AND r.table_name = dtc.table_name)
+    LEFT JOIN data_column_chars dcc
+       ON (r.table_groups_id = dcc.table_groups_id
+       AND r.table_name = dcc.table_name
+       AND r.column_names = dcc.column_name)
+    CROSS JOIN LATERAL (
+        VALUES ('data_source', COALESCE(dcc.data_source, dtc.data_source, tg.data_source)),
+               ('source_system', COALESCE(dcc.source_system, dtc.source_system, tg.source_system)),
+               ('source_process', COALESCE(dcc.source_process, dtc.source_process, tg.source_process)),
+               ('business_domain', COALESCE(dcc.business_domain, dtc.business_domain, tg.business_domain)),
+               ('stakeholder_group', COALESCE(dcc.stakeholder_group, dtc.stakeholder_group, tg.stakeholder_group)),
+               ('transform_level', COALESCE(dcc.transform_level, dtc.transform_level, tg.transform_level)),
+               ('data_product', COALESCE(dcc.data_product, dtc.data_product, tg.data_product)),
+               ('table_name', r.table_name),
+               ('column_name', r.column_names),
+               ('semantic_data_type', dcc.functional_data_type)
+    ) AS attribute_values (field, value)
+    WHERE tg.id = '{table_group_id}'
+        AND dcc.drop_date IS NULL
+        AND attribute_values.value IS NOT NULL
+),
+unmatched_filters AS (
+    SELECT f.definition_id
+    FROM score_definition_filters f
+    LEFT JOIN table_group_values v
+       ON (v.field = f.field AND v.value = f.value)
+    WHERE f.field IN (
+        'table_groups_name', 'data_location', 'data_source', 'source_system', 'source_process', 'business_domain',
+        'stakeholder_group', 'transform_level', 'data_product', 'table_name', 'column_name', 'semantic_data_type'
+    )
+    GROUP BY f.definition_id, f.field
+    HAVING COUNT(v.field) = 0
+)
+SELECT d.id
+  FROM score_definitions d
+ WHERE d.project_code = '{project_code}'
+   AND EXISTS (SELECT 1 FROM score_definition_filters f WHERE f.definition_id = d.id)
+   AND NOT EXISTS (SELECT 1 FROM unmatched_filters u WHERE u.definition_id = d.id);
@@ -131,13 +131,13 @@ def get_score_category_values(project_code: str) -> dict[ScoreCategory, list[str
         SELECT DISTINCT
             UNNEST(array[{', '.join([quote(c) for c in categories])}]) as category,
             UNNEST(array[{', '.join(categories)}]) AS value
-        FROM v_dq_test_scoring_latest_by_column
+        FROM dq_test_scoring_latest_by_column
         WHERE project_code = '{project_code}'
         UNION
         SELECT DISTINCT
             UNNEST(array[{', '.join([quote(c) for c in categories])}]) as category,
             UNNEST(array[{', '.join(categories)}]) AS value
-        FROM v_dq_profile_scoring_latest_by_column
+        FROM dq_profile_scoring_latest_by_column
         WHERE project_code = '{project_code}'
         ORDER BY value
     """
@@ -206,6 +206,13 @@ AND tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.profile_anomaly_results par USING {schema}.table_groups tg where tg.id = par.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.profile_results pr USING {schema}.table_groups tg where tg.id = pr.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.profiling_runs pr USING {schema}.table_groups tg where tg.id = pr.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dashboard_profiling_rollup d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dashboard_profiling_tables d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dashboard_profiling_columns d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dq_profile_scoring_latest_by_column d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dq_profile_scoring_latest_by_dimension d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dq_test_scoring_latest_by_column d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
+delete from {schema}.dq_test_scoring_latest_by_dimension d USING {schema}.table_groups tg where tg.id = d.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.data_table_chars dtc USING {schema}.table_groups tg where tg.id = dtc.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.data_column_chars dcs USING {schema}.table_groups tg where tg.id = dcs.table_groups_id and tg.table_groups_name in ({",".join(table_group_items)});
 delete from {schema}.table_groups where table_groups_name in ({",".join(table_group_items)});"""
@@ -23,6 +23,9 @@ def cascade_delete(test_suite_ids: list[str]) -> None:
             WHERE test_run_id in (select id from {schema}.test_runs where test_suite_id in ({ids_str}));
         DELETE FROM {schema}.test_runs WHERE test_suite_id in ({ids_str});
         DELETE FROM {schema}.test_results WHERE test_suite_id in ({ids_str});
+        DELETE FROM {schema}.dashboard_test_rollup WHERE test_suite_id in ({ids_str});
+        DELETE FROM {schema}.dq_test_scoring_latest_by_column WHERE test_suite_id in ({ids_str});
+        DELETE FROM {schema}.dq_test_scoring_latest_by_dimension WHERE test_suite_id in ({ids_str});
     """
     db.execute_sql(sql)
     st.cache_data.clear()
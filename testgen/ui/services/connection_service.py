@@ -49,7 +49,7 @@ def encrypt_credentials(connection):
 
 
 def edit_connection(connection):
-    empty_cache()
+    empty_cache(connection["connection_id"])
     schema = st.session_state["dbschema"]
     connection = pre_save_connection_process(connection)
     encrypted_password, encrypted_private_key, encrypted_private_key_passphrase = encrypt_credentials(connection)
@@ -57,7 +57,6 @@ def edit_connection(connection):
 
 
 def add_connection(connection) -> int:
-    empty_cache()
     schema = st.session_state["dbschema"]
     connection = pre_save_connection_process(connection)
     encrypted_password, encrypted_private_key, encrypted_private_key_passphrase = encrypt_credentials(connection)
@@ -90,7 +89,8 @@ def pre_save_connection_process(connection):
 
 
 def delete_connections(connection_ids):
-    empty_cache()
+    for connection_id in connection_ids:
+        empty_cache(connection_id)
     schema = st.session_state["dbschema"]
     return connection_queries.delete_connections(schema, connection_ids)
 
@@ -125,8 +125,9 @@ def get_table_group_names_by_connection(connection_ids):
 
 def init_profiling_sql(project_code, connection, table_group_schema=None):
     # get connection data
-    empty_cache()
     connection_id = str(connection["connection_id"]) if connection["connection_id"] else None
+    if connection_id:
+        empty_cache(connection_id)
     sql_flavor = connection["sql_flavor"]
     url = connection["url"]
     connect_by_url = connection["connect_by_url"]
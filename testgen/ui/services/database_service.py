@@ -1,9 +1,16 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from urllib.parse import quote_plus
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.cursor import CursorResult
 
+from testgen import settings
 from testgen.common.credentials import (
     get_tg_db,
     get_tg_host,
@@ -19,12 +26,31 @@ from testgen.common.encrypt import DecryptText
  Shared database access and utility functions
 """
 
+LOG = logging.getLogger("testgen")
+
+# One engine per process: its pool is shared by every page and session
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+# Engines to databases under testing, by credential fingerprint, with the time they were last used
+_target_db_engines: OrderedDict[str, tuple[Engine, float]] = OrderedDict()
+_target_db_engines_lock = threading.Lock()
+
 
 def get_schema():
     return get_tg_schema()
 
 
-def _start_engine():
+def _start_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+    return _engine
+
+
+def _create_engine() -> Engine:
     # TestGen database
     dbhost = get_tg_host()
     dbport = get_tg_port()
@@ -34,7 +60,36 @@ def _start_engine():
     dbpw = get_tg_password()
 
     conn_str = "postgresql://" + dbuser + ":" + quote_plus(dbpw) + "@" + dbhost + ":" + dbport + "/" + dbname
-    return create_engine(conn_str)
+    engine = create_engine(
+        conn_str,
+        pool_size=settings.APP_DB_POOL_SIZE,
+        max_overflow=settings.APP_DB_POOL_MAX_OVERFLOW,
+        pool_recycle=settings.APP_DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    event.listen(engine, "before_cursor_execute", _start_statement_timer)
+    event.listen(engine, "after_cursor_execute", _log_statement_time)
+    event.listen(engine, "handle_error", _discard_statement_timer)
+    return engine
+
+
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):  # NOQA ARG001
+    conn.info.setdefault("statement_start_times", []).append(time.perf_counter())
+
+
+def _log_statement_time(conn, cursor, statement, parameters, context, executemany):  # NOQA ARG001
+    elapsed = time.perf_counter() - conn.info["statement_start_times"].pop()
+    if elapsed >= settings.APP_DB_SLOW_QUERY_SECONDS:
+        LOG.warning(f"Slow query ({elapsed:.3f} s): {statement[:500]}")
+    elif LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug(f"Query ({elapsed:.3f} s): {statement[:200]}")
+
+
+def _discard_statement_timer(exception_context):
+    # A statement that raises never reaches after_cursor_execute, so its start time is dropped here
+    conn = exception_context.connection
+    if conn is not None and exception_context.statement is not None and conn.info.get("statement_start_times"):
+        conn.info["statement_start_times"].pop()
 
 
 def _make_connection():
@@ -86,9 +141,13 @@ def execute_sql_raw(str_sql):
     if str_sql > "":
         tg_engine = _start_engine()
         con = tg_engine.raw_connection()
-        with con.cursor() as cur:
-            cur.execute(str_sql)
-        con.commit()
+        try:
+            with con.cursor() as cur:
+                cur.execute(str_sql)
+            con.commit()
+        finally:
+            # Returns the connection to the pool
+            con.close()
 
 
 def _get_df_edits(df_original: pd.DataFrame, df_edited: pd.DataFrame, lst_id_columns: list) -> tuple:
@@ -265,20 +324,64 @@ def _start_target_db_engine(flavor, host, port, db_name, user, password, url, co
     connection_string = flavor_service.get_connection_string(password)
     connect_args = {"connect_timeout": 3600}
     connect_args.update(flavor_service.get_connect_args())
-    return create_engine(connection_string, connect_args=connect_args)
+    return create_engine(
+        connection_string,
+        connect_args=connect_args,
+        pool_size=settings.UI_TARGET_DB_POOL_SIZE,
+        max_overflow=0,
+        pool_pre_ping=settings.TARGET_DB_POOL_PRE_PING,
+        pool_recycle=settings.TARGET_DB_POOL_RECYCLE,
+    )
 
 
-def retrieve_target_db_data(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path, sql_query, decrypt=False):
-    if decrypt:
+def _get_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path, decrypt):
+    # The fingerprint covers the stored credentials, so editing a connection starts a new engine
+    fingerprint = hashlib.sha256(
+        repr((flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path)).encode()
+    ).hexdigest()
+
+    now = time.monotonic()
+    idle_engines = []
+    with _target_db_engines_lock:
+        for key, (engine, last_used) in list(_target_db_engines.items()):
+            if now - last_used > settings.UI_TARGET_DB_ENGINE_IDLE_SECONDS:
+                idle_engines.append(_target_db_engines.pop(key)[0])
+        entry = _target_db_engines.get(fingerprint)
+        if entry:
+            _target_db_engines[fingerprint] = (entry[0], now)
+            _target_db_engines.move_to_end(fingerprint)
+    for engine in idle_engines:
+        engine.dispose()
+    if entry:
+        return entry[0]
+
+    # Decrypting and parsing keys only happens when the engine is created
+    if decrypt and password:
         password = DecryptText(password)
-    db_engine = _start_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path)
+    engine = _start_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path)
+
+    evicted_engines = []
+    with _target_db_engines_lock:
+        if fingerprint in _target_db_engines:
+            # Created concurrently by another session
+            evicted_engines.append(engine)
+            engine = _target_db_engines[fingerprint][0]
+        _target_db_engines[fingerprint] = (engine, now)
+        _target_db_engines.move_to_end(fingerprint)
+        while len(_target_db_engines) > settings.UI_TARGET_DB_MAX_ENGINES:
+            evicted_engines.append(_target_db_engines.popitem(last=False)[1][0])
+    for evicted_engine in evicted_engines:
+        evicted_engine.dispose()
+    return engine
+
+
+def retrieve_target_db_data(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path, sql_query, decrypt=False):
+    db_engine = _get_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path, decrypt)
     with db_engine.connect() as connection:
         query_result = connection.execute(text(sql_query))
         return query_result.fetchall()
 
 
 def retrieve_target_db_df(flavor, host, port, db_name, user, password, sql_query, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path):
-    if password:
-        password = DecryptText(password)
-    db_engine = _start_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path)
+    db_engine = _get_target_db_engine(flavor, host, port, db_name, user, password, url, connect_by_url, connect_by_key, private_key, private_key_passphrase, http_path, decrypt=True)
     return pd.read_sql_query(text(sql_query), db_engine)
@@ -198,6 +198,15 @@ def update_anomaly_disposition(selected, str_schema, str_new_status):
         else:
             lst_updates.append(finalize_small_update(str_new_status, str_ids))
 
+        # Marks the table groups' anomaly results as changed, for API response caching
+        lst_updates.append(
+            f"""UPDATE {str_schema}.table_groups
+                   SET last_disposition_update = CURRENT_TIMESTAMP AT TIME ZONE 'UTC'
+                 WHERE id IN (SELECT table_groups_id
+                                FROM {str_schema}.profile_anomaly_results
+                               WHERE id IN ({str_ids}));"""
+        )
+
         for q in lst_updates:
             db.execute_sql_raw(q)
 
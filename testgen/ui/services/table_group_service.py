@@ -3,6 +3,7 @@ import streamlit as st
 import testgen.ui.queries.table_group_queries as table_group_queries
 import testgen.ui.services.connection_service as connection_service
 import testgen.ui.services.test_suite_service as test_suite_service
+from testgen.commands.run_rollup_scores import run_refresh_scoring_tables
 from testgen.common.database.database_service import RetrieveDBResultsToDictList
 from testgen.common.models.scores import ScoreDefinition
 
@@ -20,6 +21,7 @@ def get_by_connection(project_code, connection_id):
 def edit(table_group):
     schema = st.session_state["dbschema"]
     table_group_queries.edit(schema, table_group)
+    run_refresh_scoring_tables(table_group["id"])
 
 
 def add(table_group: dict) -> str:
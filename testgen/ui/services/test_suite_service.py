@@ -2,6 +2,7 @@ import pandas as pd
 import streamlit as st
 
 import testgen.ui.queries.test_suite_queries as test_suite_queries
+from testgen.commands.run_rollup_scores import run_refresh_scoring_tables
 import testgen.ui.services.test_definition_service as test_definition_service
 
 
@@ -22,6 +23,7 @@ def get_by_id(test_suite_id: str) -> pd.Series:
 def edit(test_suite):
     schema = st.session_state["dbschema"]
     test_suite_queries.edit(schema, test_suite)
+    run_refresh_scoring_tables(test_suite["table_groups_id"])
 
 
 def add(test_suite):
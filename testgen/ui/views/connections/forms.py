@@ -70,13 +70,13 @@ class BaseConnectionForm(BaseForm, ManualRender):
     max_threads: int = Field(
         default=4,
         ge=1,
-        le=8,
+        le=64,
         st_kwargs_min_value=1,
-        st_kwargs_max_value=8,
+        st_kwargs_max_value=64,
         st_kwargs_label="Max Threads (Advanced Tuning)",
         st_kwargs_help=(
-            "Maximum number of concurrent threads that run tests. Default values should be retained unless "
-            "test queries are failing."
+            "Maximum number of concurrent threads that run tests. Concurrency is ramped up to this limit while "
+            "the database keeps up, and backed off on slow or throttled queries."
         ),
     )
     max_query_chars: int = Field(
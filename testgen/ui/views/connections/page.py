@@ -495,7 +495,8 @@ class ConnectionsPage:
                 successful=False,
             )
 
-        empty_cache()
+        if connection["connection_id"]:
+            empty_cache(connection["connection_id"])
         try:
             sql_query = "select 1;"
             results = db.retrieve_target_db_data(
@@ -10,6 +10,7 @@ from streamlit.delta_generator import DeltaGenerator
 
 import testgen.ui.services.database_service as db
 import testgen.ui.services.query_service as dq
+from testgen.commands.run_rollup_scores import run_refresh_scoring_tables
 from testgen.ui.components import widgets as testgen
 from testgen.ui.components.widgets import testgen_component
 from testgen.ui.navigation.menu import MenuItem
@@ -103,11 +104,11 @@ class DataCatalogPage(Page):
                         item.get("column_name"),
                     ),
                 },
-                event_handlers={ "TagsChanged": partial(on_tags_changed, loading_column) },
+                event_handlers={ "TagsChanged": partial(on_tags_changed, loading_column, table_group_id) },
             )
 
 
-def on_tags_changed(spinner_container: DeltaGenerator, payload: dict) -> None:
+def on_tags_changed(spinner_container: DeltaGenerator, table_group_id: str, payload: dict) -> None:
     attributes = ["description"]
     attributes.extend(TAG_FIELDS)
     cde_value_map = {
@@ -145,6 +146,8 @@ def on_tags_changed(spinner_container: DeltaGenerator, payload: dict) -> None:
                 WHERE column_id IN ({", ".join([ f"'{item}'" for item in columns ])});
                 """)
 
+            run_refresh_scoring_tables(table_group_id)
+
     for func in [ get_table_group_columns, get_table_by_id, get_column_by_id, get_tag_values ]:
         func.clear()
     st.session_state["data_catalog:last_saved_timestamp"] = datetime.now().timestamp()
@@ -0,0 +1,127 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from testgen import settings
+from testgen.commands import run_observability_exporter
+
+
+class ObservabilityStub(ThreadingHTTPServer):
+    """
+    Stand-in for the Observability events API: records every accepted body and
+    answers the first `failures` requests with 503
+    """
+
+    def __init__(self, failures=0, delay=0):
+        super().__init__(("127.0.0.1", 0), ObservabilityHandler)
+        self.failures = failures
+        self.delay = delay
+        self.bodies = []
+        self.attempts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class ObservabilityHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        with server.lock:
+            server.attempts += 1
+            failed = server.attempts <= server.failures
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+            if not failed:
+                server.bodies.append(json.loads(body))
+
+        self.send_response(503 if failed else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def observability_stub(request):
+    server = ObservabilityStub(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_chunks(qty_of_chunks, chunk_size=3):
+    return [
+        (
+            [json.dumps({"id": i * chunk_size + j}).encode() for j in range(chunk_size)],
+            list(range(i * chunk_size, (i + 1) * chunk_size)),
+        )
+        for i in range(qty_of_chunks)
+    ]
+
+
+def post_chunks(server, chunks, on_chunk_posted=None):
+    return run_observability_exporter.post_chunks(
+        "test-outcomes", {"component": {}}, server.api_url, "key", chunks, on_chunk_posted
+    )
+
+
+@pytest.mark.parametrize("gzip_enabled", [False, True])
+def test_post_chunks_compression(monkeypatch, observability_stub, gzip_enabled):
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_GZIP", gzip_enabled)
+
+    assert post_chunks(observability_stub, make_chunks(2)) == 6
+    outcomes = sorted(outcome["id"] for body in observability_stub.bodies for outcome in body["test_outcomes"])
+    assert outcomes == list(range(6))
+
+
+@pytest.mark.parametrize("observability_stub", [{"delay": 0.2}], indirect=True)
+def test_post_chunks_concurrently(monkeypatch, observability_stub):
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", 4)
+    posted = []
+
+    assert post_chunks(observability_stub, make_chunks(8), posted.extend) == 24
+    assert len(observability_stub.bodies) == 8
+    assert 1 < observability_stub.max_in_flight <= 4
+    assert sorted(posted) == list(range(24))
+
+
+@pytest.mark.parametrize("observability_stub", [{"failures": 2}], indirect=True)
+def test_post_chunks_retries(monkeypatch, observability_stub):
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", 1)
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_RETRIES", 2)
+    monkeypatch.setattr(run_observability_exporter, "RETRY_BACKOFF_SECONDS", 0)
+
+    assert post_chunks(observability_stub, make_chunks(1)) == 3
+    assert observability_stub.attempts == 3
+
+
+@pytest.mark.parametrize("observability_stub", [{"failures": 5}], indirect=True)
+def test_post_chunks_gives_up_after_retries(monkeypatch, observability_stub):
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", 1)
+    monkeypatch.setattr(settings, "OBSERVABILITY_EXPORT_RETRIES", 1)
+    monkeypatch.setattr(run_observability_exporter, "RETRY_BACKOFF_SECONDS", 0)
+    posted = []
+
+    with pytest.raises(requests.HTTPError):
+        post_chunks(observability_stub, make_chunks(1), posted.extend)
+    assert observability_stub.attempts == 2
+    assert posted == []